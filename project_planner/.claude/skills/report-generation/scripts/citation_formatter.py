@@ -314,7 +314,8 @@ class IEEECitationFormatter:
             "with_author": sum(1 for c in self.citations if c.get("author")),
             "with_doi": sum(1 for c in self.citations if c.get("doi")),
             "with_date": sum(1 for c in self.citations if c.get("date")),
-            "sources": list(set(
+            # dict.fromkeys dedupes while keeping first-seen order
+            "sources": list(dict.fromkeys(
                 self._extract_source_name(c.get("url", ""))
                 for c in self.citations if c.get("url")
             )),
@@ -8,10 +8,18 @@ from typing import Optional, List, Dict, Any, AsyncGenerator, Union, Literal
 from datetime import datetime
 from dotenv import load_dotenv
 
-from claude_agent_sdk import query as claude_query, ClaudeAgentOptions
+from claude_agent_sdk import (
+    query as claude_query,
+    ClaudeAgentOptions,
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+)
 from claude_agent_sdk.types import HookMatcher
 
 from .core import (
+    ALLOWED_TOOLS,
     get_api_key,
     load_system_instructions,
     ensure_output_folder,
@@ -22,7 +30,7 @@ from .core import (
     create_completion_check_stop_hook,
 )
 from .models import ProgressUpdate, TextUpdate, ProjectResult, ProjectMetadata, ProjectFiles, TokenUsage
-from .utils import scan_project_directory
+from .utils import scan_project_directory, prefetch
 
 
 # Model mapping for effort levels
@@ -58,6 +66,7 @@ async def generate_project(
     cwd: Optional[str] = None,
     track_token_usage: bool = False,
     auto_continue: bool = True,
+    stream_text: bool = True,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Generate a comprehensive project plan asynchronously with progress updates.
@@ -86,8 +95,12 @@ async def generate_project(
         cwd: Optional working directory (defaults to current directory)
         track_token_usage: If True, track and return token usage in the final result
         auto_continue: If True (default), the agent will not stop on its own
+        stream_text: If True (default), yield a text update for every text block.
+            Headless callers that only need progress and the final result can
+            pass False to skip building one update per streamed fragment.
 
     Yields:
+        Text updates (dict with type="text") as the agent writes, if stream_text
         Progress updates (dict with type="progress") during execution
         Final result (dict with type="result") containing all project information
 
@@ -184,22 +197,10 @@ Create the following folder structure for project outputs:
         auto_continue = False
 
     # Configure Claude agent options with optimized tool loading for prompt caching
-    # Restricting to essential tools reduces cache size by 30-40% → faster responses
     options = ClaudeAgentOptions(
         system_prompt=system_instructions,
         model=model,
-        allowed_tools=[
-            # Core file operations
-            "Read", "Write", "Edit", "Bash", "Glob", "Grep",
-            # Research & analysis
-            "research-lookup", "WebSearch",
-            # Planning-specific skills (auto-discovered from .claude/skills/)
-            "architecture-research", "building-blocks", "sprint-planning",
-            "service-cost-analysis", "risk-assessment", "competitive-analysis",
-            "feasibility-analysis", "plan-review", "project-diagrams",
-            # Document generation
-            "docx", "markitdown",
-        ],
+        allowed_tools=list(ALLOWED_TOOLS),
         permission_mode="bypassPermissions",
         setting_sources=["project"],
         cwd=str(work_dir),
@@ -219,7 +220,8 @@ Create the following folder structure for project outputs:
     output_directory = None
     last_message = ""
     tool_call_count = 0
-    files_written = []
+    # Insertion-ordered set: rewriting a file doesn't count it twice
+    files_written: Dict[str, None] = {}
 
     # Token usage tracking
     total_input_tokens = 0
@@ -235,43 +237,52 @@ Create the following folder structure for project outputs:
 
     # Execute query
     try:
-        accumulated_text = ""
-        async for message in claude_query(prompt=query, options=options):
+        # Lowercased once per fragment as it arrives, so stage detection never
+        # re-lowercases the whole transcript
+        accumulated_lower = ""
+        # Receive on a background task so the SDK stream keeps flowing while
+        # blocks are parsed and the caller handles the updates we yield
+        async for message in prefetch(claude_query(prompt=query, options=options)):
             # Track token usage
-            if track_token_usage and hasattr(message, "usage") and message.usage:
+            if track_token_usage and isinstance(message, ResultMessage) and message.usage:
                 usage = message.usage
-                total_input_tokens += getattr(usage, "input_tokens", 0)
-                total_output_tokens += getattr(usage, "output_tokens", 0)
-                total_cache_creation_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
+                total_input_tokens += usage.get("input_tokens", 0)
+                total_output_tokens += usage.get("output_tokens", 0)
+                total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
+                total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
 
-            if hasattr(message, "content") and message.content:
+            if isinstance(message, AssistantMessage):
                 for block in message.content:
+                    # Content blocks are sibling concrete classes, so an identity
+                    # check on the exact type is enough to route them
+                    block_type = type(block)
+
                     # Handle text blocks
-                    if hasattr(block, "text"):
+                    if block_type is TextBlock:
                         text = block.text
-                        accumulated_text += text
+                        accumulated_lower += text.lower()
 
                         # Yield live text update
-                        yield TextUpdate(content=text).to_dict()
+                        if stream_text:
+                            yield TextUpdate(content=text).to_dict()
 
                         # Analyze for progress
-                        stage, msg = _analyze_progress(accumulated_text, current_stage)
+                        stage, msg = _analyze_progress(accumulated_lower, current_stage)
                         if stage != current_stage and msg and msg != last_message:
                             current_stage = stage
                             last_message = msg
                             yield ProgressUpdate(message=msg, stage=stage).to_dict()
 
                     # Handle tool use blocks
-                    elif hasattr(block, "type") and block.type == "tool_use":
+                    elif block_type is ToolUseBlock:
                         tool_call_count += 1
-                        tool_name = getattr(block, "name", "unknown")
-                        tool_input = getattr(block, "input", {})
+                        tool_name = block.name
+                        tool_input = block.input or {}
 
                         if tool_name.lower() == "write":
                             file_path = tool_input.get("file_path", tool_input.get("path", ""))
                             if file_path:
-                                files_written.append(file_path)
+                                files_written[file_path] = None
 
                         tool_progress = _analyze_tool_use(tool_name, tool_input, current_stage)
                         if tool_progress:
@@ -402,10 +413,8 @@ def _get_project_type_instructions(project_type: str) -> str:
     return instructions.get(project_type, instructions["full"])
 
 
-def _analyze_progress(text: str, current_stage: str) -> tuple:
-    """Analyze text for progress stage transitions."""
-    text_lower = text.lower()
-
+def _analyze_progress(text_lower: str, current_stage: str) -> tuple:
+    """Analyze text for progress stage transitions (text must already be lowercased)."""
     stage_order = PROGRESS_STAGES
     current_idx = stage_order.index(current_stage) if current_stage in stage_order else 0
 
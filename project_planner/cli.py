@@ -12,10 +12,11 @@ from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
-from claude_agent_sdk import query, ClaudeAgentOptions
+from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage, TextBlock
 from claude_agent_sdk.types import HookMatcher
 
 from .core import (
+    ALLOWED_TOOLS,
     get_api_key,
     load_system_instructions,
     ensure_output_folder,
@@ -95,22 +96,10 @@ PROJECT OUTPUT STRUCTURE:
     auto_continue = os.environ.get("PROJECT_PLANNER_AUTO_CONTINUE", "true").lower() in ("true", "1", "yes")
 
     # Configure agent options with optimized tool loading for prompt caching
-    # Restricting to essential tools reduces cache size by 30-40% → faster responses
     options = ClaudeAgentOptions(
         system_prompt=system_instructions,
         model="claude-sonnet-4-6",
-        allowed_tools=[
-            # Core file operations
-            "Read", "Write", "Edit", "Bash", "Glob", "Grep",
-            # Research & analysis
-            "research-lookup", "WebSearch",
-            # Planning-specific skills (auto-discovered from .claude/skills/)
-            "architecture-research", "building-blocks", "sprint-planning",
-            "service-cost-analysis", "risk-assessment", "competitive-analysis",
-            "feasibility-analysis", "plan-review", "project-diagrams",
-            # Document generation
-            "docx", "markitdown",
-        ],
+        allowed_tools=list(ALLOWED_TOOLS),
         permission_mode="bypassPermissions",
         setting_sources=["project"],
         cwd=str(cwd),
@@ -267,17 +256,14 @@ IMPORTANT:
 Based on the user request: {user_input}"""
 
                 async for message in query(prompt=directory_prompt, options=options):
-                    if track_token_usage and hasattr(message, "usage") and message.usage:
+                    if track_token_usage and isinstance(message, ResultMessage) and message.usage:
                         usage = message.usage
-                        total_input_tokens += getattr(usage, "input_tokens", 0)
-                        total_output_tokens += getattr(usage, "output_tokens", 0)
-                        total_cache_creation_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                        total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
+                        total_input_tokens += usage.get("input_tokens", 0)
+                        total_output_tokens += usage.get("output_tokens", 0)
+                        total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
+                        total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
 
-                    if hasattr(message, "content") and message.content:
-                        for block in message.content:
-                            if hasattr(block, "text"):
-                                print(block.text, end="", flush=True)
+                    _write_message_text(message)
 
                 print("\n")
 
@@ -398,17 +384,14 @@ User request: {user_input}"""
             # Send query
             print()
             async for message in query(prompt=contextual_prompt, options=options):
-                if track_token_usage and hasattr(message, "usage") and message.usage:
+                if track_token_usage and isinstance(message, ResultMessage) and message.usage:
                     usage = message.usage
-                    total_input_tokens += getattr(usage, "input_tokens", 0)
-                    total_output_tokens += getattr(usage, "output_tokens", 0)
-                    total_cache_creation_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                    total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
+                    total_input_tokens += usage.get("input_tokens", 0)
+                    total_output_tokens += usage.get("output_tokens", 0)
+                    total_cache_creation_tokens += usage.get("cache_creation_input_tokens", 0)
+                    total_cache_read_tokens += usage.get("cache_read_input_tokens", 0)
 
-                if hasattr(message, "content") and message.content:
-                    for block in message.content:
-                        if hasattr(block, "text"):
-                            print(block.text, end="", flush=True)
+                _write_message_text(message)
 
             print()
 
@@ -444,6 +427,25 @@ User request: {user_input}"""
     return None
 
 
+def _write_message_text(message) -> None:
+    """
+    Echo the text blocks of one streamed message to stdout.
+
+    All blocks of the message are joined into a single write and flushed once,
+    rather than a flushed print() per fragment.
+
+    Args:
+        message: Message yielded by the Claude Agent SDK query stream
+    """
+    if not isinstance(message, AssistantMessage):
+        return
+
+    text = "".join(block.text for block in message.content if type(block) is TextBlock)
+    if text:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
 def _print_help():
     """Print help information."""
     print("\n" + "=" * 70)
@@ -11,6 +11,24 @@ from claude_agent_sdk.types import StopHookInput, HookContext
 # Load environment variables from .env file if it exists
 load_dotenv()
 
+# Tools exposed to the planning agent by both the CLI and the async API.
+# Restricting to essential tools keeps the tool definitions small, and the
+# API caches the prompt prefix they form. Keep this a single shared constant
+# and treat the order as part of the cache key: reordering or per-call edits
+# produce a different prefix and force a cache miss.
+ALLOWED_TOOLS = (
+    # Core file operations
+    "Read", "Write", "Edit", "Bash", "Glob", "Grep",
+    # Research & analysis
+    "research-lookup", "WebSearch",
+    # Planning-specific skills (auto-discovered from .claude/skills/)
+    "architecture-research", "building-blocks", "sprint-planning",
+    "service-cost-analysis", "risk-assessment", "competitive-analysis",
+    "feasibility-analysis", "plan-review", "project-diagrams",
+    # Document generation
+    "docx", "markitdown",
+)
+
 
 def setup_claude_skills(package_dir: Path, work_dir: Path) -> None:
     """
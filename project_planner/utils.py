@@ -1,9 +1,16 @@
 """Utility functions for project planner."""
 
+import asyncio
+from contextlib import suppress
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, AsyncGenerator, TypeVar
 import re
 
+T = TypeVar("T")
+
+# Messages read ahead of a slow consumer before the stream is paused
+STREAM_PREFETCH_SIZE = 32
+
 
 def find_existing_projects(output_folder: Path) -> List[Dict[str, Any]]:
     """
@@ -519,3 +526,61 @@ def extract_title_from_tex(tex_file: Optional[str]) -> Optional[str]:
         pass
 
     return None
+
+
+async def prefetch(source: AsyncIterator[T], maxsize: int = STREAM_PREFETCH_SIZE) -> AsyncGenerator[T, None]:
+    """
+    Read an async stream on a background task, buffering up to maxsize items.
+
+    Receiving the next item overlaps with whatever the caller does with the
+    previous one. The bounded buffer keeps backpressure: when the caller falls
+    behind, the producer waits instead of growing memory.
+
+    Args:
+        source: Async iterator to drain (iterated entirely inside one task)
+        maxsize: Maximum number of items buffered ahead of the caller
+
+    Yields:
+        Items from source, in order
+
+    Raises:
+        BaseException: Whatever source raised, re-raised at the matching position
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    end = object()
+
+    async def produce():
+        error = None
+        try:
+            try:
+                async for item in source:
+                    await queue.put((item, None))
+            finally:
+                # Close the source in the task that iterated it, even when the
+                # caller stopped early and this task is being cancelled
+                aclose = getattr(source, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        except BaseException as e:
+            error = e
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            # Always wake the caller - unless it cancelled us and is gone
+            if not isinstance(error, asyncio.CancelledError):
+                await queue.put((end, error))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Caller stopped early (or we are done): stop reading the source
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
@@ -51,6 +51,8 @@ GEMINI_DEPENDENCIES = [
 OPTIONAL_DEPENDENCIES = [
     ("aiofiles", "aiofiles", "Async file I/O"),
     ("httpx", "httpx", "Async HTTP client"),
+    ("orjson", "orjson", "Fast JSON for checkpoint/progress files"),
+    ("uvloop", "uvloop", "Faster event loop for resume-research.py (not on Windows)"),
 ]
 
 
@@ -15,15 +15,25 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from research_json import json_loads, json_dumps_indent_bytes
+
 
 CHECKPOINT_FILE = ".checkpoint.json"
 STATE_DIR = ".state"
 
+# Resume context icons per research task status (anything else is shown as skipped)
+RESEARCH_STATUS_ICONS = {"completed": "✅", "failed": "❌"}
+SKIPPED_STATUS_ICON = "⏭️"
+
+# Completed outputs listed in full in the resume context
+MAX_RESUME_OUTPUTS = 20
+
 
 def get_checkpoint_path(project_folder: Path) -> Path:
     """Get path to checkpoint file."""
@@ -35,6 +45,26 @@ def get_state_dir(project_folder: Path) -> Path:
     return project_folder / STATE_DIR
 
 
+def get_failed_research_index_path(project_folder: Path, phase_num: int) -> Path:
+    """Get path to a phase's failed research task index (one task name per line)."""
+    return get_state_dir(project_folder) / f"phase{phase_num}_failed_research.txt"
+
+
+def _write_failed_research_index(project_folder: Path, phase_num: int, research_tasks: dict):
+    """
+    Write the failed research task index for a phase (atomic write).
+
+    Lets has_failed_research_tasks/get_failed_research_tasks answer without
+    parsing the whole checkpoint. An empty file means no failed tasks.
+    """
+    index_path = get_failed_research_index_path(project_folder, phase_num)
+    failed = [name for name, status in research_tasks.items() if status == "failed"]
+
+    temp_path = index_path.with_suffix(".tmp")
+    temp_path.write_text("".join(f"{name}\n" for name in failed), encoding="utf-8")
+    os.replace(temp_path, index_path)
+
+
 def create_checkpoint(
     project_folder: Path,
     phase_num: int,
@@ -88,7 +118,7 @@ def save_checkpoint(
 
     # Load existing checkpoint or create new
     if checkpoint_path.exists():
-        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        checkpoint = json_loads(checkpoint_path.read_bytes())
         checkpoint["updated_at"] = datetime.now().isoformat()
         checkpoint["last_completed_phase"] = phase_num
         checkpoint["next_phase"] = phase_num + 1
@@ -98,7 +128,7 @@ def save_checkpoint(
         plan_type = "full"
         project_name = project_folder.name
         if progress_state_path.exists():
-            progress_state = json.loads(progress_state_path.read_text(encoding="utf-8"))
+            progress_state = json_loads(progress_state_path.read_bytes())
             plan_type = progress_state.get("plan_type", "full")
             project_name = progress_state.get("project_name", project_folder.name)
 
@@ -148,10 +178,25 @@ def save_checkpoint(
         "context": context_summary or "",
         "key_decisions": key_decisions or [],
     }
-    phase_state_path.write_text(json.dumps(phase_state, indent=2), encoding="utf-8")
+    phase_state_path.write_bytes(json_dumps_indent_bytes(phase_state))
+
+    # Other phases' indexes still match the rewritten checkpoint - note which
+    # ones are fresh now so they can be kept fresh after the write
+    fresh_indexes = _fresh_failed_research_indexes(project_folder)
 
     # Save checkpoint
-    checkpoint_path.write_text(json.dumps(checkpoint, indent=2), encoding="utf-8")
+    checkpoint_path.write_bytes(json_dumps_indent_bytes(checkpoint))
+
+    if research_tasks:
+        _write_failed_research_index(project_folder, phase_num, research_tasks)
+    current_index = get_failed_research_index_path(project_folder, phase_num)
+    for index_path in fresh_indexes:
+        if research_tasks and index_path == current_index:
+            continue  # Just rewritten
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass  # Stays stale - readers fall back to the checkpoint
 
     print(f"✓ Checkpoint saved after Phase {phase_num}")
     print(f"  Location: {checkpoint_path}")
@@ -173,7 +218,7 @@ def load_checkpoint(project_folder: Path) -> Optional[dict]:
         print(f"No checkpoint found in {project_folder}", file=sys.stderr)
         return None
 
-    checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    checkpoint = json_loads(checkpoint_path.read_bytes())
     return checkpoint
 
 
@@ -194,7 +239,7 @@ def list_checkpoints(search_path: Path = Path("planning_outputs")) -> list:
 
     for checkpoint_file in search_path.rglob(CHECKPOINT_FILE):
         try:
-            checkpoint = json.loads(checkpoint_file.read_text(encoding="utf-8"))
+            checkpoint = json_loads(checkpoint_file.read_bytes())
             checkpoints.append(
                 {
                     "folder": str(checkpoint_file.parent),
@@ -274,6 +319,55 @@ def get_research_task_status(project_folder: Path, phase_num: Optional[int] = No
     return research_tasks
 
 
+def _fresh_failed_research_indexes(project_folder: Path) -> list:
+    """
+    List the failed research indexes (all phases) that match the checkpoint.
+
+    Returns:
+        Index paths at least as new as .checkpoint.json
+    """
+    try:
+        checkpoint_mtime = get_checkpoint_path(project_folder).stat().st_mtime_ns
+    except OSError:
+        return []
+
+    fresh = []
+    try:
+        with os.scandir(get_state_dir(project_folder)) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_failed_research.txt"):
+                    continue
+                try:
+                    if entry.stat().st_mtime_ns >= checkpoint_mtime:
+                        fresh.append(Path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return fresh
+
+
+def _fresh_failed_research_index(project_folder: Path, phase_num: int) -> Optional[Path]:
+    """
+    Get the failed research index if it still matches the checkpoint.
+
+    The index is written after the checkpoint, so it is only trusted when it
+    is at least as new as .checkpoint.json. A crash between the two writes,
+    a later save without research tasks, or a deleted checkpoint all leave
+    it stale.
+
+    Returns:
+        Index path, or None if the checkpoint itself must be consulted
+    """
+    index_path = get_failed_research_index_path(project_folder, phase_num)
+    try:
+        index_mtime = index_path.stat().st_mtime_ns
+        checkpoint_mtime = get_checkpoint_path(project_folder).stat().st_mtime_ns
+    except OSError:
+        return None  # No index (older checkpoint) or no checkpoint
+    return index_path if index_mtime >= checkpoint_mtime else None
+
+
 def has_failed_research_tasks(project_folder: Path, phase_num: int) -> bool:
     """
     Check if a phase has any failed research tasks.
@@ -285,6 +379,13 @@ def has_failed_research_tasks(project_folder: Path, phase_num: int) -> bool:
     Returns:
         True if there are failed tasks, False otherwise
     """
+    index_path = _fresh_failed_research_index(project_folder, phase_num)
+    if index_path is not None:
+        try:
+            return index_path.stat().st_size > 0
+        except OSError:
+            pass  # Removed since - fall back to the checkpoint itself
+
     phase_tasks = get_research_task_status(project_folder, phase_num)
     tasks = phase_tasks.get("tasks", {})
 
@@ -302,6 +403,13 @@ def get_failed_research_tasks(project_folder: Path, phase_num: int) -> list:
     Returns:
         List of task names that failed
     """
+    index_path = _fresh_failed_research_index(project_folder, phase_num)
+    if index_path is not None:
+        try:
+            return index_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            pass  # Removed since - fall back to the checkpoint itself
+
     phase_tasks = get_research_task_status(project_folder, phase_num)
     tasks = phase_tasks.get("tasks", {})
 
@@ -336,8 +444,7 @@ def generate_resume_context(project_folder: Path) -> str:
         decisions = phase_record.get("key_decisions", [])
         if decisions:
             context_parts.append(f"### Phase {phase_num}")
-            for decision in decisions:
-                context_parts.append(f"- {decision}")
+            context_parts.extend(f"- {decision}" for decision in decisions)
             context_parts.append("")
 
     # Add stored context summary
@@ -364,9 +471,10 @@ def generate_resume_context(project_folder: Path) -> str:
             tasks = phase_data.get("tasks", {})
             if tasks:
                 context_parts.append(f"### Phase {phase_num}")
-                for task_name, status in tasks.items():
-                    status_icon = "✅" if status == "completed" else "❌" if status == "failed" else "⏭️"
-                    context_parts.append(f"- {status_icon} {task_name}: {status}")
+                context_parts.extend(
+                    f"- {RESEARCH_STATUS_ICONS.get(status, SKIPPED_STATUS_ICON)} {task_name}: {status}"
+                    for task_name, status in tasks.items()
+                )
                 context_parts.append("")
 
     # List completed outputs
@@ -376,12 +484,12 @@ def generate_resume_context(project_folder: Path) -> str:
             "",
         ]
     )
-    for output in checkpoint.get("completed_outputs", [])[:20]:  # First 20
-        context_parts.append(f"- {output}")
+    completed_outputs = checkpoint.get("completed_outputs", [])
+    context_parts.extend(f"- {output}" for output in completed_outputs[:MAX_RESUME_OUTPUTS])
 
-    if len(checkpoint.get("completed_outputs", [])) > 20:
+    if len(completed_outputs) > MAX_RESUME_OUTPUTS:
         context_parts.append(
-            f"- ... and {len(checkpoint['completed_outputs']) - 20} more files"
+            f"- ... and {len(completed_outputs) - MAX_RESUME_OUTPUTS} more files"
         )
 
     return "\n".join(context_parts)
@@ -24,9 +24,11 @@ Usage:
 """
 
 import asyncio
+import hashlib
+import json
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, MutableMapping, Optional
 
 # Add paths for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -61,7 +63,8 @@ class EnhancedResearchLookup:
         phase_num: int,
         research_mode: str = "auto",
         force_model: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        cache: Optional[MutableMapping[str, Dict[str, Any]]] = None
     ):
         """
         Initialize enhanced research lookup.
@@ -72,12 +75,16 @@ class EnhancedResearchLookup:
             research_mode: Research mode (perplexity/deep_research/balanced/auto)
             force_model: Optional Perplexity model override
             context: Optional context for routing decisions
+            cache: Optional mapping of successful results by request key
+                (defaults to an in-process dict; pass a shared or persistent
+                mapping to reuse results across instances)
         """
         self.project_folder = Path(project_folder)
         self.phase_num = phase_num
         self.research_mode = research_mode
         self.force_model = force_model
         self.context = context or {}
+        self.cache = cache if cache is not None else {}
 
         # Initialize base research lookup
         if HAS_RESEARCH_LOOKUP:
@@ -115,6 +122,13 @@ class EnhancedResearchLookup:
         if not self.research_lookup:
             raise ImportError("research_lookup.py not available")
 
+        # Identical requests reuse the earlier result instead of re-running research
+        key = self._cache_key(query)
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"♻️  Reusing cached research for: {task_name}")
+            return {**cached, "cache_hit": True, "executor_stats": self.executor.get_stats()}
+
         # Auto-detect estimated duration based on research mode
         if estimated_duration_sec is None:
             if self.research_mode == "deep_research":
@@ -159,11 +173,41 @@ class EnhancedResearchLookup:
             fallback_func=fallback_research_func if use_deep_research else None
         )
 
+        if result.get("success"):
+            self.cache[key] = dict(result)
+
         # Add executor stats to result
         result["executor_stats"] = self.executor.get_stats()
 
         return result
 
+    def _cache_key(self, query: str) -> str:
+        """
+        Build the result cache key for a query.
+
+        Covers the inputs ResearchLookup routes on - mode, model, and the
+        phase/task_type context - so a shared cache never answers a request
+        with a result from a different provider or model.
+
+        Args:
+            query: Research query
+
+        Returns:
+            Hex digest identifying this request
+        """
+        request = json.dumps(
+            {
+                "q": query,
+                "mode": self.research_mode,
+                "model": self.force_model,
+                "phase": self.context.get("phase"),
+                "task_type": self.context.get("task_type"),
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get research execution statistics."""
         return self.executor.get_stats()
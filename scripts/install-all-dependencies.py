@@ -9,12 +9,18 @@ Usage:
     python scripts/install-all-dependencies.py [--verbose]
 """
 
+import compileall
+import re
 import subprocess
 import sys
 import shutil
 from pathlib import Path
 from typing import List, Tuple
 
+# Hyphenated entry points (resume-research.py, ...) only ever run as __main__,
+# which always compiles from source, so caching their bytecode gains nothing
+ENTRY_POINT_PATTERN = re.compile(r"[\\/][^\\/]*-[^\\/]*\.py$")
+
 
 def get_requirements_file() -> Path:
     """Get path to requirements file."""
@@ -111,6 +117,23 @@ def install_package(package: str, verbose: bool = False, use_uv: bool = False) -
         return False, str(e)
 
 
+def precompile_scripts() -> bool:
+    """
+    Byte-compile the helper modules the CLI scripts import.
+
+    Only imported modules (research_checkpoint_manager.py, research_json.py,
+    ...) load from __pycache__; the hyphenated entry points themselves are
+    compiled from source on every run and are skipped.
+
+    Returns:
+        True if every module compiled
+    """
+    scripts_dir = Path(__file__).parent
+    return bool(compileall.compile_dir(
+        str(scripts_dir), maxlevels=0, quiet=1, rx=ENTRY_POINT_PATTERN
+    ))
+
+
 def main():
     """Main installation routine."""
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
@@ -188,6 +211,12 @@ def main():
 
     print("✨ All dependencies installed successfully!")
     print()
+
+    # Warm the bytecode cache for the helper modules the CLI scripts import
+    if not precompile_scripts():
+        print("⚠️  Some helper modules could not be precompiled (they will compile on first import)")
+        print()
+
     print("You can now use:")
     print("  • /full-plan (comprehensive project planning)")
     print("  • /tech-plan (technical planning only)")
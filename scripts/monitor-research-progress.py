@@ -55,15 +55,17 @@ def format_timestamp(iso_timestamp: str) -> str:
         return iso_timestamp
 
 
+STATUS_ICONS = {
+    "running": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+    "pending": "⏳"
+}
+
+
 def get_status_icon(status: str) -> str:
     """Get emoji icon for status."""
-    icons = {
-        "running": "🔄",
-        "completed": "✅",
-        "failed": "❌",
-        "pending": "⏳"
-    }
-    return icons.get(status, "❓")
+    return STATUS_ICONS.get(status, "❓")
 
 
 def get_progress_bar(progress_pct: float, width: int = 40) -> str:
@@ -127,23 +129,38 @@ def print_progress_snapshot(progress: Dict[str, Any], show_checkpoints: bool = F
                 print(f"  [{timestamp}] {phase} ({pct:.0f}%)")
 
     # Final status details
-    if status == "completed":
-        completed_at = progress.get("completed_at")
-        actual_duration = progress.get("actual_duration_sec", 0)
-        if completed_at:
-            print(f"\nCompleted: {format_timestamp(completed_at)}")
-        if actual_duration:
-            print(f"Total duration: {format_duration(actual_duration)}")
-
-    elif status == "failed":
-        error = progress.get("error", "Unknown error")
-        error_type = progress.get("error_type", "unknown")
-        print(f"\nError: {error}")
-        print(f"Error type: {error_type}")
+    print_details = STATUS_DETAIL_PRINTERS.get(status)
+    if print_details:
+        print_details(progress)
 
     print("="*70)
 
 
+def print_completed_details(progress: Dict[str, Any]):
+    """Print completion time and duration of a finished task."""
+    completed_at = progress.get("completed_at")
+    actual_duration = progress.get("actual_duration_sec", 0)
+    if completed_at:
+        print(f"\nCompleted: {format_timestamp(completed_at)}")
+    if actual_duration:
+        print(f"Total duration: {format_duration(actual_duration)}")
+
+
+def print_failed_details(progress: Dict[str, Any]):
+    """Print the error recorded for a failed task."""
+    error = progress.get("error", "Unknown error")
+    error_type = progress.get("error_type", "unknown")
+    print(f"\nError: {error}")
+    print(f"Error type: {error_type}")
+
+
+# Extra snapshot lines for terminal statuses
+STATUS_DETAIL_PRINTERS = {
+    "completed": print_completed_details,
+    "failed": print_failed_details,
+}
+
+
 def monitor_progress_once(project_folder: Path, task_id: str, show_checkpoints: bool = False):
     """Monitor progress once and print status."""
     tracker = ResearchProgressTracker(project_folder, task_id)
@@ -18,9 +18,18 @@ Features:
 """
 
 import asyncio
+import bisect
+import contextlib
+import functools
 import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
 from datetime import datetime, timedelta
 
 # Import configuration system
@@ -29,6 +38,111 @@ from research_config import ResearchConfig, DEFAULT_CONFIG
 # Import structured error system
 from research_errors import raise_research_error, wrap_error, ErrorCode, ResearchError
 
+# Fast JSON parsing (orjson when available)
+from research_json import json_loads, json_dumps_indent_bytes
+
+
+# (time invested, time remaining) in minutes per checkpoint progress percentage
+_RESUME_ESTIMATES_MIN = MappingProxyType({15: (15, 45), 30: (30, 30), 50: (50, 10)})
+_DEFAULT_RESUME_ESTIMATE_MIN = (0, 60)
+
+# Resume prompt sections around the partial results and sources (filled with str.format_map)
+_RESUME_PROMPT_HEADER = """Previous research was interrupted at {progress_pct}% completion.
+
+**IMPORTANT**: You must CONTINUE this research from where it left off. Do NOT start over from scratch.
+
+## Original Query
+{query}
+
+## Progress Summary
+- Checkpoint created: {created_at}
+- Progress: {progress_pct}%
+- Sources collected: {source_count}
+- Phase: {phase}
+
+## Partial Results Collected So Far
+"""
+
+_RESUME_PROMPT_FOOTER = """
+
+## What to Do Next
+Based on the {progress_pct}% completion:
+{next_steps}
+
+Please CONTINUE the research by building on these partial results. Focus on completing the remaining analysis and synthesis. Do not duplicate work already done.
+"""
+
+# Top-level "resumable": false as written by save_research_checkpoint (2-space indent).
+# JSON strings cannot contain raw newlines, so this only matches the top-level key.
+_NON_RESUMABLE_MARKER = b'\n  "resumable": false'
+
+# Top-level fields every checkpoint written by save_research_checkpoint has
+# and that listings/resume estimates read without .get()
+_REQUIRED_CHECKPOINT_FIELDS = frozenset({"task_name", "progress_pct", "created_at"})
+
+# A scheduled checkpoint fires when elapsed time is within this many seconds of its target
+_CHECKPOINT_WINDOW_SEC = 60
+
+
+@functools.lru_cache(maxsize=256)
+def _load_checkpoint_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a checkpoint file, memoized on (path, mtime_ns, size).
+
+    The stat fields are part of the key so rewritten checkpoints are re-read.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path_str, "rb") as f:
+        return json_loads(f.read())
+
+
+def _is_valid_checkpoint(checkpoint: Any) -> bool:
+    """Check that parsed JSON has the checkpoint shape listings rely on."""
+    return isinstance(checkpoint, dict) and _REQUIRED_CHECKPOINT_FIELDS <= checkpoint.keys()
+
+
+def _atomic_write_files(writes: List[Tuple[Path, bytes]]):
+    """
+    Atomically write a batch of files (write to temp, then rename).
+
+    Runs as a single worker-thread job so one save pays one thread hop for
+    the checkpoint and its backup instead of blocking the event loop per file.
+    Contents are fsynced before the rename so a crash leaves either the old
+    or the new checkpoint, never a truncated one.
+
+    Args:
+        writes: (destination path, encoded contents) pairs
+    """
+    for path, data in writes:
+        # Unique temp file per write, so concurrent writers (other processes,
+        # or other managers/threads in this one) never share a temp file
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, path)  # Atomic on POSIX systems
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
+
+
+def _write_checkpoint_files(checkpoint: Dict[str, Any], paths: List[Path]):
+    """
+    Encode a checkpoint once and atomically write it to each path.
+
+    Run in a worker thread so encoding large partial results does not stall
+    the event loop either.
+
+    Args:
+        checkpoint: Checkpoint dict (not modified while being written)
+        paths: Destination files (checkpoint, backup)
+    """
+    checkpoint_json = json_dumps_indent_bytes(checkpoint)
+    _atomic_write_files([(path, checkpoint_json) for path in paths])
+
 
 class ResearchCheckpointManager:
     """
@@ -55,6 +169,7 @@ class ResearchCheckpointManager:
         self.state_dir = self.project_folder / ".state"
         self.checkpoint_dir = self.state_dir / "research_checkpoints"
         self.backup_dir = self.state_dir / "backups"
+        self.resume_prompt_cache_dir = self.state_dir / "resume_prompt_cache"
 
         # Create directories
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
@@ -63,9 +178,61 @@ class ResearchCheckpointManager:
         # Locks for preventing concurrent writes to same task
         self._locks: Dict[str, asyncio.Lock] = {}
 
+        # File name prefix shared by this phase's checkpoints and backups
+        self._file_prefix = f"phase{phase_num}_"
+
+        # Checkpoint paths per task name (fixed for the manager's phase)
+        self._checkpoint_files: Dict[str, Path] = {}
+
+        # Checkpoint schedule sorted by target time for bisect lookups; each entry
+        # keeps its config position so overlapping windows resolve as configured
+        schedule = sorted(
+            (entry[0], position, entry)
+            for position, entry in enumerate(self.config.get_checkpoint_schedule_tuples())
+        )
+        self._checkpoint_targets = [target_time for target_time, _, _ in schedule]
+        self._checkpoint_entries = [(position, entry) for _, position, entry in schedule]
+
     def get_checkpoint_file(self, task_name: str) -> Path:
         """Get checkpoint file path for a task."""
-        return self.checkpoint_dir / f"phase{self.phase_num}_{task_name}.json"
+        checkpoint_file = self._checkpoint_files.get(task_name)
+        if checkpoint_file is None:
+            checkpoint_file = self.checkpoint_dir / (self._file_prefix + task_name + ".json")
+            self._checkpoint_files[task_name] = checkpoint_file
+        return checkpoint_file
+
+    def get_resume_prompt_cache_file(self, task_name: str, mtime_ns: int) -> Path:
+        """
+        Get the cached resume prompt path for one version of a task's checkpoint.
+
+        Args:
+            task_name: Unique name for the research task
+            mtime_ns: Checkpoint file mtime the prompt was rendered from
+
+        Returns:
+            Path under resume_prompt_cache_dir
+        """
+        return self.resume_prompt_cache_dir / f"{self._file_prefix}{task_name}.{mtime_ns}.txt"
+
+    def clear_resume_prompt_cache(self, task_name: str):
+        """
+        Delete every cached resume prompt rendered for a task.
+
+        Matches the exact task name plus the mtime component, so clearing
+        task "foo" never touches the cache of task "foo.bar".
+
+        Args:
+            task_name: Unique name for the research task
+        """
+        pattern = re.compile(rf"{re.escape(self._file_prefix + task_name)}\.\d+\.txt")
+        try:
+            entries = list(os.scandir(self.resume_prompt_cache_dir))
+        except OSError:
+            return  # No cache yet
+        for entry in entries:
+            if pattern.fullmatch(entry.name):
+                with contextlib.suppress(OSError):
+                    os.unlink(entry.path)
 
     async def save_research_checkpoint(
         self,
@@ -98,12 +265,13 @@ class ResearchCheckpointManager:
             self._locks[task_name] = asyncio.Lock()
 
         async with self._locks[task_name]:
+            now = datetime.now()
             checkpoint = {
                 "version": "1.0",
                 "task_name": task_name,
                 "phase_num": self.phase_num,
                 "query": query,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
                 "progress_pct": progress_pct,
                 "resumable": resumable,
                 "partial_results": partial_results,
@@ -119,19 +287,11 @@ class ResearchCheckpointManager:
             if metadata:
                 checkpoint["metadata"].update(metadata)
 
-            checkpoint_json = json.dumps(checkpoint, indent=2)
-
-            # Atomic write to checkpoint file (write to temp, then rename)
+            # Checkpoint plus timestamped backup, encoded and written off the
+            # event loop in one batch
             checkpoint_file = self.get_checkpoint_file(task_name)
-            temp_checkpoint = checkpoint_file.with_suffix('.tmp')
-            temp_checkpoint.write_text(checkpoint_json)
-            temp_checkpoint.replace(checkpoint_file)  # Atomic on POSIX systems
-
-            # Also backup to timestamped file (atomic write)
-            backup_file = self.backup_dir / f"phase{self.phase_num}_{task_name}_{int(datetime.now().timestamp())}.json"
-            temp_backup = backup_file.with_suffix('.tmp')
-            temp_backup.write_text(checkpoint_json)
-            temp_backup.replace(backup_file)  # Atomic on POSIX systems
+            backup_file = self.backup_dir / f"{self._file_prefix}{task_name}_{int(now.timestamp())}.json"
+            await asyncio.to_thread(_write_checkpoint_files, checkpoint, [checkpoint_file, backup_file])
 
     def load_research_checkpoint(self, task_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -143,57 +303,82 @@ class ResearchCheckpointManager:
         Returns:
             Checkpoint dictionary if exists, None otherwise
         """
-        checkpoint_file = self.get_checkpoint_file(task_name)
-
-        if not checkpoint_file.exists():
-            return None
-
         try:
-            checkpoint = json.loads(checkpoint_file.read_text())
-            return checkpoint
+            # Missing files raise FileNotFoundError, so no separate exists() check
+            return json_loads(self.get_checkpoint_file(task_name).read_bytes())
         except (json.JSONDecodeError, OSError):
-            # Corrupted checkpoint
+            # Missing or corrupted checkpoint
             return None
 
+    def _read_checkpoint_file(self, checkpoint_file: Path, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Parse a checkpoint file for read-only use.
+
+        Args:
+            checkpoint_file: Path to the checkpoint JSON file
+            use_cache: Reuse the parsed dict while the file is unchanged (default: True)
+
+        Returns:
+            Parsed checkpoint (shared when cached - do not mutate)
+
+        Raises:
+            OSError, json.JSONDecodeError: If the file is missing or corrupted
+        """
+        if not use_cache:
+            return json_loads(checkpoint_file.read_bytes())
+
+        stat = checkpoint_file.stat()
+        return _load_checkpoint_cached(str(checkpoint_file), stat.st_mtime_ns, stat.st_size)
+
     def delete_checkpoint(self, task_name: str):
         """
         Delete checkpoint after successful completion.
 
+        Cached resume prompts rendered from it are deleted too - they hold
+        the query and partial results and would otherwise pile up.
+
         Args:
             task_name: Unique name for the research task
         """
-        checkpoint_file = self.get_checkpoint_file(task_name)
-        if checkpoint_file.exists():
-            checkpoint_file.unlink()
+        self.get_checkpoint_file(task_name).unlink(missing_ok=True)
+        self.clear_resume_prompt_cache(task_name)
 
-    def list_checkpoints(self, resumable_only: bool = False) -> List[Dict[str, Any]]:
+    def list_checkpoints(
+        self,
+        resumable_only: bool = False,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         List all checkpoints for current phase.
 
         Args:
             resumable_only: If True, only return resumable checkpoints
+            use_cache: Reuse parsed checkpoints while files are unchanged (default: True)
 
         Returns:
             List of checkpoint summaries
         """
         checkpoints = []
 
-        for checkpoint_file in self.checkpoint_dir.glob(f"phase{self.phase_num}_*.json"):
+        for checkpoint_file in self._phase_checkpoint_files():
             try:
-                checkpoint = json.loads(checkpoint_file.read_text())
+                if use_cache:
+                    checkpoint = self._read_checkpoint_file(checkpoint_file)
+                else:
+                    data = checkpoint_file.read_bytes()
+                    # Skip parsing checkpoints that are known to be filtered out
+                    if resumable_only and _NON_RESUMABLE_MARKER in data:
+                        continue
+                    checkpoint = json_loads(data)
+
+                if not _is_valid_checkpoint(checkpoint):
+                    continue  # Valid JSON but not a checkpoint
 
                 # Filter by resumable if requested
                 if resumable_only and not checkpoint.get("resumable", True):
                     continue
 
-                summary = {
-                    "task_name": checkpoint["task_name"],
-                    "progress_pct": checkpoint["progress_pct"],
-                    "created_at": checkpoint["created_at"],
-                    "resumable": checkpoint.get("resumable", True),
-                    "source_count": checkpoint.get("metadata", {}).get("source_count", 0)
-                }
-                checkpoints.append(summary)
+                checkpoints.append(self._summarize_checkpoint(checkpoint))
 
             except (json.JSONDecodeError, OSError):
                 # Skip corrupted files
@@ -204,6 +389,31 @@ class ResearchCheckpointManager:
 
         return checkpoints
 
+    def _phase_checkpoint_files(self) -> List[Path]:
+        """Get checkpoint files belonging to the current phase."""
+        try:
+            # scandir + name checks avoids glob's pattern matching and per-entry stat
+            with os.scandir(self.checkpoint_dir) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith(self._file_prefix)
+                    and entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _summarize_checkpoint(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the listing summary for a parsed checkpoint."""
+        return {
+            "task_name": checkpoint["task_name"],
+            "progress_pct": checkpoint["progress_pct"],
+            "created_at": checkpoint["created_at"],
+            "resumable": checkpoint.get("resumable", True),
+            "source_count": checkpoint.get("metadata", {}).get("source_count", 0)
+        }
+
     def build_resume_prompt(
         self,
         task_name: str,
@@ -228,34 +438,65 @@ class ResearchCheckpointManager:
         if not checkpoint.get("resumable", True):
             return None
 
-        # Build resume prompt with context
-        resume_prompt = f"""Previous research was interrupted at {checkpoint['progress_pct']}% completion.
-
-**IMPORTANT**: You must CONTINUE this research from where it left off. Do NOT start over from scratch.
+        return "".join(self._iter_resume_prompt_parts(checkpoint))
 
-## Original Query
-{checkpoint['query']}
+    def build_resume_prompt_preview(
+        self,
+        task_name: str,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        max_chars: int = 500
+    ) -> Optional[str]:
+        """
+        Build only the first max_chars characters of the resume prompt.
 
-## Progress Summary
-- Checkpoint created: {checkpoint['created_at']}
-- Progress: {checkpoint['progress_pct']}%
-- Sources collected: {checkpoint['metadata']['source_count']}
-- Phase: {self._get_checkpoint_reason(checkpoint['progress_pct'])}
+        Stops rendering once the limit is reached, so partial results and
+        sources past the preview window are never serialized.
 
-## Partial Results Collected So Far
-{json.dumps(checkpoint['partial_results'], indent=2)}
+        Args:
+            task_name: Unique name for the research task
+            checkpoint: Optional checkpoint dict (will load if not provided)
+            max_chars: Maximum preview length (default: 500)
 
-## Sources Already Collected
-{self._format_sources(checkpoint['sources_collected'])}
+        Returns:
+            Prompt prefix, or None if no resumable checkpoint exists
+        """
+        if checkpoint is None:
+            checkpoint = self.load_research_checkpoint(task_name)
 
-## What to Do Next
-Based on the {checkpoint['progress_pct']}% completion:
-{self._get_next_steps(checkpoint['progress_pct'])}
+        if not checkpoint:
+            return None
 
-Please CONTINUE the research by building on these partial results. Focus on completing the remaining analysis and synthesis. Do not duplicate work already done.
-"""
+        if not checkpoint.get("resumable", True):
+            return None
 
-        return resume_prompt
+        parts = []
+        remaining = max_chars
+        for part in self._iter_resume_prompt_parts(checkpoint):
+            parts.append(part[:remaining])
+            remaining -= len(part)
+            if remaining <= 0:
+                break
+
+        return "".join(parts)
+
+    def _iter_resume_prompt_parts(self, checkpoint: Dict[str, Any]) -> Iterator[str]:
+        """Yield the resume prompt in sections so previews can stop early."""
+        progress_pct = checkpoint['progress_pct']
+
+        yield _RESUME_PROMPT_HEADER.format_map({
+            "progress_pct": progress_pct,
+            "query": checkpoint['query'],
+            "created_at": checkpoint['created_at'],
+            "source_count": checkpoint['metadata']['source_count'],
+            "phase": self._get_checkpoint_reason(progress_pct),
+        })
+        yield json.dumps(checkpoint['partial_results'], indent=2)
+        yield "\n\n## Sources Already Collected\n"
+        yield self._format_sources(checkpoint['sources_collected'])
+        yield _RESUME_PROMPT_FOOTER.format_map({
+            "progress_pct": progress_pct,
+            "next_steps": self._get_next_steps(progress_pct),
+        })
 
     def should_create_checkpoint(
         self,
@@ -272,57 +513,72 @@ Please CONTINUE the research by building on these partial results. Focus on comp
         Returns:
             Tuple of (should_checkpoint, progress_pct, phase_name, resumable)
         """
-        progress_pct = (elapsed_sec / estimated_duration_sec) * 100
-
-        # Get checkpoint schedule from config
-        checkpoints = self.config.get_checkpoint_schedule_tuples()
+        # Targets strictly inside (elapsed - window, elapsed + window)
+        lo = bisect.bisect_right(self._checkpoint_targets, elapsed_sec - _CHECKPOINT_WINDOW_SEC)
+        hi = bisect.bisect_left(self._checkpoint_targets, elapsed_sec + _CHECKPOINT_WINDOW_SEC)
 
-        # Find the appropriate checkpoint
-        for target_time, pct, phase, resumable in checkpoints:
-            # Check if we've reached this checkpoint
-            if abs(elapsed_sec - target_time) < 60:  # Within 1 minute window
-                return (True, pct, phase, resumable)
+        if lo < hi:
+            # Earliest configured entry wins if windows overlap
+            _, (_, pct, phase, resumable) = min(self._checkpoint_entries[lo:hi])
+            return (True, pct, phase, resumable)
 
+        progress_pct = (elapsed_sec / estimated_duration_sec) * 100
         return (False, progress_pct, "in-progress", True)
 
-    def get_resume_estimate(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+    def get_resume_estimate(
+        self,
+        checkpoint: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Estimate time savings from resuming.
 
         Args:
             checkpoint: Checkpoint dictionary
+            now: Reference time for the checkpoint age (default: current time);
+                pass one value when estimating many checkpoints at once
 
         Returns:
             Dictionary with time saved and remaining estimates
         """
-        progress_pct = checkpoint["progress_pct"]
         created_at = datetime.fromisoformat(checkpoint["created_at"])
 
         # Estimate original time invested (rough heuristic)
-        if progress_pct == 15:
-            time_invested_min = 15
-            time_remaining_min = 45
-        elif progress_pct == 30:
-            time_invested_min = 30
-            time_remaining_min = 30
-        elif progress_pct == 50:
-            time_invested_min = 50
-            time_remaining_min = 10
-        else:
-            time_invested_min = 0
-            time_remaining_min = 60
+        time_invested_min, time_remaining_min = _RESUME_ESTIMATES_MIN.get(
+            checkpoint["progress_pct"], _DEFAULT_RESUME_ESTIMATE_MIN
+        )
 
         return {
             "time_invested_min": time_invested_min,
             "time_remaining_min": time_remaining_min,
             "time_saved_min": time_invested_min,
-            "checkpoint_age_hours": (datetime.now() - created_at).total_seconds() / 3600
+            "checkpoint_age_hours": ((now or datetime.now()) - created_at).total_seconds() / 3600
+        }
+
+    @staticmethod
+    def source_keys(sources: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Build the identity set used to compare sources (URL, falling back to title).
+
+        Args:
+            sources: Source dicts with 'url' and/or 'title'
+
+        Returns:
+            Set of source keys
+        """
+        return {
+            s.get('url', s.get('title', ''))
+            for s in sources
+            if s.get('url') or s.get('title')
         }
 
     def verify_resume_continuation(
         self,
         task_name: str,
-        new_result: Dict[str, Any]
+        new_result: Dict[str, Any],
+        checkpoint: Optional[Dict[str, Any]] = None,
+        old_urls: Optional[Set[str]] = None,
+        new_urls: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
         """
         Verify that new result continued from checkpoint (not restarted).
@@ -330,11 +586,15 @@ Please CONTINUE the research by building on these partial results. Focus on comp
         Args:
             task_name: Task name
             new_result: New research result
+            checkpoint: Optional checkpoint dict (will load if not provided)
+            old_urls: Pre-built source_keys() of the checkpoint sources
+            new_urls: Pre-built source_keys() of the new result's sources
 
         Returns:
             Verification report with overlap analysis
         """
-        checkpoint = self.load_research_checkpoint(task_name)
+        if checkpoint is None:
+            checkpoint = self.load_research_checkpoint(task_name)
         if not checkpoint:
             return {
                 'verified': False,
@@ -342,15 +602,13 @@ Please CONTINUE the research by building on these partial results. Focus on comp
             }
 
         # Check for duplicate sources (indicates restart)
-        checkpoint_sources = set(
-            s.get('url', s.get('title', ''))
-            for s in checkpoint.get('sources_collected', [])
-            if s.get('url') or s.get('title')
+        checkpoint_sources = (
+            old_urls if old_urls is not None
+            else self.source_keys(checkpoint.get('sources_collected', []))
         )
-        new_sources = set(
-            s.get('url', s.get('title', ''))
-            for s in new_result.get('sources', [])
-            if s.get('url') or s.get('title')
+        new_sources = (
+            new_urls if new_urls is not None
+            else self.source_keys(new_result.get('sources', []))
         )
 
         overlap = checkpoint_sources & new_sources
@@ -395,7 +653,7 @@ Please CONTINUE the research by building on these partial results. Focus on comp
 
         for checkpoint_file in self.checkpoint_dir.glob("*.json"):
             try:
-                checkpoint = json.loads(checkpoint_file.read_text())
+                checkpoint = json_loads(checkpoint_file.read_bytes())
                 created_at = datetime.fromisoformat(checkpoint["created_at"])
 
                 if created_at < cutoff:
@@ -465,29 +723,118 @@ class ResearchResumeHelper:
         """Initialize with a checkpoint manager."""
         self.checkpoint_manager = checkpoint_manager
 
-    def find_resumable_tasks(self) -> List[Dict[str, Any]]:
+    def find_resumable_tasks(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Find all resumable research tasks for current phase.
 
+        Args:
+            use_cache: Reuse parsed checkpoints while files are unchanged (default: True)
+
         Returns:
             List of resumable task summaries with time estimates
         """
-        checkpoints = self.checkpoint_manager.list_checkpoints(resumable_only=True)
+        manager = self.checkpoint_manager
+
+        # One pass: each file is stat'ed and parsed (or fetched from the parse
+        # cache) once, rather than listing and then re-reading for estimates
+        checkpoints = []
+        for checkpoint_file in manager._phase_checkpoint_files():
+            try:
+                checkpoints.append(manager._read_checkpoint_file(checkpoint_file, use_cache))
+            except (json.JSONDecodeError, OSError):
+                # Skip corrupted files
+                continue
 
+        return self._resumable_summaries(checkpoints)
+
+    async def find_resumable_tasks_async(
+        self,
+        use_cache: bool = True,
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Find resumable research tasks, loading checkpoint files concurrently.
+
+        Same result as find_resumable_tasks(), but file reads and JSON parsing
+        run on a small thread pool so large phases are not read one by one.
+
+        Args:
+            use_cache: Reuse parsed checkpoints while files are unchanged (default: True)
+            max_workers: Thread pool size for loading checkpoints (default: 4)
+
+        Returns:
+            List of resumable task summaries with time estimates
+        """
+        manager = self.checkpoint_manager
+        loop = asyncio.get_running_loop()
+
+        def load(checkpoint_file: Path) -> Optional[Dict[str, Any]]:
+            try:
+                return manager._read_checkpoint_file(checkpoint_file, use_cache)
+            except (json.JSONDecodeError, OSError):
+                # Skip corrupted files
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="checkpoint-load") as pool:
+            checkpoints = await asyncio.gather(*(
+                loop.run_in_executor(pool, load, checkpoint_file)
+                for checkpoint_file in manager._phase_checkpoint_files()
+            ))
+
+        return self._resumable_summaries(checkpoints)
+
+    def _resumable_summaries(self, checkpoints: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Build sorted resumable task summaries from parsed checkpoint files.
+
+        Args:
+            checkpoints: Parsed checkpoint files (None/invalid entries are skipped)
+
+        Returns:
+            Resumable task summaries with time estimates, newest first
+        """
+        manager = self.checkpoint_manager
         resumable = []
-        for cp_summary in checkpoints:
-            # Load full checkpoint for time estimates
-            checkpoint = self.checkpoint_manager.load_research_checkpoint(
-                cp_summary["task_name"]
-            )
+        now = datetime.now()
+        for checkpoint in checkpoints:
+            if not _is_valid_checkpoint(checkpoint) or not checkpoint.get("resumable", True):
+                continue
+
+            summary = manager._summarize_checkpoint(checkpoint)
+            summary.update(manager.get_resume_estimate(checkpoint, now))
+            resumable.append(summary)
 
-            if checkpoint:
-                estimates = self.checkpoint_manager.get_resume_estimate(checkpoint)
-                cp_summary.update(estimates)
-                resumable.append(cp_summary)
+        # Sort by creation time (newest first), matching list_checkpoints()
+        resumable.sort(key=lambda x: x["created_at"], reverse=True)
 
         return resumable
 
+    def decide(
+        self,
+        checkpoint: Optional[Dict[str, Any]],
+        max_age_hours: int = 24
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Decide whether an already-loaded checkpoint should be auto-resumed.
+
+        Args:
+            checkpoint: Checkpoint dictionary (or None if no checkpoint exists)
+            max_age_hours: Maximum age for auto-resume (default: 24 hours)
+
+        Returns:
+            Tuple of (should_resume, resume_estimate); the estimate is None
+            when the checkpoint is missing or not resumable
+        """
+        if not checkpoint or not checkpoint.get("resumable", True):
+            return False, None
+
+        estimate = self.checkpoint_manager.get_resume_estimate(checkpoint)
+
+        if estimate["checkpoint_age_hours"] > max_age_hours:
+            return False, estimate  # Too old, better to restart
+
+        return True, estimate
+
     def should_auto_resume(self, task_name: str, max_age_hours: int = 24) -> bool:
         """
         Check if a task should be auto-resumed.
@@ -499,19 +846,20 @@ class ResearchResumeHelper:
         Returns:
             True if should auto-resume, False otherwise
         """
-        checkpoint = self.checkpoint_manager.load_research_checkpoint(task_name)
+        checkpoint_file = self.checkpoint_manager.get_checkpoint_file(task_name)
+        try:
+            mtime = checkpoint_file.stat().st_mtime
+        except OSError:
+            return False  # No checkpoint
 
-        if not checkpoint or not checkpoint.get("resumable", True):
+        # The file is written after created_at is stamped, so a file last modified
+        # before the cutoff holds a checkpoint that is too old - skip parsing it
+        if time.time() - mtime > max_age_hours * 3600:
             return False
 
-        # Check age
-        created_at = datetime.fromisoformat(checkpoint["created_at"])
-        age_hours = (datetime.now() - created_at).total_seconds() / 3600
-
-        if age_hours > max_age_hours:
-            return False  # Too old, better to restart
-
-        return True
+        checkpoint = self.checkpoint_manager.load_research_checkpoint(task_name)
+        should_resume, _ = self.decide(checkpoint, max_age_hours=max_age_hours)
+        return should_resume
 
     def print_resumable_summary(self):
         """Print a summary of resumable tasks to console."""
@@ -0,0 +1,75 @@
+"""
+Research JSON Helpers
+
+Fast JSON parsing and serialization for research state files and CLI output.
+
+Usage:
+    from research_json import json_loads, json_dumps_bytes, json_dumps_indent_bytes
+    checkpoint = json_loads(checkpoint_file.read_bytes())
+    sys.stdout.buffer.write(json_dumps_bytes(tasks))
+    checkpoint_file.write_bytes(json_dumps_indent_bytes(checkpoint))
+
+Features:
+- Uses orjson when installed (pip install project-planner[performance])
+- Falls back to the standard library json module otherwise
+- Decode errors are json.JSONDecodeError either way
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes.
+
+    Args:
+        data: JSON document as str or bytes (bytes avoid a decode step with orjson)
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_indent_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to human-readable UTF-8 JSON bytes (2-space indent).
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
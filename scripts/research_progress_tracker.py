@@ -16,16 +16,37 @@ Features:
 - Estimated completion time
 """
 
+import os
+import re
 import json
+import time
 import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
+from research_json import json_loads, json_dumps_indent_bytes
+
 # Import state machine for transition validation
 from research_state_machine import ResearchTaskStateMachine, ResearchTaskState
 
+PROGRESS_FILE_PREFIX = ".research-progress-"
+PROGRESS_FILE_SUFFIX = ".json"
+
+# Top-level "status" as written by ResearchProgressTracker (2-space indent).
+# JSON strings cannot contain raw newlines, so this only matches the top-level key.
+_STATUS_PATTERN = re.compile(rb'\n  "status": "([^"]*)"')
+
+# update() writes at once, then coalesces further updates within this window
+# into one trailing write
+PROGRESS_FLUSH_DELAY_SEC = 0.02
+
+
+def _is_progress_file(name: str) -> bool:
+    """Check whether a directory entry name is a research progress file."""
+    return name.startswith(PROGRESS_FILE_PREFIX) and name.endswith(PROGRESS_FILE_SUFFIX)
+
 
 @dataclass
 class Activity:
@@ -192,8 +213,11 @@ class ResearchProgressTracker:
         """
         self.project_folder = Path(project_folder)
         self.task_id = task_id
-        self.progress_file = self.project_folder / f".research-progress-{task_id}.json"
-        self.start_time: Optional[datetime] = None
+        self.progress_file = (
+            self.project_folder / f"{PROGRESS_FILE_PREFIX}{task_id}{PROGRESS_FILE_SUFFIX}"
+        )
+        self.start_time: Optional[datetime] = None  # Wall clock, for display
+        self._start_perf: Optional[float] = None    # Monotonic, for elapsed time
 
         # Initialize state machine for transition validation
         self.state_machine = ResearchTaskStateMachine()
@@ -201,6 +225,55 @@ class ResearchProgressTracker:
         # Initialize activity-based progress tracking
         self.activity_tracker = ActivityBasedProgressTracker(activities)
 
+        # In-memory progress state; update() changes it and writes are
+        # throttled, so a burst of updates costs two file writes, not one each
+        self._progress: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _elapsed_sec(self) -> float:
+        """
+        Seconds since start(), measured on the monotonic clock.
+
+        Returns:
+            Elapsed seconds, or 0 if tracking never started
+        """
+        if self._start_perf is None:
+            return 0
+        return time.perf_counter() - self._start_perf
+
+    def _write_progress(self):
+        """Write the in-memory progress state (atomic: temp file, then rename)."""
+        temp_file = self.progress_file.with_suffix(".tmp")
+        temp_file.write_bytes(json_dumps_indent_bytes(self._progress))
+        temp_file.replace(self.progress_file)
+        self._dirty = False
+
+    def _cancel_flush(self):
+        """Cancel the scheduled flush, if any."""
+        if self._flush_task is not None:
+            if self._flush_task is not asyncio.current_task():
+                self._flush_task.cancel()
+            self._flush_task = None
+
+    def _flush(self):
+        """Write pending updates now instead of waiting for the scheduled flush."""
+        self._cancel_flush()
+        if self._dirty:
+            self._write_progress()
+
+    async def _flush_after(self, delay_sec: float):
+        """Close the coalescing window, writing any updates made during it."""
+        try:
+            await asyncio.sleep(delay_sec)
+        finally:
+            # Also runs when cancelled, e.g. by asyncio.run() ending inside the
+            # window - the last update must still reach the file
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+            if self._dirty:
+                self._write_progress()
+
     def _get_initial_state(
         self,
         query: str,
@@ -253,6 +326,7 @@ class ResearchProgressTracker:
         self.state_machine.transition(ResearchTaskState.RUNNING, "start")
 
         self.start_time = datetime.now()
+        self._start_perf = time.perf_counter()
 
         # Ensure project folder exists
         self.project_folder.mkdir(parents=True, exist_ok=True)
@@ -265,7 +339,9 @@ class ResearchProgressTracker:
             state["metadata"].update(metadata)
 
         # Write progress file
-        self.progress_file.write_text(json.dumps(state, indent=2))
+        self._cancel_flush()
+        self._progress = state
+        self._write_progress()
 
     async def update(
         self,
@@ -293,7 +369,9 @@ class ResearchProgressTracker:
             activity_name: Optional activity name for activity-based tracking
             activity_progress_pct: Optional progress within specific activity (0-100)
 
-        Updates the progress file atomically.
+        The progress file is rewritten atomically. Updates arriving within
+        PROGRESS_FLUSH_DELAY_SEC of a write are coalesced into one trailing
+        write, which read_progress(), complete() and fail() bring forward.
 
         Example (activity-based):
             await tracker.update(
@@ -302,11 +380,13 @@ class ResearchProgressTracker:
             )
             # Results in overall progress of 12.5% (25% weight * 50%)
         """
-        if not self.progress_file.exists():
-            raise FileNotFoundError(
-                f"Progress file not found: {self.progress_file}. "
-                "Call start() first."
-            )
+        if self._progress is None:
+            if not self.progress_file.exists():
+                raise FileNotFoundError(
+                    f"Progress file not found: {self.progress_file}. "
+                    "Call start() first."
+                )
+            self._progress = json_loads(self.progress_file.read_bytes())
 
         # Activity-based progress calculation
         if activity_name is not None and activity_progress_pct is not None:
@@ -329,10 +409,8 @@ class ResearchProgressTracker:
                 "(activity_name, activity_progress_pct)"
             )
 
-        # Read current state
-        progress = json.loads(self.progress_file.read_text())
-
         # Update fields
+        progress = self._progress
         now = datetime.now()
         progress.update({
             "status": "running",
@@ -347,8 +425,8 @@ class ResearchProgressTracker:
             progress["activity_status"] = self.activity_tracker.get_status_summary()
 
         # Update estimated completion based on progress
-        if self.start_time and progress_pct > 0:
-            elapsed = (now - self.start_time).total_seconds()
+        if self._start_perf is not None and progress_pct > 0:
+            elapsed = self._elapsed_sec()
             estimated_total = elapsed / (progress_pct / 100)
             remaining = estimated_total - elapsed
             estimated_completion = now + timedelta(seconds=remaining)
@@ -368,10 +446,14 @@ class ResearchProgressTracker:
             }
             progress["checkpoints"].append(checkpoint)
 
-        # Write atomically (write to temp, then rename)
-        temp_file = self.progress_file.with_suffix(".tmp")
-        temp_file.write_text(json.dumps(progress, indent=2))
-        temp_file.replace(self.progress_file)
+        # Write now if no window is open (external monitors see it right away);
+        # otherwise leave it for the window's single trailing write
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._write_progress()
+            self._flush_task = asyncio.create_task(
+                self._flush_after(PROGRESS_FLUSH_DELAY_SEC)
+            )
 
     async def complete(self, results: Optional[Dict[str, Any]] = None):
         """
@@ -385,15 +467,13 @@ class ResearchProgressTracker:
         # Validate state transition
         self.state_machine.transition(ResearchTaskState.COMPLETED, "complete")
 
-        if not self.progress_file.exists():
+        progress = self._load_final_state()
+        if progress is None:
             return  # Already cleaned up or never started
 
-        # Read current state
-        progress = json.loads(self.progress_file.read_text())
-
         # Update to completed
         now = datetime.now()
-        duration = (now - self.start_time).total_seconds() if self.start_time else 0
+        duration = self._elapsed_sec()
 
         progress.update({
             "status": "completed",
@@ -410,7 +490,7 @@ class ResearchProgressTracker:
             progress["results"] = results
 
         # Write final state
-        self.progress_file.write_text(json.dumps(progress, indent=2))
+        self._write_progress()
 
     async def fail(self, error: str, error_type: Optional[str] = None):
         """
@@ -425,15 +505,13 @@ class ResearchProgressTracker:
         # Validate state transition
         self.state_machine.transition(ResearchTaskState.FAILED, "fail")
 
-        if not self.progress_file.exists():
+        progress = self._load_final_state()
+        if progress is None:
             return  # Already cleaned up or never started
 
-        # Read current state
-        progress = json.loads(self.progress_file.read_text())
-
         # Update to failed
         now = datetime.now()
-        duration = (now - self.start_time).total_seconds() if self.start_time else 0
+        duration = self._elapsed_sec()
 
         progress.update({
             "status": "failed",
@@ -445,19 +523,40 @@ class ResearchProgressTracker:
         })
 
         # Write final state
-        self.progress_file.write_text(json.dumps(progress, indent=2))
+        self._write_progress()
+
+    def _load_final_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress state for complete()/fail(), dropping any pending flush.
+
+        Returns:
+            Progress dictionary, or None if the progress file no longer exists
+        """
+        self._cancel_flush()
+        if not self.progress_file.exists():
+            self._progress = None
+            return None
+        if self._progress is None:
+            self._progress = json_loads(self.progress_file.read_bytes())
+        return self._progress
 
     def read_progress(self) -> Optional[Dict[str, Any]]:
         """
         Read current progress state.
 
+        Pending updates are written first, so the result is never behind
+        the last update() call.
+
         Returns:
             Progress dictionary if file exists, None otherwise
         """
+        if self._dirty and self.progress_file.exists():
+            self._flush()
+
         if not self.progress_file.exists():
             return None
 
-        return json.loads(self.progress_file.read_text())
+        return json_loads(self.progress_file.read_bytes())
 
     def cleanup(self):
         """
@@ -465,6 +564,9 @@ class ResearchProgressTracker:
 
         Call this after successful completion to avoid clutter.
         """
+        self._cancel_flush()
+        self._progress = None
+        self._dirty = False
         if self.progress_file.exists():
             self.progress_file.unlink()
 
@@ -528,14 +630,23 @@ class ResearchProgressTracker:
             return []
 
         # Find all progress files
-        for progress_file in project_folder.glob(".research-progress-*.json"):
-            try:
-                progress = json.loads(progress_file.read_text())
-                if progress.get("status") == "running":
-                    active.append(progress)
-            except (json.JSONDecodeError, OSError):
-                # Skip corrupted files
-                continue
+        with os.scandir(project_folder) as entries:
+            for entry in entries:
+                if not _is_progress_file(entry.name):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = f.read()
+                    # Skip parsing files that are known not to be running
+                    match = _STATUS_PATTERN.search(data)
+                    if match and match.group(1) != b"running":
+                        continue
+                    progress = json_loads(data)
+                    if progress.get("status") == "running":
+                        active.append(progress)
+                except (json.JSONDecodeError, OSError):
+                    # Skip corrupted files
+                    continue
 
         return active
 
@@ -557,16 +668,22 @@ class ResearchProgressTracker:
         cutoff = datetime.now() - timedelta(days=max_age_days)
         deleted_count = 0
 
-        for progress_file in project_folder.glob(".research-progress-*.json"):
-            try:
-                # Check file modification time
-                mtime = datetime.fromtimestamp(progress_file.stat().st_mtime)
-                if mtime < cutoff:
-                    progress_file.unlink()
-                    deleted_count += 1
-            except OSError:
-                # Skip files we can't access
-                continue
+        if not project_folder.exists():
+            return 0
+
+        with os.scandir(project_folder) as entries:
+            for entry in entries:
+                if not _is_progress_file(entry.name):
+                    continue
+                try:
+                    # Check file modification time
+                    mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                    if mtime < cutoff:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                except OSError:
+                    # Skip files we can't access
+                    continue
 
         return deleted_count
 
@@ -16,13 +16,19 @@ Features:
 - Clear error messages for invalid transitions
 """
 
+import sys
+import time
+import itertools
+from collections import deque
 from enum import Enum
-from typing import List, Tuple, Set, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from types import MappingProxyType
+from collections.abc import Sequence
+from typing import Any, Deque, Dict, FrozenSet, Iterator, List, Mapping, Tuple, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 # Import structured error system
-from research_errors import raise_research_error, ErrorCode
+from research_errors import ResearchError, ErrorCode, RECOVERY_STRATEGIES
 
 
 class ResearchTaskState(Enum):
@@ -34,13 +40,202 @@ class ResearchTaskState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Terminal states (completed/failed) allow no further transitions
+_TERMINAL_STATES = frozenset({ResearchTaskState.COMPLETED, ResearchTaskState.FAILED})
+
+
+# Wall-clock anchor for converting monotonic record timestamps for display
+_WALL_ANCHOR = datetime.now()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+
+
+@dataclass(frozen=True, slots=True)
 class StateTransitionRecord:
-    """Record of a state transition."""
+    """
+    Record of a state transition.
+
+    Immutable and slotted so long histories stay compact and entries can be
+    shared safely. Stores a cheap monotonic timestamp; the wall-clock time is
+    only derived when a record is displayed.
+    """
     from_state: ResearchTaskState
     to_state: ResearchTaskState
     event: str
-    timestamp: datetime
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Approximate wall-clock time of the transition."""
+        offset_us = (self.timestamp_ns - _MONOTONIC_ANCHOR_NS) / 1000
+        return _WALL_ANCHOR + timedelta(microseconds=offset_us)
+
+    @property
+    def time_label(self) -> str:
+        """Transition time formatted as HH:MM:SS for history/error display."""
+        return self.timestamp.strftime("%H:%M:%S")
+
+
+class InvalidTransitionError(ResearchError, ValueError):
+    """
+    Structured error for a transition not listed in ALLOWED_TRANSITIONS.
+
+    Only the raw transition context is captured when raised; the message,
+    context dict and multi-line description are built on access, so callers
+    that catch and discard the error (retries, tests) pay no formatting cost.
+    """
+
+    def __init__(
+        self,
+        from_state: ResearchTaskState,
+        to_state: ResearchTaskState,
+        event: str,
+        history_tail: Tuple["StateTransitionRecord", ...],
+        valid_events: Tuple[str, ...],
+        transition_count: int,
+    ):
+        Exception.__init__(self, from_state, to_state, event)
+        self.from_state = from_state
+        self.to_state = to_state
+        self.event = event
+        self.history_tail = history_tail
+        self.valid_events = valid_events
+        self.transition_count = transition_count
+        self.code = ErrorCode.INVALID_STATE
+        self.recovery_suggestions = RECOVERY_STRATEGIES[ErrorCode.INVALID_STATE]
+        self.timestamp = datetime.now()
+        self._rendered: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        """Short human-readable description."""
+        return f"Cannot transition from {self.from_state.value} to {self.to_state.value}"
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Structured context, matching ResearchError.to_dict()."""
+        return {
+            "current_state": self.from_state.value,
+            "attempted_state": self.to_state.value,
+            "event": self.event,
+            "is_terminal": self.is_terminal,
+            "valid_events": list(self.valid_events),
+            "transition_count": self.transition_count,
+        }
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the task was already in a terminal state."""
+        return self.from_state in _TERMINAL_STATES
+
+    def __str__(self):
+        """Format detailed transition error (rendered once, then cached)."""
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
+
+    def _render(self) -> str:
+        """Build detailed transition error with history and recovery suggestions."""
+        current = self.from_state.value
+        lines = [
+            f"❌ Research Error: {self.code.value}",
+            f"   Invalid transition: {current} → {self.to_state.value} (event: {self.event})",
+            "",
+            f"Current state: {current}",
+            f"Attempted event: {self.event}",
+            f"Target state: {self.to_state.value}",
+            "",
+        ]
+
+        if self.is_terminal:
+            lines.extend([
+                f"State '{current}' is terminal - no further transitions allowed.",
+                "The task has already finished and cannot be modified.",
+            ])
+        elif self.valid_events:
+            lines.extend([
+                f"Valid events from '{current}': {', '.join(self.valid_events)}",
+                "",
+                "Allowed transitions:",
+            ])
+            allowed = ResearchTaskStateMachine._TRANSITION_TABLE[self.from_state]
+            for event_allowed, to_state_allowed in allowed.items():
+                lines.append(f"  • {event_allowed}: {current} → {to_state_allowed.value}")
+        else:
+            lines.append(f"No valid transitions from state '{current}'")
+
+        # Add recent history
+        if len(self.history_tail) > 1:
+            lines.extend([
+                "",
+                "Recent state history:",
+            ])
+            for record in self.history_tail:
+                lines.append(
+                    f"  [{record.time_label}] "
+                    f"{record.event}: {record.from_state.value} → {record.to_state.value}"
+                )
+
+        lines.extend(["", "Recovery Suggestions:"])
+        for i, suggestion in enumerate(self.recovery_suggestions, 1):
+            lines.append(f"  {i}. {suggestion}")
+
+        return "\n".join(lines)
+
+
+class TransitionHistoryView(Sequence):
+    """
+    Read-only live view over a state machine's transition history.
+
+    Returned by get_history() instead of a copy; records are immutable, so
+    the view is safe to hand out without allocating a new list per call.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Sequence):
+        self._records = records
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._records)[index]
+        return self._records[index]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator["StateTransitionRecord"]:
+        return iter(self._records)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._records)!r})"
+
+
+def _build_transition_table(
+    transitions: FrozenSet[Tuple[ResearchTaskState, ResearchTaskState, str]]
+) -> Mapping[ResearchTaskState, Mapping[str, ResearchTaskState]]:
+    """
+    Index allowed transitions as from_state -> {event: to_state}.
+
+    Every state gets an entry (empty for terminal states) so lookups never
+    need a default. Inner mappings are read-only and shared by all instances.
+    """
+    table: Dict[ResearchTaskState, Dict[str, ResearchTaskState]] = {
+        state: {} for state in ResearchTaskState
+    }
+    for from_state, to_state, event in transitions:
+        existing = table[from_state].get(event)
+        if existing is not None and existing is not to_state:
+            raise ValueError(
+                f"Ambiguous transition: event '{event}' from {from_state.value} "
+                f"leads to both {existing.value} and {to_state.value}"
+            )
+        table[from_state][event] = to_state
+
+    # Sort events so valid-event listings are stable across runs
+    return MappingProxyType({
+        state: MappingProxyType(dict(sorted(events.items())))
+        for state, events in table.items()
+    })
 
 
 class ResearchTaskStateMachine:
@@ -52,44 +247,62 @@ class ResearchTaskStateMachine:
     - Resuming from a failed state without acknowledgment
     - Double-completion of tasks
 
-    Maintains a history of all state transitions for debugging and audit purposes.
+    Maintains a bounded history of recent state transitions for debugging and
+    audit purposes.
     """
 
     # Define allowed transitions: (from_state, to_state, event)
-    ALLOWED_TRANSITIONS: Set[Tuple[ResearchTaskState, ResearchTaskState, str]] = {
+    # Event names are interned so lookups hash/compare by identity; the
+    # literals callers pass (e.g. "start") are interned by CPython too.
+    ALLOWED_TRANSITIONS: FrozenSet[Tuple[ResearchTaskState, ResearchTaskState, str]] = frozenset({
         # Pending can start
-        (ResearchTaskState.PENDING, ResearchTaskState.RUNNING, "start"),
+        (ResearchTaskState.PENDING, ResearchTaskState.RUNNING, sys.intern("start")),
 
         # Running can checkpoint, complete, or fail
-        (ResearchTaskState.RUNNING, ResearchTaskState.CHECKPOINTED, "checkpoint"),
-        (ResearchTaskState.RUNNING, ResearchTaskState.COMPLETED, "complete"),
-        (ResearchTaskState.RUNNING, ResearchTaskState.FAILED, "fail"),
+        (ResearchTaskState.RUNNING, ResearchTaskState.CHECKPOINTED, sys.intern("checkpoint")),
+        (ResearchTaskState.RUNNING, ResearchTaskState.COMPLETED, sys.intern("complete")),
+        (ResearchTaskState.RUNNING, ResearchTaskState.FAILED, sys.intern("fail")),
 
         # Checkpointed can resume or fail
-        (ResearchTaskState.CHECKPOINTED, ResearchTaskState.RUNNING, "resume"),
-        (ResearchTaskState.CHECKPOINTED, ResearchTaskState.FAILED, "fail"),
+        (ResearchTaskState.CHECKPOINTED, ResearchTaskState.RUNNING, sys.intern("resume")),
+        (ResearchTaskState.CHECKPOINTED, ResearchTaskState.FAILED, sys.intern("fail")),
 
         # Terminal states (completed/failed) are final - no transitions allowed
-    }
-
-    def __init__(self, initial_state: ResearchTaskState = ResearchTaskState.PENDING):
+    })
+
+    # Precomputed lookups derived from ALLOWED_TRANSITIONS
+    _TRANSITION_TABLE: Mapping[ResearchTaskState, Mapping[str, ResearchTaskState]] = (
+        _build_transition_table(ALLOWED_TRANSITIONS)
+    )
+    _VALID_EVENTS: Mapping[ResearchTaskState, Tuple[str, ...]] = MappingProxyType({
+        state: tuple(events) for state, events in _TRANSITION_TABLE.items()
+    })
+
+    def __init__(
+        self,
+        initial_state: ResearchTaskState = ResearchTaskState.PENDING,
+        max_history: int = 256
+    ):
         """
         Initialize state machine.
 
         Args:
             initial_state: Starting state (default: PENDING)
+            max_history: Max transition records kept; oldest are dropped (default: 256)
         """
         self.current_state = initial_state
-        self.history: List[StateTransitionRecord] = []
+        self.history: Deque[StateTransitionRecord] = deque(maxlen=max_history)
 
         # Record initial state
         self.history.append(StateTransitionRecord(
             from_state=initial_state,
             to_state=initial_state,
-            event="init",
-            timestamp=datetime.now()
+            event="init"
         ))
 
+        # Total records ever appended (history itself may drop old entries)
+        self.transition_count = 1
+
     def can_transition(self, to_state: ResearchTaskState, event: str) -> bool:
         """
         Check if transition is allowed.
@@ -101,7 +314,7 @@ class ResearchTaskStateMachine:
         Returns:
             True if transition is allowed, False otherwise
         """
-        return (self.current_state, to_state, event) in self.ALLOWED_TRANSITIONS
+        return self._TRANSITION_TABLE[self.current_state].get(event) == to_state
 
     def transition(self, to_state: ResearchTaskState, event: str):
         """
@@ -112,45 +325,39 @@ class ResearchTaskStateMachine:
             event: Event triggering the transition
 
         Raises:
-            ResearchError: If transition is invalid
+            InvalidTransitionError: If transition is invalid (a ResearchError)
 
         Example:
             state_machine.transition(ResearchTaskState.RUNNING, "start")
         """
-        if not self.can_transition(to_state, event):
-            # Get valid events for recovery suggestions
-            valid_events = self.get_valid_events()
-
-            # Build structured error
-            raise_research_error(
-                ErrorCode.INVALID_STATE,
-                f"Cannot transition from {self.current_state.value} to {to_state.value}",
-                current_state=self.current_state.value,
-                attempted_state=to_state.value,
+        if self._TRANSITION_TABLE[self.current_state].get(event) != to_state:
+            # Capture raw context only - message is formatted on demand
+            raise InvalidTransitionError(
+                from_state=self.current_state,
+                to_state=to_state,
                 event=event,
-                is_terminal=self.is_terminal(),
-                valid_events=valid_events,
-                transition_count=len(self.history)
+                history_tail=tuple(itertools.islice(
+                    self.history, max(0, len(self.history) - 5), None
+                )),
+                valid_events=self._VALID_EVENTS[self.current_state],
+                transition_count=self.transition_count,
             )
 
         # Record transition
         record = StateTransitionRecord(
             from_state=self.current_state,
             to_state=to_state,
-            event=event,
-            timestamp=datetime.now()
+            event=event
         )
         self.history.append(record)
+        self.transition_count += 1
 
         # Update current state
         self.current_state = to_state
 
     def is_terminal(self) -> bool:
         """Check if current state is terminal (completed or failed)."""
-        return self.current_state in [
-            ResearchTaskState.COMPLETED,
-            ResearchTaskState.FAILED
-        ]
+        return self.current_state in _TERMINAL_STATES
 
     def get_valid_events(self) -> List[str]:
         """
@@ -159,59 +366,11 @@ class ResearchTaskStateMachine:
         Returns:
             List of event names that can trigger valid transitions
         """
-        valid_events = []
-        for (from_state, to_state, event) in self.ALLOWED_TRANSITIONS:
-            if from_state == self.current_state:
-                valid_events.append(event)
-        return valid_events
-
-    def get_history(self) -> List[StateTransitionRecord]:
-        """Get complete state transition history."""
-        return self.history.copy()
-
-    def _build_transition_error(self, to_state: ResearchTaskState, event: str) -> str:
-        """Build detailed error message for invalid transition."""
-        valid_events = self.get_valid_events()
-
-        error_parts = [
-            f"Invalid transition: {self.current_state.value} → {to_state.value} (event: {event})",
-            "",
-            f"Current state: {self.current_state.value}",
-            f"Attempted event: {event}",
-            f"Target state: {to_state.value}",
-            "",
-        ]
-
-        if self.is_terminal():
-            error_parts.extend([
-                f"State '{self.current_state.value}' is terminal - no further transitions allowed.",
-                "The task has already finished and cannot be modified.",
-            ])
-        elif valid_events:
-            error_parts.extend([
-                f"Valid events from '{self.current_state.value}': {', '.join(valid_events)}",
-                "",
-                "Allowed transitions:",
-            ])
-            for (from_state, to_state_allowed, event_allowed) in self.ALLOWED_TRANSITIONS:
-                if from_state == self.current_state:
-                    error_parts.append(f"  • {event_allowed}: {from_state.value} → {to_state_allowed.value}")
-        else:
-            error_parts.append(f"No valid transitions from state '{self.current_state.value}'")
-
-        # Add recent history
-        if len(self.history) > 1:
-            error_parts.extend([
-                "",
-                "Recent state history:",
-            ])
-            for record in self.history[-5:]:
-                error_parts.append(
-                    f"  [{record.timestamp.strftime('%H:%M:%S')}] "
-                    f"{record.event}: {record.from_state.value} → {record.to_state.value}"
-                )
+        return list(self._VALID_EVENTS[self.current_state])
 
-        return "\n".join(error_parts)
+    def get_history(self) -> TransitionHistoryView:
+        """Get complete state transition history as a read-only view."""
+        return TransitionHistoryView(self.history)
 
 
 # Example usage and testing
@@ -249,7 +408,7 @@ def example_usage():
     try:
         # Try to restart a completed task
         state_machine.transition(ResearchTaskState.RUNNING, "start")
-    except ValueError as e:
+    except InvalidTransitionError as e:
         print(f"❌ Caught invalid transition:")
         print(f"\n{e}\n")
 
@@ -257,7 +416,7 @@ def example_usage():
     print("--- State History ---")
     for record in state_machine.get_history():
         print(
-            f"[{record.timestamp.strftime('%H:%M:%S')}] "
+            f"[{record.time_label}] "
             f"{record.event:12s}: {record.from_state.value:12s} → {record.to_state.value}"
         )
 
@@ -21,6 +21,7 @@ Features:
 """
 
 import asyncio
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 from datetime import datetime
@@ -31,6 +32,25 @@ from research_progress_tracker import ResearchProgressTracker
 from research_error_handling import ResearchErrorHandler, ErrorRecoveryStrategy
 from research_config import ResearchConfig, DEFAULT_CONFIG
 
+# Max progress events buffered ahead of a slow on_progress callback
+PROGRESS_QUEUE_SIZE = 64
+
+# Max backlogged events handed to on_progress as one "batch" event
+PROGRESS_BATCH_SIZE = 16
+
+# How long a cancelled run waits for the progress callback to take its last events
+PROGRESS_DRAIN_TIMEOUT_SEC = 1.0
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    """Execution counters for a ResumableResearchExecutor."""
+    tasks_executed: int = 0
+    tasks_resumed: int = 0
+    tasks_completed: int = 0
+    tasks_failed: int = 0
+    total_time_saved_min: float = 0
+
 
 class ResumableResearchExecutor:
     """
@@ -80,14 +100,11 @@ class ResumableResearchExecutor:
             circuit_breaker_half_open_attempts=self.config.circuit_breaker_half_open_max_calls
         )
 
+        # Checkpoint schedule ordered by target time (config is fixed for our lifetime)
+        self._checkpoint_schedule = tuple(sorted(self.config.get_checkpoint_schedule_tuples()))
+
         # Statistics
-        self.stats = {
-            "tasks_executed": 0,
-            "tasks_resumed": 0,
-            "tasks_completed": 0,
-            "tasks_failed": 0,
-            "total_time_saved_min": 0
-        }
+        self.stats = ExecutorStats()
 
     async def execute(
         self,
@@ -97,7 +114,8 @@ class ResumableResearchExecutor:
         estimated_duration_sec: int = 3600,
         research_func: Optional[Callable] = None,
         fallback_func: Optional[Callable] = None,
-        on_progress: Optional[Callable] = None
+        on_progress: Optional[Callable] = None,
+        resume_prompt: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute research with full resumability.
@@ -109,24 +127,33 @@ class ResumableResearchExecutor:
             estimated_duration_sec: Estimated duration (default: 3600 = 60 min)
             research_func: Async function to execute research
             fallback_func: Optional fallback function if primary fails
-            on_progress: Optional progress callback
+            on_progress: Optional async callback(event_type, data) for
+                "checkpoint", "retry" and "error" (cancellation) events, run on
+                a background consumer.
+                Events that back up behind a slow callback arrive together as
+                ("batch", {"events": [(event_type, data), ...]})
+            resume_prompt: Resume prompt already rendered by the caller for the
+                current checkpoint; built from the checkpoint if not given
 
         Returns:
-            Research results dictionary
+            Research results dictionary. A result with "success": False from
+            research_func is counted as failed and returned as-is, without raising.
 
         Raises:
             Exception: If research fails after all retries
+            asyncio.CancelledError: If cancelled; the progress file is marked
+                failed and any checkpoint is kept for resume
         """
-        self.stats["tasks_executed"] += 1
+        self.stats.tasks_executed += 1
 
         # Check for existing checkpoint
         checkpoint = self.checkpoint_mgr.load_research_checkpoint(task_name)
         resumed = False
 
         if checkpoint and self.auto_resume:
-            # Check if should auto-resume
-            should_resume = self.resume_helper.should_auto_resume(
-                task_name,
+            # Check if should auto-resume (reuses the checkpoint loaded above)
+            should_resume, estimate = self.resume_helper.decide(
+                checkpoint,
                 max_age_hours=self.max_checkpoint_age_hours
             )
 
@@ -135,13 +162,12 @@ class ResumableResearchExecutor:
                 print(f"   Time saved: {checkpoint['progress_pct'] * estimated_duration_sec / 100 / 60:.0f} minutes")
 
                 # Update query with resume prompt
-                query = self.checkpoint_mgr.build_resume_prompt(task_name, checkpoint)
+                query = resume_prompt or self.checkpoint_mgr.build_resume_prompt(task_name, checkpoint)
                 resumed = True
-                self.stats["tasks_resumed"] += 1
+                self.stats.tasks_resumed += 1
 
                 # Update stats
-                estimate = self.checkpoint_mgr.get_resume_estimate(checkpoint)
-                self.stats["total_time_saved_min"] += estimate["time_saved_min"]
+                self.stats.total_time_saved_min += estimate["time_saved_min"]
 
         # Create progress tracker
         task_id = f"{provider}-{task_name}-{int(datetime.now().timestamp())}"
@@ -171,21 +197,41 @@ class ResumableResearchExecutor:
                 on_progress=on_progress
             )
 
+            if isinstance(result, dict) and result.get("success") is False:
+                # Failure reported as a status result (research lookups return
+                # {"success": False, "error": ...}) - record it like a raised
+                # error but hand the result back instead of raising. The
+                # checkpoint is kept for a later resume.
+                error = result.get("error") or "Research failed"
+                await tracker.fail(
+                    error,
+                    error_type=self.error_handler.classify_error(Exception(error)).value
+                )
+                self.stats.tasks_failed += 1
+                return result
+
             # Mark complete
             await tracker.complete(results=result)
 
             # Clean up checkpoint on success
             self.checkpoint_mgr.delete_checkpoint(task_name)
 
-            self.stats["tasks_completed"] += 1
+            self.stats.tasks_completed += 1
 
             return result
 
+        except asyncio.CancelledError:
+            # CancelledError is not an Exception: record it explicitly so the
+            # progress file doesn't stay "running" after the caller gives up.
+            # The checkpoint is kept so the task can be resumed later.
+            await tracker.fail("Research cancelled", error_type="cancelled")
+            raise
+
         except Exception as e:
             # Mark failed
             await tracker.fail(str(e), error_type=self.error_handler.classify_error(e).value)
 
-            self.stats["tasks_failed"] += 1
+            self.stats.tasks_failed += 1
 
             raise
 
@@ -202,56 +248,71 @@ class ResumableResearchExecutor:
         """
         Execute research with checkpoint saves during execution.
 
-        This is the core execution loop that periodically checks if
-        checkpoints should be created.
+        This is the core execution loop; a background task sleeps until
+        each scheduled checkpoint time and saves it exactly once.
         """
-        start_time = datetime.now()
-
-        # Get checkpoint schedule from config
-        checkpoint_schedule = self.config.get_checkpoint_schedule_tuples()
-
-        last_checkpoint_time = 0
-
-        # Create checkpoint save task that runs periodically
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+
+        # Progress events go through a bounded queue so a slow callback
+        # (console, websocket) never delays checkpoint saves or retries
+        events: Optional[asyncio.Queue] = None
+        consumer: Optional[asyncio.Task] = None
+        if on_progress:
+            events = asyncio.Queue(maxsize=PROGRESS_QUEUE_SIZE)
+            consumer = asyncio.create_task(self._drain_progress_events(events, on_progress))
+
+        async def emit(event_type: str, data: Dict[str, Any]):
+            if events is not None:
+                await events.put((event_type, data))
+
+        async def finish_progress(*final_events):
+            # Queue the last events and the sentinel, then wait for delivery
+            for event in final_events:
+                await events.put(event)
+            await events.put(None)
+            await consumer
+
+        # Create checkpoint save task that sleeps until each scheduled checkpoint
         async def checkpoint_saver():
-            nonlocal last_checkpoint_time
-
-            while True:
-                # Use configured check interval
-                await asyncio.sleep(self.config.checkpoint_check_interval_sec)
-
-                elapsed = (datetime.now() - start_time).total_seconds()
-
-                # Check if we should create a checkpoint
-                for target_time, progress_pct, phase, resumable in checkpoint_schedule:
-                    if abs(elapsed - target_time) < 60 and elapsed > last_checkpoint_time:
-                        # Time to checkpoint!
-                        print(f"💾 Checkpoint: {phase} ({progress_pct}%)")
-
-                        # Update progress tracker
-                        await tracker.update(
-                            phase=phase,
-                            action=f"Checkpoint: {phase}",
-                            progress_pct=progress_pct,
-                            save_checkpoint=True
-                        )
-
-                        # Save research checkpoint (now async with atomic writes)
-                        await self.checkpoint_mgr.save_research_checkpoint(
-                            task_name=task_name,
-                            query=query,
-                            partial_results={"phase": phase, "progress_pct": progress_pct},
-                            sources_collected=[],  # NOTE: Sources unavailable during execution - only known at completion
-                            progress_pct=progress_pct,
-                            resumable=resumable,
-                            metadata={"elapsed_sec": elapsed}
-                        )
-
-                        last_checkpoint_time = elapsed
-                        break
+            for target_time, progress_pct, phase, resumable in self._checkpoint_schedule:
+                await asyncio.sleep(max(0, target_time - (loop.time() - start_time)))
+
+                elapsed = loop.time() - start_time
+
+                # Time to checkpoint!
+                print(f"💾 Checkpoint: {phase} ({progress_pct}%)")
+
+                # Update progress file and save research checkpoint together -
+                # they write separate files, so neither waits on the other
+                await asyncio.gather(
+                    tracker.update(
+                        phase=phase,
+                        action=f"Checkpoint: {phase}",
+                        progress_pct=progress_pct,
+                        save_checkpoint=True
+                    ),
+                    self.checkpoint_mgr.save_research_checkpoint(
+                        task_name=task_name,
+                        query=query,
+                        partial_results={"phase": phase, "progress_pct": progress_pct},
+                        sources_collected=[],  # NOTE: Sources unavailable during execution - only known at completion
+                        progress_pct=progress_pct,
+                        resumable=resumable,
+                        metadata={"elapsed_sec": elapsed}
+                    )
+                )
+
+                await emit("checkpoint", {
+                    "task_name": task_name,
+                    "phase": phase,
+                    "progress_pct": progress_pct,
+                    "elapsed_sec": elapsed
+                })
 
         # Start checkpoint saver task
         checkpoint_task = asyncio.create_task(checkpoint_saver())
+        cancelled = False
 
         try:
             # Execute research with error handling
@@ -269,7 +330,7 @@ class ResumableResearchExecutor:
                     # Execute with retry only
                     result = await self.error_handler.retry_with_backoff(
                         research_func,
-                        on_retry=self._create_retry_callback(tracker)
+                        on_retry=self._create_retry_callback(tracker, emit)
                     )
             else:
                 # Default behavior: simulate research
@@ -277,6 +338,10 @@ class ResumableResearchExecutor:
 
             return result
 
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
         finally:
             # Cancel checkpoint saver
             checkpoint_task.cancel()
@@ -285,6 +350,62 @@ class ResumableResearchExecutor:
             except asyncio.CancelledError:
                 pass
 
+            # Let the consumer deliver everything already queued, then stop
+            if consumer is not None:
+                try:
+                    if cancelled:
+                        # Report the cancellation, but a stuck callback (or a
+                        # full queue) must not hold the caller up
+                        try:
+                            await asyncio.wait_for(
+                                finish_progress(("error", {"task_name": task_name, "error": "cancelled"})),
+                                PROGRESS_DRAIN_TIMEOUT_SEC
+                            )
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await finish_progress()
+                finally:
+                    # Cancelled again while draining - don't leave the consumer running
+                    if not consumer.done():
+                        consumer.cancel()
+                        await asyncio.wait([consumer])
+
+    async def _drain_progress_events(self, events: asyncio.Queue, on_progress: Callable):
+        """
+        Deliver queued progress events to the callback until the None sentinel.
+
+        Whatever has queued up while the callback was busy is delivered as a
+        single "batch" event, so a lagging UI pays one call per backlog rather
+        than one per event.
+
+        Args:
+            events: Queue of (event_type, data) tuples, terminated by None
+            on_progress: Async callback invoked as on_progress(event_type, data)
+        """
+        while True:
+            batch = [await events.get()]
+            while len(batch) < PROGRESS_BATCH_SIZE and not events.empty():
+                batch.append(events.get_nowait())
+
+            # The sentinel is always the last item put on the queue
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+
+            if batch:
+                try:
+                    if len(batch) == 1:
+                        await on_progress(*batch[0])
+                    else:
+                        await on_progress("batch", {"events": batch})
+                except Exception as e:
+                    # A broken UI callback must not stall the producer on a full queue
+                    print(f"⚠️  Progress callback failed: {e}")
+
+            if done:
+                return
+
     async def _simulate_research(self, query: str, duration_sec: int) -> Dict[str, Any]:
         """
         Simulate research for testing purposes.
@@ -303,8 +424,12 @@ class ResumableResearchExecutor:
             "simulated": True
         }
 
-    def _create_retry_callback(self, tracker: ResearchProgressTracker) -> Callable:
-        """Create a retry callback that updates progress."""
+    def _create_retry_callback(
+        self,
+        tracker: ResearchProgressTracker,
+        emit: Optional[Callable] = None
+    ) -> Callable:
+        """Create a retry callback that updates progress and emits a retry event."""
         async def on_retry(attempt, max_retries, delay, error_type, error_msg):
             print(f"  ⚠️  Retry {attempt}/{max_retries} after {delay:.1f}s")
             print(f"      Error: {error_msg[:80]}")
@@ -317,11 +442,19 @@ class ResumableResearchExecutor:
                 metadata={"error_type": error_type, "attempt": attempt}
             )
 
+            if emit:
+                await emit("retry", {
+                    "attempt": attempt,
+                    "max_retries": max_retries,
+                    "delay_sec": delay,
+                    "error_type": error_type
+                })
+
         return on_retry
 
     def get_stats(self) -> Dict[str, Any]:
         """Get execution statistics."""
-        return self.stats.copy()
+        return asdict(self.stats)
 
     def print_resume_summary(self):
         """Print summary of resumable tasks."""
@@ -16,24 +16,122 @@ Examples:
     # Resume specific task
     python scripts/resume-research.py planning_outputs/20260115_143022_my-project 1 --task competitive-analysis
 
+    # Resume several tasks concurrently
+    python scripts/resume-research.py planning_outputs/20260115_143022_my-project 1 --task competitive-analysis market-sizing
+
     # Resume with specific provider (override auto-detection)
     python scripts/resume-research.py planning_outputs/20260115_143022_my-project 1 --task market-sizing --provider perplexity_sonar
 """
 
 import argparse
-import asyncio
+import os
 import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from research_checkpoint_manager import ResearchCheckpointManager, ResearchResumeHelper
-from resumable_research import ResumableResearchExecutor
-from research_errors import raise_research_error, ErrorCode, ResearchError
+# The research stack (asyncio, checkpoint manager, executor, errors) is
+# imported inside the functions that need it so --help and argument
+# validation errors exit without loading it.
+
+# Banner and section rules for console output
+BANNER = "=" * 70
+RULE = "-" * 70
+
+# Checkpoint location inside a project folder (ResearchCheckpointManager layout)
+CHECKPOINT_SUBDIR = Path(".state") / "research_checkpoints"
+
+# Checkpoints older than this need confirmation (or --force) to resume
+STALE_CHECKPOINT_HOURS = 168  # 7 days
+
+# Delay for the simulated research fallback (set RESUME_SIMULATE_SLEEP=0 in tests)
+SIMULATE_SLEEP_SEC = float(os.environ.get("RESUME_SIMULATE_SLEEP", "2"))
+
+def _run_in_daemon_thread(func, *args):
+    """
+    Run a blocking call on a daemon thread and return an awaitable future.
+
+    Unlike an executor worker, a daemon thread is not joined at interpreter
+    exit, so an input() abandoned after a timeout can't hold up shutdown.
+
+    Args:
+        func: Blocking callable
+        *args: Arguments for func
+
+    Returns:
+        asyncio.Future resolved with func's result (or exception)
+    """
+    import asyncio
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        if future.done():
+            return  # Caller gave up (timeout)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run():
+        result = error = None
+        try:
+            result = func(*args)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # Loop already closed - nobody is waiting
+
+    threading.Thread(target=run, name="prompt", daemon=True).start()
+    return future
+
+
+# ResearchLookup class per search directory (None if unavailable), resolved once
+_RESEARCH_LOOKUP_CLASSES = {}
+
+
+def _load_research_lookup(search_dir: Path):
+    """
+    Resolve the ResearchLookup class from a research-lookup scripts directory.
+
+    Uses an explicit path finder instead of growing sys.path, and remembers
+    the result so repeated resumes don't go through the import system again.
+
+    Args:
+        search_dir: Directory expected to contain research_lookup.py
+
+    Returns:
+        ResearchLookup class, or None if it cannot be imported
+    """
+    key = str(search_dir)
+    if key in _RESEARCH_LOOKUP_CLASSES:
+        return _RESEARCH_LOOKUP_CLASSES[key]
+
+    import importlib.machinery
+    import importlib.util
+
+    research_lookup_cls = None
+    module = sys.modules.get("research_lookup")
+    if module is None:
+        spec = importlib.machinery.PathFinder.find_spec("research_lookup", [key])
+        if spec is not None:
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+                sys.modules["research_lookup"] = module
+            except ImportError:
+                module = None
+    if module is not None:
+        research_lookup_cls = getattr(module, "ResearchLookup", None)
+
+    _RESEARCH_LOOKUP_CLASSES[key] = research_lookup_cls
+    return research_lookup_cls
 
 
 async def prompt_with_timeout(message: str, timeout_sec: int = 30) -> bool:
@@ -52,84 +150,324 @@ async def prompt_with_timeout(message: str, timeout_sec: int = 30) -> bool:
         - Returns False if timeout expires
         - Safe for use in CI/CD pipelines and automated environments
     """
+    import asyncio
+
     # Check if stdin is a TTY
     if not sys.stdin.isatty():
         print(f"⚠️  Non-interactive session detected, assuming 'no'")
         return False
 
     try:
-        # Run input() in thread pool to avoid blocking event loop
-        with ThreadPoolExecutor() as pool:
-            response = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    pool, input, message
-                ),
-                timeout=timeout_sec
-            )
-            return response.lower() == 'y'
+        # Read the answer on a daemon thread to avoid blocking the event loop
+        response = await asyncio.wait_for(
+            _run_in_daemon_thread(_read_confirmation_key, message, timeout_sec),
+            timeout=timeout_sec
+        )
     except asyncio.TimeoutError:
+        response = None
+
+    if response is None:
         print(f"\n⏱  Timeout after {timeout_sec}s, assuming 'no'")
         return False
+    return response.lower() == 'y'
+
+
+def _read_confirmation_key(message: str, timeout_sec: float) -> Optional[str]:
+    """
+    Show a prompt and read a single keypress (no Enter needed).
+
+    Uses cbreak mode on POSIX terminals and msvcrt on Windows, falling back
+    to input() when neither is usable. Blocking - run it off the event loop.
+
+    Args:
+        message: Prompt message
+        timeout_sec: Seconds to wait for a key (single-key paths only)
+
+    Returns:
+        The key (or line, for the input() fallback), or None on timeout
+    """
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+    if msvcrt is not None:
+        import time
+
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        deadline = time.monotonic() + timeout_sec
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                key = msvcrt.getwch()
+                print(key)
+                return key
+            time.sleep(0.05)
+        return None
+
+    try:
+        import select
+        import termios
+        import tty
+    except ImportError:
+        return input(message)
+
+    try:
+        fd = sys.stdin.fileno()
+        saved_attrs = termios.tcgetattr(fd)
+    except (OSError, ValueError, termios.error):
+        # Not a cbreak-capable terminal
+        return input(message)
+
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    try:
+        tty.setcbreak(fd)
+        ready, _, _ = select.select([fd], [], [], timeout_sec)
+        if not ready:
+            return None
+        key = os.read(fd, 1).decode(errors="ignore")
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved_attrs)
+
+    print(key)
+    return key
+
+
+def has_phase_checkpoints(project_folder: Path, phase_num: int) -> bool:
+    """
+    Cheaply check whether any checkpoint file exists for a phase.
+
+    Lets the CLI report "nothing to resume" without importing the research
+    stack or creating the manager's state directories.
+
+    Args:
+        project_folder: Path to project output folder
+        phase_num: Phase number to check
+
+    Returns:
+        True if at least one phase{n}_*.json checkpoint exists
+    """
+    prefix = f"phase{phase_num}_"
+    try:
+        with os.scandir(project_folder / CHECKPOINT_SUBDIR) as entries:
+            return any(
+                entry.name.startswith(prefix) and entry.name.endswith(".json")
+                for entry in entries
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _no_resumable_tasks_lines(phase_num: int) -> List[str]:
+    """Lines of the "nothing to resume" listing."""
+    return [
+        "\n" + BANNER,
+        f"NO RESUMABLE RESEARCH TASKS FOUND (Phase {phase_num})",
+        BANNER,
+        "\nAll research tasks have been completed or checkpoints are too old.",
+        "Run a new /full-plan or /tech-plan to start fresh research.",
+    ]
+
+
+def _missing_checkpoint_lines(project_folder: Path, phase_num: int, task_name: str) -> List[str]:
+    """Lines of the error shown when a task has no checkpoint."""
+    return [
+        f"\n❌ Error: No checkpoint found for task '{task_name}'",
+        f"\nRun with --list to see available resumable tasks:",
+        f"  python scripts/resume-research.py {project_folder} {phase_num} --list",
+    ]
 
 
-def list_resumable_tasks(project_folder: Path, phase_num: int):
+def write_json_listing(resumable: List[dict]):
+    """
+    Write resumable task summaries to stdout as one JSON array.
+
+    Args:
+        resumable: Task summaries from ResearchResumeHelper
+    """
+    from research_json import json_dumps_bytes
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(json_dumps_bytes(resumable) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def list_resumable_tasks(
+    project_folder: Path,
+    phase_num: int,
+    use_cache: bool = True,
+    as_json: bool = False
+):
     """
     List all resumable research tasks.
 
     Args:
         project_folder: Path to project output folder
         phase_num: Phase number to check
+        use_cache: Reuse parsed checkpoints while files are unchanged (default: True)
+        as_json: Write the task summaries as JSON instead of the report (default: False)
     """
+    import asyncio
+
+    return asyncio.run(list_resumable_tasks_async(
+        project_folder, phase_num, use_cache=use_cache, as_json=as_json
+    ))
+
+
+async def list_resumable_tasks_async(
+    project_folder: Path,
+    phase_num: int,
+    use_cache: bool = True,
+    as_json: bool = False
+):
+    """
+    List all resumable research tasks, loading checkpoints concurrently.
+
+    Args:
+        project_folder: Path to project output folder
+        phase_num: Phase number to check
+        use_cache: Reuse parsed checkpoints while files are unchanged (default: True)
+        as_json: Write the task summaries as JSON instead of the report (default: False)
+    """
+    from research_checkpoint_manager import ResearchCheckpointManager, ResearchResumeHelper
+
     manager = ResearchCheckpointManager(project_folder, phase_num)
     helper = ResearchResumeHelper(manager)
 
-    resumable = helper.find_resumable_tasks()
+    resumable = await helper.find_resumable_tasks_async(use_cache=use_cache)
+
+    if as_json:
+        write_json_listing(resumable)
+        return 0
+
+    # Build the whole listing and write it once
+    parts = []
 
     if not resumable:
-        print(f"\n{'='*70}")
-        print(f"NO RESUMABLE RESEARCH TASKS FOUND (Phase {phase_num})")
-        print("="*70)
-        print("\nAll research tasks have been completed or checkpoints are too old.")
-        print("Run a new /full-plan or /tech-plan to start fresh research.")
+        parts.extend(_no_resumable_tasks_lines(phase_num))
+        sys.stdout.write("\n".join(parts) + "\n")
         return 0
 
-    print(f"\n{'='*70}")
-    print(f"RESUMABLE RESEARCH TASKS (Phase {phase_num})")
-    print("="*70)
+    parts.extend([
+        "\n" + BANNER,
+        f"RESUMABLE RESEARCH TASKS (Phase {phase_num})",
+        BANNER,
+    ])
 
     for i, task in enumerate(resumable, 1):
         status = "✅ Resumable" if task["resumable"] else "❌ Not resumable"
         age_hours = task.get("checkpoint_age_hours", 0)
         age_str = f"{age_hours:.1f} hours" if age_hours < 24 else f"{age_hours/24:.1f} days"
 
-        print(f"\n{i}. {status} - {task['task_name']}")
-        print(f"   Progress: {task['progress_pct']:.0f}%")
-        print(f"   Created: {task['created_at']}")
-        print(f"   Age: {age_str}")
-        print(f"   Time invested: ~{task.get('time_invested_min', 0)} minutes")
-        print(f"   Time saved by resuming: ~{task.get('time_saved_min', 0)} minutes")
-        print(f"   Estimated time remaining: ~{task.get('time_remaining_min', 0)} minutes")
-        print(f"   Sources collected: {task.get('source_count', 0)}")
+        parts.extend([
+            f"\n{i}. {status} - {task['task_name']}",
+            f"   Progress: {task['progress_pct']:.0f}%",
+            f"   Created: {task['created_at']}",
+            f"   Age: {age_str}",
+            f"   Time invested: ~{task.get('time_invested_min', 0)} minutes",
+            f"   Time saved by resuming: ~{task.get('time_saved_min', 0)} minutes",
+            f"   Estimated time remaining: ~{task.get('time_remaining_min', 0)} minutes",
+            f"   Sources collected: {task.get('source_count', 0)}",
+        ])
 
         # Warn if checkpoint is old
         if age_hours > 24:
-            print(f"   ⚠️  Warning: Checkpoint is {age_str} old. Consider starting fresh.")
-
-    print(f"\n{'='*70}")
-    print("TO RESUME A TASK:")
-    print(f"  python scripts/resume-research.py {project_folder} {phase_num} --task <task_name>")
-    print("\nExample:")
-    print(f"  python scripts/resume-research.py {project_folder} {phase_num} --task {resumable[0]['task_name']}")
-    print("="*70)
+            parts.append(f"   ⚠️  Warning: Checkpoint is {age_str} old. Consider starting fresh.")
+
+    parts.extend([
+        "\n" + BANNER,
+        "TO RESUME A TASK:",
+        f"  python scripts/resume-research.py {project_folder} {phase_num} --task <task_name>",
+        "\nExample:",
+        f"  python scripts/resume-research.py {project_folder} {phase_num} --task {resumable[0]['task_name']}",
+        BANNER,
+    ])
+    sys.stdout.write("\n".join(parts) + "\n")
 
     return 0
 
 
+def load_or_build_resume_prompt(manager, task_name: str, checkpoint: dict, use_cache: bool = True) -> str:
+    """
+    Return the resume prompt for a checkpoint, reusing a cached render when possible.
+
+    The rendered prompt is stored under .state/resume_prompt_cache/ keyed by the
+    checkpoint file's mtime, so it is rebuilt whenever the checkpoint changes.
+    delete_checkpoint() removes it together with the checkpoint.
+
+    Args:
+        manager: ResearchCheckpointManager for the task's phase
+        task_name: Task name to resume
+        checkpoint: Loaded checkpoint data
+        use_cache: Reuse/store the rendered prompt on disk (default: True)
+
+    Returns:
+        Resume prompt text (empty if it could not be built)
+    """
+    if not use_cache:
+        return manager.build_resume_prompt(task_name, checkpoint)
+
+    try:
+        mtime_ns = manager.get_checkpoint_file(task_name).stat().st_mtime_ns
+    except OSError:
+        return manager.build_resume_prompt(task_name, checkpoint)
+
+    cache_path = manager.get_resume_prompt_cache_file(task_name, mtime_ns)
+
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    resume_prompt = manager.build_resume_prompt(task_name, checkpoint)
+    if not resume_prompt:
+        return resume_prompt
+
+    try:
+        manager.resume_prompt_cache_dir.mkdir(parents=True, exist_ok=True)
+        # Drop renders of older versions of this checkpoint
+        manager.clear_resume_prompt_cache(task_name)
+        temp_path = cache_path.with_suffix(".tmp")
+        temp_path.write_text(resume_prompt, encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Cache is best-effort; the prompt is already built
+        pass
+
+    return resume_prompt
+
+
+async def confirm_stale_resume(task_name: str, age_hours: float) -> bool:
+    """
+    Warn about a stale checkpoint and ask whether to resume it anyway.
+
+    Args:
+        task_name: Task the checkpoint belongs to (named in the prompt)
+        age_hours: Checkpoint age in hours
+
+    Returns:
+        True if the user confirmed the resume
+    """
+    print(f"\n⚠️  Warning: Checkpoint for '{task_name}' is {age_hours/24:.1f} days old")
+    print(f"   Consider starting fresh instead of resuming.")
+    should_continue = await prompt_with_timeout(
+        f"\nContinue resuming '{task_name}'? (y/N): ",
+        timeout_sec=30
+    )
+    if not should_continue:
+        print(f"Resume of '{task_name}' cancelled.")
+    return should_continue
+
+
 async def resume_research_task(
     project_folder: Path,
     phase_num: int,
     task_name: str,
-    provider: Optional[str] = None
+    provider: Optional[str] = None,
+    use_prompt_cache: bool = True,
+    force: bool = False,
+    confirmed: bool = False
 ):
     """
     Resume a specific research task from checkpoint.
@@ -139,17 +477,23 @@ async def resume_research_task(
         phase_num: Phase number
         task_name: Task name to resume
         provider: Optional provider override
+        use_prompt_cache: Reuse the rendered resume prompt for an unchanged checkpoint (default: True)
+        force: Resume even if the checkpoint is stale (default: False)
+        confirmed: The user already confirmed resuming a stale checkpoint (default: False)
 
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    import asyncio
+    from research_checkpoint_manager import ResearchCheckpointManager
+    from resumable_research import ResumableResearchExecutor
+    from research_errors import ResearchError
+
     manager = ResearchCheckpointManager(project_folder, phase_num)
     checkpoint = manager.load_research_checkpoint(task_name)
 
     if not checkpoint:
-        print(f"\n❌ Error: No checkpoint found for task '{task_name}'")
-        print(f"\nRun with --list to see available resumable tasks:")
-        print(f"  python scripts/resume-research.py {project_folder} {phase_num} --list")
+        sys.stdout.write("\n".join(_missing_checkpoint_lines(project_folder, phase_num, task_name)) + "\n")
         return 1
 
     if not checkpoint.get("resumable", True):
@@ -159,47 +503,50 @@ async def resume_research_task(
         print(f"\nIt's faster to restart this task than to resume from this point.")
         return 1
 
+    # Estimate time remaining (also computes checkpoint age from created_at)
+    estimate = manager.get_resume_estimate(checkpoint)
+
     # Check age
-    created_at = datetime.fromisoformat(checkpoint["created_at"])
-    age_hours = (datetime.now() - created_at).total_seconds() / 3600
-
-    if age_hours > 168:  # 7 days
-        print(f"\n⚠️  Warning: Checkpoint is {age_hours/24:.1f} days old")
-        print(f"   Consider starting fresh instead of resuming.")
-        should_continue = await prompt_with_timeout(
-            "\nContinue with resume? (y/N): ",
-            timeout_sec=30
-        )
-        if not should_continue:
-            print("Resume cancelled.")
-            return 1
+    age_hours = estimate["checkpoint_age_hours"]
 
-    # Display resume information
-    print(f"\n{'='*70}")
-    print(f"RESUMING RESEARCH TASK: {task_name}")
-    print("="*70)
-    print(f"Original query: {checkpoint['query'][:80]}...")
-    print(f"Progress: {checkpoint['progress_pct']:.0f}%")
-    print(f"Time invested: ~{checkpoint['progress_pct'] * 60 / 100:.0f} minutes")
-    print(f"Sources collected: {checkpoint['metadata']['source_count']}")
-    print(f"Checkpoint age: {age_hours:.1f} hours")
-
-    # Estimate time remaining
-    estimate = manager.get_resume_estimate(checkpoint)
-    print(f"\nEstimated time remaining: ~{estimate['time_remaining_min']} minutes")
-    print(f"Time saved by resuming: ~{estimate['time_saved_min']} minutes")
+    stale = age_hours > STALE_CHECKPOINT_HOURS
+
+    if stale and not force and not sys.stdin.isatty():
+        # Nobody can answer the confirmation prompt - stop before any more work
+        print(f"\n❌ Error: Checkpoint is {age_hours/24:.1f} days old; re-run with --force to resume non-interactively")
+        return 1
+
+    if stale and force:
+        print(f"\n⚠️  Warning: Checkpoint is {age_hours/24:.1f} days old (resuming anyway: --force)")
+    elif stale and not confirmed:
+        if not await confirm_stale_resume(task_name, age_hours):
+            return 1
 
     # Determine provider
     if provider is None:
         # Auto-detect from checkpoint or default to perplexity
         provider = "perplexity_sonar"  # Safe default
-        print(f"\nProvider: {provider} (auto-detected)")
+        provider_line = f"\nProvider: {provider} (auto-detected)"
     else:
-        print(f"\nProvider: {provider} (user-specified)")
-
-    print("\n" + "="*70)
-    print("STARTING RESUME...")
-    print("="*70 + "\n")
+        provider_line = f"\nProvider: {provider} (user-specified)"
+
+    # Display resume information in a single write
+    sys.stdout.write("\n".join([
+        "\n" + BANNER,
+        f"RESUMING RESEARCH TASK: {task_name}",
+        BANNER,
+        f"Original query: {checkpoint['query'][:80]}...",
+        f"Progress: {checkpoint['progress_pct']:.0f}%",
+        f"Time invested: ~{checkpoint['progress_pct'] * 60 / 100:.0f} minutes",
+        f"Sources collected: {checkpoint['metadata']['source_count']}",
+        f"Checkpoint age: {age_hours:.1f} hours",
+        f"\nEstimated time remaining: ~{estimate['time_remaining_min']} minutes",
+        f"Time saved by resuming: ~{estimate['time_saved_min']} minutes",
+        provider_line,
+        "\n" + BANNER,
+        "STARTING RESUME...",
+        BANNER + "\n",
+    ]) + "\n")
 
     # Create executor and resume
     executor = ResumableResearchExecutor(
@@ -211,36 +558,39 @@ async def resume_research_task(
     try:
         print(f"🔄 Loading checkpoint and building resume prompt...")
 
-        resume_prompt = manager.build_resume_prompt(task_name, checkpoint)
-        if not resume_prompt:
+        # Only the preview is rendered here; the full prompt is built once we execute
+        resume_preview = manager.build_resume_prompt_preview(task_name, checkpoint, max_chars=500)
+        if not resume_preview:
             print(f"❌ Error: Could not build resume prompt")
             return 1
 
-        print(f"✅ Resume prompt built successfully")
+        print(f"✅ Resume context loaded")
         print(f"\n📝 Resume Context (first 500 chars):")
-        print("-" * 70)
-        print(resume_prompt[:500] + "...")
-        print("-" * 70)
+        print(RULE)
+        print(resume_preview + "...")
+        print(RULE)
+
+        # Resolve the real research provider once, not on every attempt
+        ResearchLookup = _load_research_lookup(
+            project_folder.parent / "project_planner" / ".claude" / "skills" / "research-lookup" / "scripts"
+        )
 
         # Create research function (with fallback to simulation)
         async def resume_research_func():
             """Execute research using resume prompt."""
-            # Try to import and use real research provider
-            try:
-                sys.path.insert(0, str(project_folder.parent / "project_planner" / ".claude" / "skills" / "research-lookup" / "scripts"))
-                from research_lookup import ResearchLookup
-
+            if ResearchLookup is not None:
                 print(f"\n✅ Using real research provider")
                 lookup = ResearchLookup(research_mode="perplexity")
-                result = lookup.lookup(resume_prompt)
-                return result
-            except ImportError:
+                # lookup() blocks on the network - keep the loop free for the
+                # other resumed tasks and the checkpoint saver
+                return await asyncio.to_thread(lookup.lookup, resume_prompt)
+            else:
                 # Fallback to simulation
                 print(f"\n⚠️  Research provider not available - using simulation")
                 print(f"   (In production, this would call the actual research API)")
 
                 # Simulate research with some delay
-                await asyncio.sleep(2)
+                await asyncio.sleep(SIMULATE_SLEEP_SEC)
 
                 return {
                     "provider": "simulated",
@@ -252,9 +602,13 @@ async def resume_research_task(
                     "success": True
                 }
 
-        print(f"\n{'='*70}")
+        print("\n" + BANNER)
         print("EXECUTING RESUME...")
-        print("="*70)
+        print(BANNER)
+
+        resume_prompt = load_or_build_resume_prompt(
+            manager, task_name, checkpoint, use_cache=use_prompt_cache
+        )
 
         # Execute with resumable executor
         result = await executor.execute(
@@ -263,7 +617,8 @@ async def resume_research_task(
             provider=provider,
             estimated_duration_sec=estimate['time_remaining_min'] * 60,
             research_func=resume_research_func,
-            fallback_func=None  # Already handled in research_func
+            fallback_func=None,  # Already handled in research_func
+            resume_prompt=resume_prompt  # Don't let the executor render it again
         )
 
         # Merge checkpoint results with new results
@@ -278,12 +633,19 @@ async def resume_research_task(
             'provider': result.get('provider', provider) if isinstance(result, dict) else provider
         }
 
-        # Verify that resume actually continued (not restarted)
-        verification = manager.verify_resume_continuation(task_name, merged_result)
+        # Verify that resume actually continued (not restarted). The executor
+        # deletes the checkpoint on success, so pass the one loaded above.
+        verification = manager.verify_resume_continuation(
+            task_name,
+            merged_result,
+            checkpoint=checkpoint,
+            old_urls=manager.source_keys(merged_result['sources_from_checkpoint']),
+            new_urls=manager.source_keys(merged_result['sources_from_resume'])
+        )
 
-        print(f"\n{'='*70}")
+        print("\n" + BANNER)
         print("✅ RESUME COMPLETED SUCCESSFULLY")
-        print("="*70)
+        print(BANNER)
         print(f"Provider: {merged_result['provider']}")
         print(f"Total sources: {len(merged_result['sources_from_checkpoint']) + len(merged_result['sources_from_resume'])}")
         print(f"  - From checkpoint: {len(merged_result['sources_from_checkpoint'])}")
@@ -302,7 +664,7 @@ async def resume_research_task(
             if 'overlap_pct' in verification:
                 print(f"  📊 Source overlap: {verification['overlap_pct']:.1f}%")
 
-        print("="*70)
+        print(BANNER)
 
         return 0
 
@@ -322,6 +684,80 @@ async def resume_research_task(
         return 1
 
 
+def run_resume_tasks(
+    project_folder: Path,
+    phase_num: int,
+    task_names: List[str],
+    **kwargs
+) -> Tuple[int, ...]:
+    """
+    Resume one or more tasks concurrently on a single event loop.
+
+    Stale checkpoints are confirmed first, one prompt at a time in the order
+    given (concurrent prompts would race for the same stdin); only the tasks
+    that aren't declined are then resumed together.
+
+    Uses uvloop when installed (pip install project-planner[performance]).
+
+    Args:
+        project_folder: Path to project output folder
+        phase_num: Phase number
+        task_names: Task names to resume
+        **kwargs: Passed through to resume_research_task
+
+    Returns:
+        Exit code per task, in the order given
+    """
+    import asyncio
+
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+
+    async def resume_all():
+        exit_codes = {}
+        confirmed = set()
+        if not kwargs.get("force") and sys.stdin.isatty():
+            from research_checkpoint_manager import ResearchCheckpointManager
+
+            manager = ResearchCheckpointManager(project_folder, phase_num)
+            for task_name in task_names:
+                checkpoint = manager.load_research_checkpoint(task_name)
+                if not checkpoint or not checkpoint.get("resumable", True):
+                    continue  # Reported by resume_research_task
+                age_hours = manager.get_resume_estimate(checkpoint)["checkpoint_age_hours"]
+                if age_hours <= STALE_CHECKPOINT_HOURS:
+                    continue
+                if await confirm_stale_resume(task_name, age_hours):
+                    confirmed.add(task_name)
+                else:
+                    exit_codes[task_name] = 1
+
+        to_resume = [task_name for task_name in task_names if task_name not in exit_codes]
+        results = await asyncio.gather(*(
+            resume_research_task(
+                project_folder, phase_num, task_name,
+                confirmed=task_name in confirmed, **kwargs
+            )
+            for task_name in to_resume
+        ))
+        exit_codes.update(zip(to_resume, results))
+        return [exit_codes[task_name] for task_name in task_names]
+
+    try:
+        return tuple(loop.run_until_complete(resume_all()))
+    finally:
+        # Same teardown as asyncio.run(): finalize async generators and join
+        # the to_thread() workers before closing the loop
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -332,9 +768,15 @@ Examples:
   # List all resumable tasks for Phase 1
   %(prog)s planning_outputs/20260115_143022_my-project 1 --list
 
+  # List resumable tasks as JSON (for scripts and dashboards)
+  %(prog)s planning_outputs/20260115_143022_my-project 1 --list --json
+
   # Resume specific task
   %(prog)s planning_outputs/20260115_143022_my-project 1 --task competitive-analysis
 
+  # Resume several tasks concurrently
+  %(prog)s planning_outputs/20260115_143022_my-project 1 --task competitive-analysis market-sizing
+
   # Resume with specific provider
   %(prog)s planning_outputs/20260115_143022_my-project 1 --task market-sizing --provider perplexity_sonar
 
@@ -364,7 +806,8 @@ Examples:
     parser.add_argument(
         "--task",
         type=str,
-        help="Task name to resume"
+        nargs="+",
+        help="Task name(s) to resume"
     )
 
     parser.add_argument(
@@ -380,6 +823,24 @@ Examples:
         help="Force resume even if checkpoint is old"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every checkpoint file instead of reusing parsed checkpoints"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="With --list, print the resumable tasks as a JSON array"
+    )
+
+    parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Rebuild the resume prompt instead of reusing the cached one"
+    )
+
     args = parser.parse_args()
 
     # Validate inputs
@@ -393,21 +854,43 @@ Examples:
         print(f"   Phase must be between 1 and 6", file=sys.stderr)
         sys.exit(1)
 
+    # Nothing checkpointed for this phase: answer without loading the research stack
+    if (args.list or args.task) and not has_phase_checkpoints(project_folder, args.phase_num):
+        if args.list:
+            if args.json:
+                write_json_listing([])
+            else:
+                sys.stdout.write("\n".join(_no_resumable_tasks_lines(args.phase_num)) + "\n")
+            sys.exit(0)
+        sys.stdout.write("\n".join(
+            line
+            for task_name in args.task
+            for line in _missing_checkpoint_lines(project_folder, args.phase_num, task_name)
+        ) + "\n")
+        sys.exit(1)
+
     # Handle commands
     if args.list:
         # List resumable tasks
-        exit_code = list_resumable_tasks(project_folder, args.phase_num)
+        exit_code = list_resumable_tasks(
+            project_folder,
+            args.phase_num,
+            use_cache=not args.no_cache,
+            as_json=args.json
+        )
         sys.exit(exit_code)
 
     elif args.task:
-        # Resume specific task
-        exit_code = asyncio.run(resume_research_task(
+        # Resume specific task(s)
+        exit_codes = run_resume_tasks(
             project_folder,
             args.phase_num,
             args.task,
-            provider=args.provider
-        ))
-        sys.exit(exit_code)
+            provider=args.provider,
+            use_prompt_cache=not args.no_prompt_cache,
+            force=args.force
+        )
+        sys.exit(max(exit_codes))
 
     else:
         # No command specified
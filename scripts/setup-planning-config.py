@@ -8,26 +8,172 @@ Users discover all capabilities through guided setup flow.
 Dynamically filters options based on available API keys.
 """
 
-import json
 import os
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+import sys
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+# json/orjson and pathlib are only needed to emit/save output, so they are imported
+# inside main() and save_config(); callers that only build questions skip them.
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# Provider name -> environment variable holding its credential
+API_KEY_ENV_VARS = {
+    "gemini": "GEMINI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "perplexity": "PERPLEXITY_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "claude_max": "CLAUDE_CODE_OAUTH_TOKEN",
+}
+
+# Result of the first check_api_keys() call (environment is read once per process)
+_API_KEYS_CACHE: Optional[Dict[str, bool]] = None
 
 
 def check_api_keys() -> Dict[str, bool]:
     """
     Check which API keys are available in environment.
 
+    The environment is probed once and the result reused; call
+    invalidate_api_key_cache() after changing the environment.
+
     Returns:
         Dict mapping provider name to availability
     """
-    return {
-        "gemini": bool(os.getenv("GEMINI_API_KEY")),
-        "openrouter": bool(os.getenv("OPENROUTER_API_KEY")),
-        "perplexity": bool(os.getenv("PERPLEXITY_API_KEY")),
-        "anthropic": bool(os.getenv("ANTHROPIC_API_KEY")),
-        "claude_max": bool(os.getenv("CLAUDE_CODE_OAUTH_TOKEN")),
-    }
+    global _API_KEYS_CACHE
+    if _API_KEYS_CACHE is None:
+        _API_KEYS_CACHE = {
+            provider: bool(os.getenv(env_var))
+            for provider, env_var in API_KEY_ENV_VARS.items()
+        }
+    # Copy so callers can't alter the cached result
+    return dict(_API_KEYS_CACHE)
+
+
+def invalidate_api_key_cache():
+    """Forget cached API key availability so the next check re-reads the environment."""
+    global _API_KEYS_CACHE
+    _API_KEYS_CACHE = None
+
+
+# Questions 3-8 don't depend on available keys; built once at import and
+# shared between calls (treat as read-only)
+_STATIC_QUESTIONS = (
+    # Question 3: Performance - Parallelization
+    {
+        "question": "Enable smart parallelization for faster execution?",
+        "header": "Performance",
+        "multiSelect": False,
+        "options": [
+            {
+                "label": "Yes - Full parallelization (Recommended)",
+                "description": "Run independent tasks concurrently. ~14% overall time savings, up to 60% in Phase 3 (feasibility analysis)"
+            },
+            {
+                "label": "No - Sequential execution",
+                "description": "Run all tasks in order. Simpler logs, more predictable. Use for first-time planning or learning workflow"
+            }
+        ]
+    },
+
+    # Question 4: Interactive Approval Gates
+    {
+        "question": "Review and approve each phase before continuing?",
+        "header": "Workflow",
+        "multiSelect": False,
+        "options": [
+            {
+                "label": "Yes - Interactive approval mode (Recommended)",
+                "description": "Pause after each phase for review. Ability to revise if direction needs adjustment. Best for critical projects"
+            },
+            {
+                "label": "No - Fully autonomous",
+                "description": "Run all 6 phases without pausing. Fastest approach. Review outputs at the end"
+            }
+        ]
+    },
+
+    # Question 5: Core Phases (Always Included)
+    {
+        "question": "Which core phases should be included?",
+        "header": "Core Phases",
+        "multiSelect": True,
+        "options": [
+            {
+                "label": "Phase 1: Market Research (Recommended)",
+                "description": "Competitive analysis, market sizing, target audience research. Foundation for all decisions"
+            },
+            {
+                "label": "Phase 2: Architecture (Required)",
+                "description": "Technical architecture, building blocks, system design. Cannot be skipped"
+            },
+            {
+                "label": "Phase 4: Implementation (Required)",
+                "description": "Sprint planning, user stories, development roadmap. Cannot be skipped"
+            }
+        ]
+    },
+
+    # Question 6: Optional Analysis Phases
+    {
+        "question": "Include optional analysis and strategy phases?",
+        "header": "Optional",
+        "multiSelect": True,
+        "options": [
+            {
+                "label": "Phase 3: Feasibility & Costs (Recommended)",
+                "description": "Risk assessment, cost analysis, technical feasibility. Helps avoid expensive mistakes"
+            },
+            {
+                "label": "Phase 5: Go-to-Market Strategy",
+                "description": "Marketing campaign, launch strategy, content calendar. Skip for internal tools or APIs"
+            },
+            {
+                "label": "Phase 6: Plan Review (Recommended)",
+                "description": "Final validation, gap analysis, recommendations. Quality assurance for complete plan"
+            }
+        ]
+    },
+
+    # Question 7: Quality Assurance
+    {
+        "question": "Enable additional quality checks?",
+        "header": "Quality",
+        "multiSelect": True,  # Can enable multiple checks
+        "options": [
+            {
+                "label": "Multi-model architecture validation",
+                "description": "Validate architecture with 3 AI models (Gemini, GPT-4o, Claude) for consensus. Adds ~10 min, increases confidence"
+            },
+            {
+                "label": "Generate comprehensive diagrams",
+                "description": "Create C4, sequence, ERD, deployment diagrams for each phase. Visual documentation for all stakeholders"
+            },
+            {
+                "label": "Real-time research verification",
+                "description": "Cross-reference all technology recommendations with latest docs. Ensures current best practices"
+            }
+        ]
+    },
+
+    # Question 8: Optional Output Formats
+    {
+        "question": "Generate additional output formats? (Markdown and YAML always included)",
+        "header": "Outputs",
+        "multiSelect": True,
+        "options": [
+            {
+                "label": "Generate final PDF report",
+                "description": "Compile all phases into professional PDF with table of contents, IEEE citations, cover page"
+            },
+            {
+                "label": "Generate PowerPoint presentation",
+                "description": "Executive summary slides for stakeholder presentation"
+            }
+        ]
+    },
+)
 
 
 def generate_setup_questions(filter_unavailable: bool = True) -> List[Dict[str, Any]]:
@@ -40,12 +186,11 @@ def generate_setup_questions(filter_unavailable: bool = True) -> List[Dict[str,
         filter_unavailable: If True, mark unavailable options with warnings
 
     Returns:
-        List of question configurations for AskUserQuestion
+        List of question configurations for AskUserQuestion (questions 3-8
+        and all option dicts are shared module constants and must not be mutated)
     """
-    # Check which providers are available
+    # Check which providers are available (the option filters derive the rest)
     available = check_api_keys()
-    has_research = available["gemini"] or available["openrouter"] or available["perplexity"]
-    has_deep_research = available["gemini"]
 
     questions = [
         # Question 1: AI Provider Selection
@@ -62,172 +207,115 @@ def generate_setup_questions(filter_unavailable: bool = True) -> List[Dict[str,
             "header": "Research",
             "multiSelect": False,
             "options": _filter_research_depth_options(available, filter_unavailable)
-        },
-
-        # Question 3: Performance - Parallelization
-        {
-            "question": "Enable smart parallelization for faster execution?",
-            "header": "Performance",
-            "multiSelect": False,
-            "options": [
-                {
-                    "label": "Yes - Full parallelization (Recommended)",
-                    "description": "Run independent tasks concurrently. ~14% overall time savings, up to 60% in Phase 3 (feasibility analysis)"
-                },
-                {
-                    "label": "No - Sequential execution",
-                    "description": "Run all tasks in order. Simpler logs, more predictable. Use for first-time planning or learning workflow"
-                }
-            ]
-        },
-
-        # Question 4: Interactive Approval Gates
-        {
-            "question": "Review and approve each phase before continuing?",
-            "header": "Workflow",
-            "multiSelect": False,
-            "options": [
-                {
-                    "label": "Yes - Interactive approval mode (Recommended)",
-                    "description": "Pause after each phase for review. Ability to revise if direction needs adjustment. Best for critical projects"
-                },
-                {
-                    "label": "No - Fully autonomous",
-                    "description": "Run all 6 phases without pausing. Fastest approach. Review outputs at the end"
-                }
-            ]
-        },
-
-        # Question 5: Core Phases (Always Included)
-        {
-            "question": "Which core phases should be included?",
-            "header": "Core Phases",
-            "multiSelect": True,
-            "options": [
-                {
-                    "label": "Phase 1: Market Research (Recommended)",
-                    "description": "Competitive analysis, market sizing, target audience research. Foundation for all decisions"
-                },
-                {
-                    "label": "Phase 2: Architecture (Required)",
-                    "description": "Technical architecture, building blocks, system design. Cannot be skipped"
-                },
-                {
-                    "label": "Phase 4: Implementation (Required)",
-                    "description": "Sprint planning, user stories, development roadmap. Cannot be skipped"
-                }
-            ]
-        },
-
-        # Question 6: Optional Analysis Phases
-        {
-            "question": "Include optional analysis and strategy phases?",
-            "header": "Optional",
-            "multiSelect": True,
-            "options": [
-                {
-                    "label": "Phase 3: Feasibility & Costs (Recommended)",
-                    "description": "Risk assessment, cost analysis, technical feasibility. Helps avoid expensive mistakes"
-                },
-                {
-                    "label": "Phase 5: Go-to-Market Strategy",
-                    "description": "Marketing campaign, launch strategy, content calendar. Skip for internal tools or APIs"
-                },
-                {
-                    "label": "Phase 6: Plan Review (Recommended)",
-                    "description": "Final validation, gap analysis, recommendations. Quality assurance for complete plan"
-                }
-            ]
-        },
-
-        # Question 7: Quality Assurance
-        {
-            "question": "Enable additional quality checks?",
-            "header": "Quality",
-            "multiSelect": True,  # Can enable multiple checks
-            "options": [
-                {
-                    "label": "Multi-model architecture validation",
-                    "description": "Validate architecture with 3 AI models (Gemini, GPT-4o, Claude) for consensus. Adds ~10 min, increases confidence"
-                },
-                {
-                    "label": "Generate comprehensive diagrams",
-                    "description": "Create C4, sequence, ERD, deployment diagrams for each phase. Visual documentation for all stakeholders"
-                },
-                {
-                    "label": "Real-time research verification",
-                    "description": "Cross-reference all technology recommendations with latest docs. Ensures current best practices"
-                }
-            ]
-        },
-
-        # Question 8: Optional Output Formats
-        {
-            "question": "Generate additional output formats? (Markdown and YAML always included)",
-            "header": "Outputs",
-            "multiSelect": True,
-            "options": [
-                {
-                    "label": "Generate final PDF report",
-                    "description": "Compile all phases into professional PDF with table of contents, IEEE citations, cover page"
-                },
-                {
-                    "label": "Generate PowerPoint presentation",
-                    "description": "Executive summary slides for stakeholder presentation"
-                }
-            ]
         }
     ]
 
+    questions.extend(_STATIC_QUESTIONS)
     return questions
 
 
+# Option dicts for the key-dependent questions, shared between calls like
+# _STATIC_QUESTIONS (treat as read-only)
+_AI_PROVIDER_OPTIONS = {
+    "gemini": {
+        "label": "Google Gemini Deep Research",
+        "description": "✅ Available. 60-min comprehensive research, 1M token context. Best for Phase 1 competitive analysis"
+    },
+    "gemini_unavailable": {
+        "label": "Google Gemini Deep Research (Unavailable)",
+        "description": "❌ Requires GEMINI_API_KEY. Run /project-planner:setup for setup guidance"
+    },
+    "openrouter": {
+        "label": "Perplexity via OpenRouter (Recommended)",
+        "description": "✅ Available. Fast 30-sec research. Good for most use cases"
+    },
+    "openrouter_unavailable": {
+        "label": "Perplexity via OpenRouter (Unavailable)",
+        "description": "❌ Requires OPENROUTER_API_KEY. Run /project-planner:setup for setup guidance"
+    },
+    "perplexity": {
+        "label": "Perplexity Direct",
+        "description": "✅ Available. Direct Perplexity access (skip OpenRouter 5.5% fee)"
+    },
+    "auto": {
+        "label": "Auto-detect from available keys",
+        "description": "Automatically use best available provider based on your API keys"
+    },
+    "auto_unconfigured": {
+        "label": "Auto-detect (No research providers configured)",
+        "description": "❌ No research API keys found. Run /project-planner:setup to configure"
+    }
+}
+
+_RESEARCH_DEPTH_OPTIONS = {
+    "balanced": {
+        "label": "Balanced - Smart selection (Recommended)",
+        "description": "✅ Deep Research for Phase 1 competitive analysis, Perplexity for quick lookups. Best quality/time tradeoff (~120 min total)"
+    },
+    "balanced_unavailable": {
+        "label": "Balanced (Requires Gemini)",
+        "description": "❌ Needs GEMINI_API_KEY for Deep Research capability. Add key and re-run /project-planner:setup"
+    },
+    "quick": {
+        "label": "Quick - Perplexity only",
+        "description": "✅ Fast 30-sec lookups for all research. Total time: ~30 min. Good for well-known tech stacks"
+    },
+    "quick_unavailable": {
+        "label": "Quick - Perplexity only (Unavailable)",
+        "description": "❌ Requires OPENROUTER_API_KEY or PERPLEXITY_API_KEY"
+    },
+    "comprehensive": {
+        "label": "Comprehensive - Deep Research for all",
+        "description": "✅ 60-min Deep Research for every decision. Total time: ~4 hours. Best for novel/uncertain domains"
+    },
+    "comprehensive_unavailable": {
+        "label": "Comprehensive (Requires Gemini)",
+        "description": "❌ Needs GEMINI_API_KEY. Add key and re-run /project-planner:setup"
+    },
+    "auto": {
+        "label": "Auto - Context-aware",
+        "description": "✅ Intelligently choose based on query complexity. Uses Deep Research for competitive analysis"
+    },
+    "auto_perplexity_only": {
+        "label": "Auto - Context-aware (Perplexity only)",
+        "description": "✅ Will use Perplexity for all research (Gemini not configured)"
+    },
+    "auto_gemini_only": {
+        "label": "Auto - Context-aware (Gemini only)",
+        "description": "✅ Will use Gemini Deep Research for all research (Perplexity not configured)"
+    },
+    "auto_unconfigured": {
+        "label": "Auto (No providers configured)",
+        "description": "❌ No research providers available. Run /project-planner:setup"
+    }
+}
+
+
 def _filter_ai_provider_options(available: Dict[str, bool], filter_unavailable: bool) -> List[Dict[str, str]]:
     """Filter AI provider options based on available keys."""
     options = []
 
     # Gemini Deep Research
     if available["gemini"]:
-        options.append({
-            "label": "Google Gemini Deep Research",
-            "description": "✅ Available. 60-min comprehensive research, 1M token context. Best for Phase 1 competitive analysis"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["gemini"])
     elif filter_unavailable:
-        options.append({
-            "label": "Google Gemini Deep Research (Unavailable)",
-            "description": "❌ Requires GEMINI_API_KEY. Run /project-planner:setup for setup guidance"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["gemini_unavailable"])
 
     # Perplexity via OpenRouter
     if available["openrouter"]:
-        options.append({
-            "label": "Perplexity via OpenRouter (Recommended)",
-            "description": "✅ Available. Fast 30-sec research. Good for most use cases"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["openrouter"])
     elif filter_unavailable:
-        options.append({
-            "label": "Perplexity via OpenRouter (Unavailable)",
-            "description": "❌ Requires OPENROUTER_API_KEY. Run /project-planner:setup for setup guidance"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["openrouter_unavailable"])
 
     # Perplexity Direct
     if available["perplexity"]:
-        options.append({
-            "label": "Perplexity Direct",
-            "description": "✅ Available. Direct Perplexity access (skip OpenRouter 5.5% fee)"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["perplexity"])
 
     # Auto-detect (always available if any research provider exists)
     if available["gemini"] or available["openrouter"] or available["perplexity"]:
-        options.append({
-            "label": "Auto-detect from available keys",
-            "description": "Automatically use best available provider based on your API keys"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["auto"])
     else:
-        options.append({
-            "label": "Auto-detect (No research providers configured)",
-            "description": "❌ No research API keys found. Run /project-planner:setup to configure"
-        })
+        options.append(_AI_PROVIDER_OPTIONS["auto_unconfigured"])
 
     return options
 
@@ -240,65 +328,91 @@ def _filter_research_depth_options(available: Dict[str, bool], filter_unavailabl
 
     # Balanced mode (requires Gemini for Deep Research)
     if has_deep_research:
-        options.append({
-            "label": "Balanced - Smart selection (Recommended)",
-            "description": "✅ Deep Research for Phase 1 competitive analysis, Perplexity for quick lookups. Best quality/time tradeoff (~120 min total)"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["balanced"])
     elif filter_unavailable:
-        options.append({
-            "label": "Balanced (Requires Gemini)",
-            "description": "❌ Needs GEMINI_API_KEY for Deep Research capability. Add key and re-run /project-planner:setup"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["balanced_unavailable"])
 
     # Quick mode (only needs Perplexity)
     if has_fast_research:
-        options.append({
-            "label": "Quick - Perplexity only",
-            "description": "✅ Fast 30-sec lookups for all research. Total time: ~30 min. Good for well-known tech stacks"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["quick"])
     elif filter_unavailable:
-        options.append({
-            "label": "Quick - Perplexity only (Unavailable)",
-            "description": "❌ Requires OPENROUTER_API_KEY or PERPLEXITY_API_KEY"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["quick_unavailable"])
 
     # Comprehensive mode (requires Gemini)
     if has_deep_research:
-        options.append({
-            "label": "Comprehensive - Deep Research for all",
-            "description": "✅ 60-min Deep Research for every decision. Total time: ~4 hours. Best for novel/uncertain domains"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["comprehensive"])
     elif filter_unavailable:
-        options.append({
-            "label": "Comprehensive (Requires Gemini)",
-            "description": "❌ Needs GEMINI_API_KEY. Add key and re-run /project-planner:setup"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["comprehensive_unavailable"])
 
     # Auto mode (adapts to what's available)
     if has_deep_research and has_fast_research:
-        options.append({
-            "label": "Auto - Context-aware",
-            "description": "✅ Intelligently choose based on query complexity. Uses Deep Research for competitive analysis"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["auto"])
     elif has_fast_research:
-        options.append({
-            "label": "Auto - Context-aware (Perplexity only)",
-            "description": "✅ Will use Perplexity for all research (Gemini not configured)"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["auto_perplexity_only"])
     elif has_deep_research:
-        options.append({
-            "label": "Auto - Context-aware (Gemini only)",
-            "description": "✅ Will use Gemini Deep Research for all research (Perplexity not configured)"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["auto_gemini_only"])
     else:
-        options.append({
-            "label": "Auto (No providers configured)",
-            "description": "❌ No research providers available. Run /project-planner:setup"
-        })
+        options.append(_RESEARCH_DEPTH_OPTIONS["auto_unconfigured"])
 
     return options
 
 
+# First word of the AI provider label (Question 0) -> ai_provider
+_PROVIDER_BY_PREFIX = {
+    "Google": "gemini",
+    "Perplexity": "openrouter",
+}
+
+# First word of the research depth label (Question 1) -> research_mode
+_RESEARCH_MODE_BY_PREFIX = {
+    "Balanced": "balanced",
+    "Quick": "perplexity",
+    "Comprehensive": "deep_research",
+}
+
+# Yes/No answer key -> config flag (labels start with "Yes - " or "No - ")
+_YES_NO_ANSWERS = {
+    "question_2": "enable_parallelization",
+    "question_3": "interactive_mode",
+}
+
+# multiSelect answer key -> (label substring, config path) pairs; each path
+# is set to whether the substring appears in that answer
+_ANSWER_RULES = {
+    # Core Phases (Question 4) - multiSelect; Phases 2 and 4 are always required
+    "question_4": (
+        ("Phase 1", ("phases", "market_research")),
+        ("Phase 2", ("phases", "architecture")),
+        ("Phase 4", ("phases", "implementation")),
+    ),
+    # Optional Phases (Question 5) - multiSelect
+    "question_5": (
+        ("Phase 3", ("phases", "feasibility")),
+        ("Phase 5", ("phases", "marketing")),
+        ("Phase 6", ("phases", "review")),
+    ),
+    # Quality Checks (Question 6) - multiSelect
+    "question_6": (
+        ("Multi-model", ("quality_checks", "multi_model_validation")),
+        ("comprehensive diagrams", ("quality_checks", "comprehensive_diagrams")),
+        ("Real-time research", ("quality_checks", "research_verification")),
+    ),
+    # Output Formats (Question 7) - multiSelect
+    "question_7": (
+        ("PDF report", ("output_formats", "pdf")),
+        ("PowerPoint", ("output_formats", "pptx")),
+    ),
+}
+
+
+def _set_config_value(config: Dict[str, Any], path: tuple, value: Any):
+    """Set a nested config value addressed by a tuple of keys."""
+    *parents, leaf = path
+    for key in parents:
+        config = config[key]
+    config[leaf] = value
+
+
 def parse_user_selections(answers: Dict[str, str]) -> Dict[str, Any]:
     """
     Parse user answers into configuration object.
@@ -335,140 +449,238 @@ def parse_user_selections(answers: Dict[str, str]) -> Dict[str, Any]:
         }
     }
 
-    # Parse AI Provider (Question 0)
+    # Parse AI Provider (Question 0) and Research Mode (Question 1) by the
+    # first word of the selected label
     provider = answers.get("question_0", "")
-    if "Gemini" in provider:
-        config["ai_provider"] = "gemini"
-    elif "Perplexity" in provider:
-        config["ai_provider"] = "openrouter"
-    else:
-        config["ai_provider"] = "auto"
+    config["ai_provider"] = _PROVIDER_BY_PREFIX.get(provider.partition(" ")[0], "auto")
 
-    # Parse Research Mode (Question 1) - NEW
     research_depth = answers.get("question_1", "")
-    if "Balanced" in research_depth:
-        config["research_mode"] = "balanced"
-    elif "Quick" in research_depth:
-        config["research_mode"] = "perplexity"
-    elif "Comprehensive" in research_depth:
-        config["research_mode"] = "deep_research"
-    else:  # Auto
-        config["research_mode"] = "auto"
-
-    # Parse Parallelization (Question 2)
-    parallel = answers.get("question_2", "")
-    config["enable_parallelization"] = "Yes" in parallel
-
-    # Parse Interactive Mode (Question 3)
-    interactive = answers.get("question_3", "")
-    config["interactive_mode"] = "Yes" in interactive
-
-    # Parse Core Phases (Question 4) - multiSelect
-    core_phases = answers.get("question_4", "")
-    config["phases"]["market_research"] = "Phase 1" in core_phases
-    config["phases"]["architecture"] = "Phase 2" in core_phases  # Always required
-    config["phases"]["implementation"] = "Phase 4" in core_phases  # Always required
-
-    # Parse Optional Phases (Question 5) - multiSelect
-    optional_phases = answers.get("question_5", "")
-    config["phases"]["feasibility"] = "Phase 3" in optional_phases
-    config["phases"]["marketing"] = "Phase 5" in optional_phases
-    config["phases"]["review"] = "Phase 6" in optional_phases
-
-    # Parse Quality Checks (Question 6 - was Question 5) - multiSelect
-    quality = answers.get("question_6", "")
-    config["quality_checks"]["multi_model_validation"] = "Multi-model" in quality
-    config["quality_checks"]["comprehensive_diagrams"] = "comprehensive diagrams" in quality
-    config["quality_checks"]["research_verification"] = "Real-time research" in quality
-
-    # Parse Output Formats (Question 7 - was Question 6) - multiSelect
-    outputs = answers.get("question_7", "")
-    config["output_formats"]["pdf"] = "PDF report" in outputs
-    config["output_formats"]["pptx"] = "PowerPoint" in outputs
+    config["research_mode"] = _RESEARCH_MODE_BY_PREFIX.get(research_depth.partition(" ")[0], "auto")
+
+    # Parse Parallelization (Question 2) and Interactive Mode (Question 3)
+    for question_key, config_key in _YES_NO_ANSWERS.items():
+        config[config_key] = answers.get(question_key, "").startswith("Yes")
+
+    # Parse the multiSelect questions (Questions 4-7)
+    for question_key, rules in _ANSWER_RULES.items():
+        answer = answers.get(question_key, "")
+        for needle, path in rules:
+            _set_config_value(config, path, needle in answer)
 
     return config
 
 
-def save_config(config: Dict[str, Any], project_name: str) -> Path:
+def save_config(config: Dict[str, Any], project_name: str) -> "Path":
     """Save configuration to temp file for planning execution."""
+    from pathlib import Path
+
+    # Serialize once and write the bytes in a single call
+    try:
+        import orjson
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    except ImportError:
+        import json
+        data = json.dumps(config, indent=2).encode("utf-8")
+
     config_file = Path(f".{project_name}-config.json")
-    with open(config_file, "w") as f:
-        json.dump(config, indent=2, fp=f)
+    temp_file = config_file.with_name(config_file.name + ".tmp")
+    with open(temp_file, "wb") as f:
+        f.write(data)
+    # Atomic rename so readers never see a partially written config
+    os.replace(temp_file, config_file)
     return config_file
 
 
+# Research mode -> summary display text
+_RESEARCH_MODE_DISPLAY = {
+    "balanced": "BALANCED (Deep Research for Phase 1, Perplexity for others)",
+    "perplexity": "QUICK (Perplexity only)",
+    "deep_research": "COMPREHENSIVE (Deep Research for all)",
+    "auto": "AUTO (Context-aware selection)"
+}
+
+# Phase key -> summary label (status mark prepended)
+_PHASE_SUMMARY_NAMES = {
+    "market_research": "Phase 1: Market Research",
+    "architecture": "Phase 2: Architecture & Design",
+    "feasibility": "Phase 3: Feasibility & Costs",
+    "implementation": "Phase 4: Implementation Planning",
+    "marketing": "Phase 5: Go-to-Market Strategy",
+    "review": "Phase 6: Plan Review"
+}
+
+
+# Quality check key -> summary line, in display order
+_QUALITY_CHECK_LABELS = (
+    ("multi_model_validation", "  ✓ Multi-model validation\n"),
+    ("comprehensive_diagrams", "  ✓ Comprehensive diagrams\n"),
+    ("research_verification", "  ✓ Real-time research verification\n"),
+)
+
+
 def display_config_summary(config: Dict[str, Any]) -> str:
     """Generate human-readable configuration summary."""
-    research_mode_display = {
-        "balanced": "BALANCED (Deep Research for Phase 1, Perplexity for others)",
-        "perplexity": "QUICK (Perplexity only)",
-        "deep_research": "COMPREHENSIVE (Deep Research for all)",
-        "auto": "AUTO (Context-aware selection)"
-    }
+    import io
 
-    lines = [
-        "=" * 70,
-        "Planning Configuration Summary",
-        "=" * 70,
-        "",
-        f"AI Provider: {config['ai_provider'].upper()}",
-        f"Research Mode: {research_mode_display.get(config['research_mode'], config['research_mode'].upper())}",
-        f"Parallelization: {'ENABLED' if config['enable_parallelization'] else 'DISABLED'}",
-        f"Interactive Mode: {'ENABLED' if config['interactive_mode'] else 'DISABLED'}",
-        "",
-        "Phases:",
-    ]
+    rule = "=" * 70
+    research_mode = config["research_mode"]
 
-    phase_names = {
-        "market_research": "  ✓ Phase 1: Market Research",
-        "architecture": "  ✓ Phase 2: Architecture & Design",
-        "feasibility": "  {} Phase 3: Feasibility & Costs",
-        "implementation": "  ✓ Phase 4: Implementation Planning",
-        "marketing": "  {} Phase 5: Go-to-Market Strategy",
-        "review": "  {} Phase 6: Plan Review"
-    }
+    buf = io.StringIO()
+    w = buf.write
 
-    for key, name in phase_names.items():
-        if config["phases"][key]:
-            lines.append(name.format("✓"))
-        else:
-            lines.append(name.format("✗").replace("✓", "✗"))
+    w(f"{rule}\nPlanning Configuration Summary\n{rule}\n\n")
+    w(f"AI Provider: {config['ai_provider'].upper()}\n")
+    w(f"Research Mode: {_RESEARCH_MODE_DISPLAY.get(research_mode, research_mode.upper())}\n")
+    w(f"Parallelization: {'ENABLED' if config['enable_parallelization'] else 'DISABLED'}\n")
+    w(f"Interactive Mode: {'ENABLED' if config['interactive_mode'] else 'DISABLED'}\n")
 
-    lines.append("")
-    lines.append("Quality Checks:")
+    w("\nPhases:\n")
+    phases = config["phases"]
+    for key, name in _PHASE_SUMMARY_NAMES.items():
+        w(f"  {'✓' if phases[key] else '✗'} {name}\n")
 
+    w("\nQuality Checks:\n")
     checks = config["quality_checks"]
-    if checks["multi_model_validation"]:
-        lines.append("  ✓ Multi-model validation")
-    if checks["comprehensive_diagrams"]:
-        lines.append("  ✓ Comprehensive diagrams")
-    if checks["research_verification"]:
-        lines.append("  ✓ Real-time research verification")
-    if not any(checks.values()):
-        lines.append("  ✗ None (standard quality only)")
-
-    lines.append("")
-    lines.append("Output Formats:")
-    lines.append("  ✓ Markdown (always)")
-    lines.append("  ✓ YAML building blocks (always)")
+    emitted = 0
+    for key, label in _QUALITY_CHECK_LABELS:
+        if checks[key]:
+            w(label)
+            emitted += 1
+    if not emitted:
+        w("  ✗ None (standard quality only)\n")
+
+    w("\nOutput Formats:\n")
+    w("  ✓ Markdown (always)\n")
+    w("  ✓ YAML building blocks (always)\n")
     if config["output_formats"]["pdf"]:
-        lines.append("  ✓ PDF report")
+        w("  ✓ PDF report\n")
     if config["output_formats"]["pptx"]:
-        lines.append("  ✓ PowerPoint presentation")
+        w("  ✓ PowerPoint presentation\n")
+
+    w(f"\n{rule}")
+
+    return buf.getvalue()
+
 
-    lines.append("")
-    lines.append("=" * 70)
+HELP_TEXT = """usage: setup-planning-config.py [-h] [-v] [--no-cache]
 
-    return "\n".join(lines)
+Print the planning setup questions as JSON for AskUserQuestion.
+Options are filtered by the API keys found in the environment.
 
+options:
+  -h, --help     show this help message and exit
+  -v, --version  show the plugin version and exit
+  --no-cache     rebuild the questions instead of reusing the cached JSON
+"""
+
+
+def get_version() -> str:
+    """
+    Read the plugin version from pyproject.toml (kept current by bump_version.py).
+
+    Returns:
+        Version string, or "unknown" if it cannot be determined
+    """
+    import re
+
+    pyproject = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pyproject.toml")
+    try:
+        with open(pyproject, encoding="utf-8") as f:
+            match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.MULTILINE)
+    except OSError:
+        match = None
+    return match.group(1) if match else "unknown"
 
-def main():
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Generate setup questions JSON for AskUserQuestion."""
-    questions = generate_setup_questions()
+    args = sys.argv[1:] if argv is None else argv
+
+    # Answer --help/--version before probing keys or building questions
+    if len(args) == 1 and args[0] in ("-h", "--help"):
+        sys.stdout.write(HELP_TEXT)
+        return 0
+    if len(args) == 1 and args[0] in ("-v", "--version"):
+        sys.stdout.write(f"setup-planning-config.py {get_version()}\n")
+        return 0
+
+    use_cache = "--no-cache" not in args
+    cache_file = questions_cache_file() if use_cache else None
+
+    if cache_file is not None:
+        try:
+            data = cache_file.read_bytes()
+        except OSError:
+            data = None
+        if data:
+            _write_stdout_bytes(data)
+            return 0
+
+    data = _serialize_questions(generate_setup_questions())
+
+    if cache_file is not None:
+        _store_questions_cache(cache_file, data)
 
     # Output JSON for use in command
-    print(json.dumps({"questions": questions}, indent=2))
+    _write_stdout_bytes(data)
+    return 0
+
+
+def questions_cache_file() -> Optional["Path"]:
+    """
+    Cache path for the questions JSON, keyed on key availability and this script's mtime.
+
+    Lives under $XDG_CACHE_HOME (default ~/.cache)/claude-project-planner/.
+
+    Returns:
+        Path of the cache file, or None if the key can't be computed
+    """
+    import hashlib
+    from pathlib import Path
+
+    try:
+        script_mtime_ns = os.stat(__file__).st_mtime_ns
+    except OSError:
+        return None
+
+    key_source = f"{sorted(check_api_keys().items())}|{script_mtime_ns}"
+    key = hashlib.blake2b(key_source.encode(), digest_size=8).hexdigest()
+
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_root) / "claude-project-planner" / f"questions-{key}.json"
+
+
+def _store_questions_cache(cache_file: "Path", data: bytes):
+    """Atomically write the questions cache, replacing entries for older keys (best-effort)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_file.parent.glob("questions-*.json"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        temp_file = cache_file.with_name(cache_file.name + ".tmp")
+        temp_file.write_bytes(data)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _serialize_questions(questions: List[Dict[str, Any]]) -> bytes:
+    """Serialize the questions payload to indented JSON bytes (orjson when installed)."""
+    payload = {"questions": questions}
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
+def _write_stdout_bytes(data: bytes):
+    """Write already-encoded output to stdout."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -6,19 +6,91 @@ This script tests that API keys are not only present, but actually work
 by making real API calls to each provider.
 
 Usage:
-    python scripts/test-providers.py [--verbose]
+    python scripts/test-providers.py [--verbose] [--no-cache]
+
+Keys that validated successfully are remembered for an hour (by a hash of
+the key, never the key itself); pass --no-cache to re-check every key live.
 """
 
 import os
 import sys
 import asyncio
-from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+ProbeResult = Tuple[bool, str, Optional[str]]
+
+PROBE_TIMEOUT_SEC = 10
+
+# Successful validations are reused for this long
+PROBE_CACHE_TTL_SEC = 3600
+
+# Provider keys in display order; also the bit order for capability masks
+KEY_ORDER = (
+    "CLAUDE_CODE_OAUTH_TOKEN",
+    "ANTHROPIC_API_KEY",
+    "OPENROUTER_API_KEY",
+    "GEMINI_API_KEY",
+    "PERPLEXITY_API_KEY",
+)
+
+
+class _ThreadedRequestsClient:
+    """
+    Minimal async stand-in for httpx.AsyncClient backed by requests.
+
+    Used when httpx (performance extra) is not installed; each call runs on a
+    worker thread so probes still overlap instead of running back to back.
+    """
+
+    def __init__(self, timeout: float):
+        import requests
+        # A Session pools connections, so same-host probes reuse one TLS handshake
+        self._session = requests.Session()
+        self._timeout = timeout
+
+    async def get(self, url: str, **kwargs: Any):
+        return await asyncio.to_thread(self._session.get, url, timeout=self._timeout, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any):
+        return await asyncio.to_thread(self._session.post, url, timeout=self._timeout, **kwargs)
 
+    async def aclose(self):
+        self._session.close()
 
-def test_anthropic_key() -> Tuple[bool, str, Optional[str]]:
+
+def create_http_client():
+    """
+    Create the HTTP client shared by all provider probes.
+
+    Returns:
+        httpx.AsyncClient when httpx is installed (HTTP/2 when h2 is also
+        available, so same-host requests share one connection), otherwise a
+        threaded requests-based client with the same get/post/aclose interface
+    """
+    try:
+        import httpx
+    except ImportError:
+        return _ThreadedRequestsClient(timeout=PROBE_TIMEOUT_SEC)
+
+    from importlib.util import find_spec
+    return httpx.AsyncClient(
+        timeout=PROBE_TIMEOUT_SEC,
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=len(KEY_ORDER) * 2)
+    )
+
+
+async def test_anthropic_key(client=None) -> ProbeResult:
     """
     Test ANTHROPIC_API_KEY by listing models.
 
+    Args:
+        client: Unused; the Anthropic SDK manages its own connection
+
     Returns:
         (is_valid, status_message, error_details)
     """
@@ -28,15 +100,15 @@ def test_anthropic_key() -> Tuple[bool, str, Optional[str]]:
 
     try:
         import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
-        # Test by listing models (lightweight call)
-        models = client.models.list()
+        async with anthropic.AsyncAnthropic(api_key=api_key, timeout=PROBE_TIMEOUT_SEC) as anthropic_client:
+            # Test by listing models (lightweight call)
+            await anthropic_client.models.list()
         return True, "Valid", None
     except Exception as e:
         return False, "Invalid", str(e)
 
 
-def test_claude_max_token() -> Tuple[bool, str, Optional[str]]:
+def test_claude_max_token() -> ProbeResult:
     """
     Test CLAUDE_CODE_OAUTH_TOKEN.
 
@@ -55,10 +127,15 @@ def test_claude_max_token() -> Tuple[bool, str, Optional[str]]:
         return False, "Invalid format", "Token doesn't match expected format"
 
 
-def test_openrouter_key() -> Tuple[bool, str, Optional[str]]:
+async def test_openrouter_key(client) -> ProbeResult:
     """
     Test OPENROUTER_API_KEY by fetching models.
 
+    The models and credits endpoints are requested concurrently.
+
+    Args:
+        client: Shared async HTTP client
+
     Returns:
         (is_valid, status_message, error_details)
     """
@@ -66,22 +143,19 @@ def test_openrouter_key() -> Tuple[bool, str, Optional[str]]:
     if not api_key:
         return False, "Not set", None
 
+    headers = {"Authorization": f"Bearer {api_key}"}
     try:
-        import requests
-        response = requests.get(
-            "https://openrouter.ai/api/v1/models",
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=10
+        response, credits_response = await asyncio.gather(
+            client.get("https://openrouter.ai/api/v1/models", headers=headers),
+            # Check credits (optional)
+            client.get("https://openrouter.ai/api/v1/auth/key", headers=headers),
+            return_exceptions=True
         )
+        if isinstance(response, Exception):
+            raise response
 
         if response.status_code == 200:
-            # Check credits (optional)
-            credits_response = requests.get(
-                "https://openrouter.ai/api/v1/auth/key",
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=10
-            )
-            if credits_response.status_code == 200:
+            if not isinstance(credits_response, Exception) and credits_response.status_code == 200:
                 data = credits_response.json()
                 limit = data.get("data", {}).get("limit")
                 if limit:
@@ -96,10 +170,13 @@ def test_openrouter_key() -> Tuple[bool, str, Optional[str]]:
         return False, "Connection failed", str(e)
 
 
-def test_gemini_key() -> Tuple[bool, str, Optional[str]]:
+async def test_gemini_key(client) -> ProbeResult:
     """
     Test GEMINI_API_KEY by listing models.
 
+    Args:
+        client: Shared async HTTP client
+
     Returns:
         (is_valid, status_message, error_details)
     """
@@ -108,10 +185,8 @@ def test_gemini_key() -> Tuple[bool, str, Optional[str]]:
         return False, "Not set", None
 
     try:
-        import requests
-        response = requests.get(
-            f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}",
-            timeout=10
+        response = await client.get(
+            f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
         )
 
         if response.status_code == 200:
@@ -135,10 +210,13 @@ def test_gemini_key() -> Tuple[bool, str, Optional[str]]:
         return False, "Connection failed", str(e)
 
 
-def test_perplexity_key() -> Tuple[bool, str, Optional[str]]:
+async def test_perplexity_key(client) -> ProbeResult:
     """
     Test PERPLEXITY_API_KEY with a minimal query.
 
+    Args:
+        client: Shared async HTTP client
+
     Returns:
         (is_valid, status_message, error_details)
     """
@@ -147,8 +225,7 @@ def test_perplexity_key() -> Tuple[bool, str, Optional[str]]:
         return False, "Not set", None
 
     try:
-        import requests
-        response = requests.post(
+        response = await client.post(
             "https://api.perplexity.ai/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -158,8 +235,7 @@ def test_perplexity_key() -> Tuple[bool, str, Optional[str]]:
                 "model": "sonar-pro",
                 "messages": [{"role": "user", "content": "test"}],
                 "max_tokens": 1
-            },
-            timeout=10
+            }
         )
 
         if response.status_code == 200:
@@ -173,32 +249,156 @@ def test_perplexity_key() -> Tuple[bool, str, Optional[str]]:
         return False, "Connection failed", str(e)
 
 
-def get_available_capabilities(test_results: Dict[str, Tuple[bool, str, Optional[str]]]) -> Dict[str, bool]:
+# Network probes, run concurrently over one shared client
+NETWORK_PROBES = {
+    "ANTHROPIC_API_KEY": test_anthropic_key,
+    "OPENROUTER_API_KEY": test_openrouter_key,
+    "GEMINI_API_KEY": test_gemini_key,
+    "PERPLEXITY_API_KEY": test_perplexity_key,
+}
+
+# Probes whose only capability is already covered by a cheaper local check:
+# a valid Claude Max token provides "planning", so the live Anthropic call adds nothing
+PROBES_COVERED_BY = {
+    "ANTHROPIC_API_KEY": "CLAUDE_CODE_OAUTH_TOKEN",
+}
+
+SKIPPED_STATUS = "Skipped (not needed)"
+
+
+def probe_cache_file() -> Path:
     """
-    Determine what capabilities are available based on API key test results.
+    Path of the provider validation cache.
+
+    Lives under $XDG_CACHE_HOME (default ~/.cache)/claude-project-planner/.
 
     Returns:
-        Dict mapping capability names to availability
+        Path of the cache file
     """
-    claude_available = (
-        test_results["CLAUDE_CODE_OAUTH_TOKEN"][0] or
-        test_results["ANTHROPIC_API_KEY"][0]
-    )
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_root) / "claude-project-planner" / "provider_keys.json"
 
-    return {
-        "planning": claude_available,
-        "fast_research": (
-            test_results["OPENROUTER_API_KEY"][0] or
-            test_results["PERPLEXITY_API_KEY"][0]
-        ),
-        "deep_research": test_results["GEMINI_API_KEY"][0],
-        "nanobanana_images": (
-            test_results["GEMINI_API_KEY"][0] or
-            test_results["OPENROUTER_API_KEY"][0]
-        ),
-        "flux_images": test_results["OPENROUTER_API_KEY"][0],
+
+def _probe_cache_key(key_name: str, api_key: str) -> str:
+    """Cache entry name for a key: env var name plus a truncated SHA-256 of its value."""
+    return f"{key_name}:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+
+
+def _load_probe_cache() -> Dict[str, Any]:
+    """Read the validation cache, treating a missing or corrupt file as empty."""
+    try:
+        cache = json.loads(probe_cache_file().read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_probe_cache(cache: Dict[str, Any]):
+    """Atomically write the validation cache (best-effort)."""
+    cache_file = probe_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(cache_file.name + ".tmp")
+        temp_file.write_text(json.dumps(cache))
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+async def run_provider_tests(use_cache: bool = True) -> Dict[str, ProbeResult]:
+    """
+    Test every provider key, probing the network endpoints concurrently.
+
+    Cheap local checks run first; a network probe whose capability they
+    already satisfy is reported as skipped instead of being called.
+
+    Args:
+        use_cache: Reuse successful validations younger than PROBE_CACHE_TTL_SEC
+
+    Returns:
+        Dict mapping env var name to (is_valid, status_message, error_details),
+        in display order
+    """
+    results = {"CLAUDE_CODE_OAUTH_TOKEN": test_claude_max_token()}
+
+    now = time.time()
+    cache = _load_probe_cache() if use_cache else {}
+    # Drop expired or malformed entries so the file doesn't grow with every
+    # rotated key and a hand-edited file can't break the run
+    cache = {
+        name: entry for name, entry in cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("status"), str)
+        and isinstance(entry.get("ts"), (int, float))
+        and entry["ts"] > now - PROBE_CACHE_TTL_SEC
     }
 
+    pending = {}
+    for key_name, probe in NETWORK_PROBES.items():
+        api_key = os.getenv(key_name)
+        if not api_key:
+            results[key_name] = (False, "Not set", None)
+            continue
+        entry = cache.get(_probe_cache_key(key_name, api_key))
+        covered_by = PROBES_COVERED_BY.get(key_name)
+        if entry is not None:
+            results[key_name] = (True, entry["status"], None)
+        elif covered_by and results.get(covered_by, (False,))[0]:
+            results[key_name] = (False, SKIPPED_STATUS, None)
+        else:
+            pending[key_name] = probe
+
+    if pending:
+        client = create_http_client()
+        try:
+            outcomes = await asyncio.gather(
+                *(probe(client) for probe in pending.values()),
+                return_exceptions=True
+            )
+        finally:
+            await client.aclose()
+
+        for key_name, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = (False, "Connection failed", str(outcome))
+            results[key_name] = outcome
+
+            # Only successes are cached; failures may be transient
+            if outcome[0]:
+                cache[_probe_cache_key(key_name, os.environ[key_name])] = {
+                    "ts": now,
+                    "status": outcome[1],
+                }
+
+        _store_probe_cache(cache)
+
+    # Keep display order stable regardless of which probes hit the cache
+    return {key_name: results[key_name] for key_name in KEY_ORDER}
+
+
+# One bit per key, following KEY_ORDER
+_CLAUDE_MAX, _ANTHROPIC, _OPENROUTER, _GEMINI, _PERPLEXITY = (1 << i for i in range(len(KEY_ORDER)))
+
+# Capability -> keys that can provide it (any one is enough)
+CAPABILITY_MASKS = {
+    "planning": _CLAUDE_MAX | _ANTHROPIC,
+    "fast_research": _OPENROUTER | _PERPLEXITY,
+    "deep_research": _GEMINI,
+    "nanobanana_images": _GEMINI | _OPENROUTER,
+    "flux_images": _OPENROUTER,
+}
+
+
+def get_available_capabilities(test_results: Dict[str, ProbeResult]) -> Dict[str, bool]:
+    """
+    Determine what capabilities are available based on API key test results.
+
+    Returns:
+        Dict mapping capability names to availability
+    """
+    valid = sum(1 << i for i, key_name in enumerate(KEY_ORDER) if test_results[key_name][0])
+    return {name: bool(valid & mask) for name, mask in CAPABILITY_MASKS.items()}
+
 
 def print_capability_matrix(capabilities: Dict[str, bool]):
     """Print a formatted capability matrix."""
@@ -225,7 +425,7 @@ def print_capability_matrix(capabilities: Dict[str, bool]):
     print()
 
 
-def print_recommendations(test_results: Dict[str, Tuple[bool, str, Optional[str]]]):
+def print_recommendations(test_results: Dict[str, ProbeResult]):
     """Print recommendations for missing capabilities."""
     missing = []
 
@@ -274,9 +474,26 @@ def print_recommendations(test_results: Dict[str, Tuple[bool, str, Optional[str]
         print()
 
 
+HELP_TEXT = """usage: test-providers.py [-h] [-v] [--no-cache]
+
+Check that the configured AI provider API keys actually work.
+
+options:
+  -h, --help     show this help message and exit
+  -v, --verbose  show error details for failing keys
+  --no-cache     re-check every key instead of reusing recent validations
+"""
+
+
 def main():
     """Main testing routine."""
+    if "-h" in sys.argv or "--help" in sys.argv:
+        # Answer before any HTTP client or provider SDK is imported
+        sys.stdout.write(HELP_TEXT)
+        return 0
+
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
+    use_cache = "--no-cache" not in sys.argv
 
     print("=" * 70)
     print("  Claude Project Planner - Provider Validation")
@@ -286,21 +503,11 @@ def main():
     print()
 
     # Test all providers
-    tests = {
-        "CLAUDE_CODE_OAUTH_TOKEN": test_claude_max_token,
-        "ANTHROPIC_API_KEY": test_anthropic_key,
-        "OPENROUTER_API_KEY": test_openrouter_key,
-        "GEMINI_API_KEY": test_gemini_key,
-        "PERPLEXITY_API_KEY": test_perplexity_key,
-    }
-
-    results = {}
-    for key_name, test_func in tests.items():
-        is_valid, status, error = test_func()
-        results[key_name] = (is_valid, status, error)
+    results = asyncio.run(run_provider_tests(use_cache=use_cache))
 
+    for key_name, (is_valid, status, error) in results.items():
         # Format output
-        symbol = "✅" if is_valid else "❌" if status != "Not set" else "⬜"
+        symbol = "✅" if is_valid else "⬜" if status in ("Not set", SKIPPED_STATUS) else "❌"
         print(f"  {symbol}  {key_name:25} {status}")
 
         if verbose and error:
@@ -0,0 +1,15 @@
+"""
+Shared pytest setup for the test suite.
+
+Puts scripts/ on sys.path once per session so test modules can import the
+flat script modules (research_checkpoint_manager, checkpoint_manager, ...)
+by bare name.
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = str(Path(__file__).parent.parent / "scripts")
+
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
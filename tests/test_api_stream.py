@@ -0,0 +1,135 @@
+"""
+Tests for how generate_project() handles the streamed SDK messages.
+
+The SDK query is replaced with a scripted message stream, so no model calls
+are made; the messages themselves are real SDK types.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock
+
+from project_planner import api
+
+
+def scripted_query(output_folder, messages):
+    """Fake claude_query that creates a project folder and yields the given messages."""
+    async def fake_query(prompt, options):
+        (output_folder / "20260101_000000_test_project").mkdir(parents=True, exist_ok=True)
+        for message in messages:
+            yield message
+    return fake_query
+
+
+def result_message(usage):
+    """ResultMessage carrying the given usage dict."""
+    return ResultMessage(
+        subtype="success",
+        duration_ms=10,
+        duration_api_ms=8,
+        is_error=False,
+        num_turns=1,
+        session_id="test-session",
+        usage=usage,
+    )
+
+
+async def run_generate_project(tmp_path, messages, **kwargs):
+    """Run generate_project in tmp_path against the scripted stream; return all updates."""
+    output_folder = tmp_path / "planning_outputs"
+    with patch.object(api, "claude_query", scripted_query(output_folder, messages)):
+        return [
+            update async for update in api.generate_project(
+                "Plan a test project",
+                api_key="test-key",
+                cwd=str(tmp_path),
+                **kwargs
+            )
+        ]
+
+
+class TestTokenUsage:
+    """Test token totals gathered from ResultMessage usage."""
+
+    @pytest.mark.asyncio
+    async def test_result_message_usage_is_reported(self, tmp_path):
+        """Usage from every ResultMessage is summed into the final result."""
+        messages = [
+            result_message({
+                "input_tokens": 100,
+                "output_tokens": 40,
+                "cache_creation_input_tokens": 7,
+                "cache_read_input_tokens": 3,
+            }),
+            result_message({"input_tokens": 20, "output_tokens": 5}),
+        ]
+
+        updates = await run_generate_project(tmp_path, messages, track_token_usage=True)
+
+        result = updates[-1]
+        assert result["type"] == "result"
+        assert result["token_usage"] == {
+            "input_tokens": 120,
+            "output_tokens": 45,
+            "cache_creation_input_tokens": 7,
+            "cache_read_input_tokens": 3,
+            "total_tokens": 165,
+        }
+
+    @pytest.mark.asyncio
+    async def test_usage_not_reported_unless_tracked(self, tmp_path):
+        """Without track_token_usage the result has no token_usage entry."""
+        messages = [result_message({"input_tokens": 100, "output_tokens": 40})]
+
+        updates = await run_generate_project(tmp_path, messages)
+
+        assert updates[-1]["type"] == "result"
+        assert "token_usage" not in updates[-1]
+
+
+class TestContentBlocks:
+    """Test routing of AssistantMessage content blocks."""
+
+    @pytest.mark.asyncio
+    async def test_write_tool_use_reports_progress(self, tmp_path):
+        """Write ToolUseBlocks count each file once and yield tool progress updates."""
+        components_dir = tmp_path / "planning_outputs" / "p" / "components"
+        breakdown = str(components_dir / "component_breakdown.md")
+        auth = str(components_dir / "auth_component.md")
+        messages = [
+            AssistantMessage(
+                content=[
+                    TextBlock(text="Breaking the system into components."),
+                    ToolUseBlock(id="tool-1", name="Write", input={"file_path": breakdown}),
+                ],
+                model="claude-sonnet-4-6",
+            ),
+            AssistantMessage(
+                content=[
+                    # Rewriting a file neither counts it twice nor repeats the update
+                    ToolUseBlock(id="tool-2", name="Write", input={"file_path": breakdown}),
+                    ToolUseBlock(id="tool-3", name="Write", input={"file_path": auth}),
+                ],
+                model="claude-sonnet-4-6",
+            ),
+        ]
+
+        updates = await run_generate_project(tmp_path, messages)
+
+        assert {"type": "text", "content": "Breaking the system into components."} in updates
+        tool_updates = [
+            update for update in updates
+            if update["type"] == "progress" and "tool" in update.get("details", {})
+        ]
+        assert [(update["stage"], update["message"], update["details"]) for update in tool_updates] == [
+            ("components", "Defining component: component_breakdown.md",
+             {"tool": "Write", "tool_calls": 1, "files_created": 1}),
+            ("components", "Defining component: auth_component.md",
+             {"tool": "Write", "tool_calls": 3, "files_created": 2}),
+        ]
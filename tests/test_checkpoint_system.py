@@ -7,10 +7,12 @@ and enhanced checkpoint manager with research task tracking.
 
 import asyncio
 import json
+import os
 import pytest
-import tempfile
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 # Import modules to test
 import sys
@@ -21,7 +23,11 @@ from research_checkpoint_manager import (
     ResearchResumeHelper
 )
 from resumable_research import ResumableResearchExecutor, execute_resumable_research
+from research_config import ResearchConfig, CheckpointScheduleEntry
 import checkpoint_manager
+import research_checkpoint_manager
+import research_json
+import resumable_research
 
 
 # ============================================================================
@@ -31,430 +37,1022 @@ import checkpoint_manager
 class TestResearchCheckpointManager:
     """Tests for ResearchCheckpointManager class."""
 
-    def test_checkpoint_file_path(self):
+    def test_checkpoint_file_path(self, tmp_path):
         """Verify checkpoint file path generation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
 
-            checkpoint_file = manager.get_checkpoint_file("test-task")
-            assert "phase1_test-task.json" in str(checkpoint_file)
-            assert checkpoint_file.parent == project_folder / ".state" / "research_checkpoints"
+        checkpoint_file = manager.get_checkpoint_file("test-task")
+        assert "phase1_test-task.json" in str(checkpoint_file)
+        assert checkpoint_file.parent == project_folder / ".state" / "research_checkpoints"
+
+        # Repeated lookups reuse the same path
+        assert manager.get_checkpoint_file("test-task") is checkpoint_file
+        assert manager.get_checkpoint_file("other-task").name == "phase1_other-task.json"
 
     @pytest.mark.asyncio
-    async def test_save_checkpoint_creates_file(self):
+    async def test_save_checkpoint_creates_file(self, tmp_path):
         """Verify checkpoint file is created with correct structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="test query",
+            partial_results={"findings": ["finding 1"]},
+            sources_collected=[{"title": "Source 1", "url": "http://example.com"}],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Verify file exists
+        checkpoint_file = manager.get_checkpoint_file("test-task")
+        assert checkpoint_file.exists()
+
+        # Verify content
+        checkpoint = json.loads(checkpoint_file.read_text())
+        assert checkpoint["task_name"] == "test-task"
+        assert checkpoint["query"] == "test query"
+        assert checkpoint["progress_pct"] == 30.0
+        assert checkpoint["resumable"] is True
+        assert "partial_results" in checkpoint
+        assert "sources_collected" in checkpoint
 
+    @pytest.mark.asyncio
+    async def test_save_writes_checkpoint_and_backup_in_one_batch(self, tmp_path):
+        """Verify both files of a save are written by a single worker job."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        with patch(
+            "research_checkpoint_manager._atomic_write_files",
+            wraps=research_checkpoint_manager._atomic_write_files
+        ) as mock_write:
             await manager.save_research_checkpoint(
                 task_name="test-task",
                 query="test query",
-                partial_results={"findings": ["finding 1"]},
-                sources_collected=[{"title": "Source 1", "url": "http://example.com"}],
-                progress_pct=30.0,
-                resumable=True
+                partial_results={},
+                sources_collected=[],
+                progress_pct=30.0
             )
 
-            # Verify file exists
-            checkpoint_file = manager.get_checkpoint_file("test-task")
-            assert checkpoint_file.exists()
+        mock_write.assert_called_once()
+        (checkpoint_file, checkpoint_data), (backup_file, backup_data) = mock_write.call_args.args[0]
+        assert checkpoint_file == manager.get_checkpoint_file("test-task")
+        assert backup_file.parent == manager.backup_dir
+        assert checkpoint_data == backup_data
+        assert backup_file.read_bytes() == checkpoint_file.read_bytes()
+        assert not list(manager.checkpoint_dir.glob("*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_save_encodes_off_the_event_loop(self, tmp_path):
+        """Verify slow checkpoint encoding does not block other coroutines."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
+        encode = research_checkpoint_manager.json_dumps_indent_bytes
+        ticks = []
+
+        def slow_encode(obj):
+            time.sleep(0.2)
+            return encode(obj)
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        with patch("research_checkpoint_manager.json_dumps_indent_bytes", side_effect=slow_encode):
+            start = time.perf_counter()
+            await asyncio.gather(
+                manager.save_research_checkpoint(
+                    task_name="test-task",
+                    query="query",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=30.0
+                ),
+                ticker()
+            )
 
-            # Verify content
-            checkpoint = json.loads(checkpoint_file.read_text())
-            assert checkpoint["task_name"] == "test-task"
-            assert checkpoint["query"] == "test query"
-            assert checkpoint["progress_pct"] == 30.0
-            assert checkpoint["resumable"] is True
-            assert "partial_results" in checkpoint
-            assert "sources_collected" in checkpoint
+        # All ticks ran while the encode was still sleeping in its worker thread
+        assert ticks[-1] - start < 0.2
+        assert manager.load_research_checkpoint("test-task")["query"] == "query"
 
     @pytest.mark.asyncio
-    async def test_load_checkpoint(self):
-        """Verify checkpoint can be loaded."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+    async def test_interrupted_save_keeps_previous_checkpoint(self, tmp_path):
+        """Verify a save that fails before the rename leaves the old checkpoint intact."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
+
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="query",
+            partial_results={"findings": ["first"]},
+            sources_collected=[],
+            progress_pct=15.0
+        )
+
+        with patch("research_checkpoint_manager.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                await manager.save_research_checkpoint(
+                    task_name="test-task",
+                    query="query",
+                    partial_results={"findings": ["second"]},
+                    sources_collected=[],
+                    progress_pct=30.0
+                )
+
+        checkpoint = manager.load_research_checkpoint("test-task")
+        assert checkpoint["progress_pct"] == 15.0
+        assert checkpoint["partial_results"] == {"findings": ["first"]}
+        assert not list(manager.checkpoint_dir.glob("*.tmp"))
+        assert not list(manager.backup_dir.glob("*.tmp"))
+
+    def test_writes_to_same_file_use_separate_temp_files(self, tmp_path):
+        """Verify two writes of one file in the same process never share a temp file."""
+        target = tmp_path / "checkpoint.json"
+        temp_files = []
+        replace = os.replace
+
+        def record_replace(src, dst):
+            temp_files.append(Path(src))
+            replace(src, dst)
+
+        with patch("research_checkpoint_manager.os.replace", side_effect=record_replace):
+            research_checkpoint_manager._atomic_write_files([(target, b"first")])
+            research_checkpoint_manager._atomic_write_files([(target, b"second")])
+
+        assert len(set(temp_files)) == 2
+        assert all(temp.parent == tmp_path for temp in temp_files)
+        assert target.read_bytes() == b"second"
 
-            # Save checkpoint
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    async def test_saved_checkpoint_is_readable_json(self, has_orjson, tmp_path):
+        """Verify research checkpoints stay indented UTF-8 JSON with or without orjson."""
+        if has_orjson and not research_json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        with patch.object(research_json, "HAS_ORJSON", has_orjson):
             await manager.save_research_checkpoint(
                 task_name="test-task",
-                query="test query",
+                query="Café pricing — résumé",
                 partial_results={"findings": ["finding 1"]},
                 sources_collected=[],
-                progress_pct=50.0
+                progress_pct=30.0
             )
 
-            # Load checkpoint
-            checkpoint = manager.load_research_checkpoint("test-task")
-            assert checkpoint is not None
-            assert checkpoint["task_name"] == "test-task"
-            assert checkpoint["progress_pct"] == 50.0
+        raw = manager.get_checkpoint_file("test-task").read_text(encoding="utf-8")
+        assert raw.startswith("{\n  ")
+        assert json.loads(raw)["query"] == "Café pricing — résumé"
+        assert manager.load_research_checkpoint("test-task")["query"] == "Café pricing — résumé"
 
-    def test_load_nonexistent_checkpoint(self):
+    @pytest.mark.asyncio
+    async def test_load_checkpoint(self, tmp_path):
+        """Verify checkpoint can be loaded."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Save checkpoint
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="test query",
+            partial_results={"findings": ["finding 1"]},
+            sources_collected=[],
+            progress_pct=50.0
+        )
+
+        # Load checkpoint
+        checkpoint = manager.load_research_checkpoint("test-task")
+        assert checkpoint is not None
+        assert checkpoint["task_name"] == "test-task"
+        assert checkpoint["progress_pct"] == 50.0
+
+    def test_load_nonexistent_checkpoint(self, tmp_path):
         """Verify loading nonexistent checkpoint returns None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
 
-            checkpoint = manager.load_research_checkpoint("nonexistent")
-            assert checkpoint is None
+        checkpoint = manager.load_research_checkpoint("nonexistent")
+        assert checkpoint is None
 
     @pytest.mark.asyncio
-    async def test_delete_checkpoint(self):
+    async def test_delete_checkpoint(self, tmp_path):
         """Verify checkpoint deletion."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
 
-            # Save checkpoint
-            await manager.save_research_checkpoint(
-                task_name="test-task",
-                query="test query",
-                partial_results={},
-                sources_collected=[],
-                progress_pct=30.0
-            )
+        # Save checkpoint
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="test query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+
+        # Verify exists
+        assert manager.get_checkpoint_file("test-task").exists()
 
-            # Verify exists
-            assert manager.get_checkpoint_file("test-task").exists()
+        # Delete
+        manager.delete_checkpoint("test-task")
 
-            # Delete
-            manager.delete_checkpoint("test-task")
+        # Verify deleted
+        assert not manager.get_checkpoint_file("test-task").exists()
+        assert manager.load_research_checkpoint("test-task") is None
 
-            # Verify deleted
-            assert not manager.get_checkpoint_file("test-task").exists()
+        # Deleting again is a no-op
+        manager.delete_checkpoint("test-task")
 
     @pytest.mark.asyncio
-    async def test_list_checkpoints(self):
+    async def test_list_checkpoints(self, tmp_path):
         """Verify listing checkpoints."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Create multiple checkpoints (independent tasks save concurrently)
+        await asyncio.gather(*(
+            manager.save_research_checkpoint(
+                task_name=f"task-{i}",
+                query=f"query {i}",
+                partial_results={},
+                sources_collected=[],
+                progress_pct=i * 20.0,
+                resumable=(i < 2)  # Only first two are resumable
+            )
+            for i in range(3)
+        ))
 
-            # Create multiple checkpoints
-            for i in range(3):
-                await manager.save_research_checkpoint(
-                    task_name=f"task-{i}",
-                    query=f"query {i}",
-                    partial_results={},
-                    sources_collected=[],
-                    progress_pct=i * 20.0,
-                    resumable=(i < 2)  # Only first two are resumable
-                )
+        # List all
+        checkpoints = manager.list_checkpoints()
+        assert len(checkpoints) == 3
 
-            # List all
-            checkpoints = manager.list_checkpoints()
-            assert len(checkpoints) == 3
+        # List resumable only
+        resumable = manager.list_checkpoints(resumable_only=True)
+        assert len(resumable) == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_resumable_listing_skips_parsing_filtered_files(self, tmp_path):
+        """Verify non-resumable checkpoints are filtered before parsing, nested flags are not."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
+
+        await manager.save_research_checkpoint(
+            task_name="stopped",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=False
+        )
+        await manager.save_research_checkpoint(
+            task_name="nested-flag",
+            query="query",
+            partial_results={"resumable": False},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+
+        with patch(
+            "research_checkpoint_manager.json_loads",
+            wraps=research_checkpoint_manager.json_loads
+        ) as mock_loads:
+            resumable = manager.list_checkpoints(resumable_only=True, use_cache=False)
+
+        assert [c["task_name"] for c in resumable] == ["nested-flag"]
+        assert mock_loads.call_count == 1
 
-            # List resumable only
-            resumable = manager.list_checkpoints(resumable_only=True)
-            assert len(resumable) == 2
+    @pytest.mark.asyncio
+    async def test_list_checkpoints_ignores_other_phases_and_files(self, tmp_path):
+        """Verify only this phase's checkpoint files are listed."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        await manager.save_research_checkpoint(
+            task_name="mine",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+        other_phase = ResearchCheckpointManager(project_folder, phase_num=10)
+        await other_phase.save_research_checkpoint(
+            task_name="theirs",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+
+        # Unrelated entries in the checkpoint directory
+        (manager.checkpoint_dir / "phase1_notes.txt").write_text("notes")
+        (manager.checkpoint_dir / "phase1_dir.json").mkdir()
+        (manager.checkpoint_dir / "phase1_list.json").write_text("[]")
+        (manager.checkpoint_dir / "phase1_partial.json").write_text('{"task_name": "partial"}')
+
+        checkpoints = manager.list_checkpoints()
+        assert [c["task_name"] for c in checkpoints] == ["mine"]
+        assert [c["task_name"] for c in manager.list_checkpoints(use_cache=False)] == ["mine"]
+
+        helper = ResearchResumeHelper(manager)
+        assert [t["task_name"] for t in helper.find_resumable_tasks()] == ["mine"]
+        assert [t["task_name"] for t in await helper.find_resumable_tasks_async()] == ["mine"]
 
     @pytest.mark.asyncio
-    async def test_build_resume_prompt(self):
+    async def test_build_resume_prompt(self, tmp_path):
         """Verify resume prompt generation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Save checkpoint
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="Original research query",
+            partial_results={"findings": ["Finding 1", "Finding 2"]},
+            sources_collected=[{"title": "Source 1", "url": "http://example.com"}],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Build resume prompt
+        prompt = manager.build_resume_prompt("test-task")
+
+        assert prompt is not None
+        assert "CONTINUE" in prompt
+        assert "Original research query" in prompt
+        assert "30" in prompt and "%" in prompt
+        assert "Finding 1" in prompt
 
-            # Save checkpoint
-            await manager.save_research_checkpoint(
-                task_name="test-task",
-                query="Original research query",
-                partial_results={"findings": ["Finding 1", "Finding 2"]},
-                sources_collected=[{"title": "Source 1", "url": "http://example.com"}],
-                progress_pct=30.0,
-                resumable=True
-            )
+    @pytest.mark.asyncio
+    async def test_build_resume_prompt_keeps_braces_in_query(self, tmp_path):
+        """Verify template placeholders inside checkpoint data are not expanded."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
 
-            # Build resume prompt
-            prompt = manager.build_resume_prompt("test-task")
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="Compare {progress_pct} and {query} literally",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
 
-            assert prompt is not None
-            assert "CONTINUE" in prompt
-            assert "Original research query" in prompt
-            assert "30" in prompt and "%" in prompt
-            assert "Finding 1" in prompt
+        prompt = manager.build_resume_prompt("test-task")
 
-    @pytest.mark.asyncio
-    async def test_build_resume_prompt_non_resumable(self):
-        """Verify resume prompt returns None for non-resumable checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        assert "## Original Query\nCompare {progress_pct} and {query} literally\n" in prompt
+        assert "Based on the 30.0% completion:" in prompt
 
-            # Save non-resumable checkpoint
-            await manager.save_research_checkpoint(
-                task_name="test-task",
-                query="query",
-                partial_results={},
-                sources_collected=[],
-                progress_pct=80.0,
-                resumable=False
-            )
+    @pytest.mark.asyncio
+    async def test_build_resume_prompt_preview_is_prefix(self, tmp_path):
+        """Verify the preview matches the start of the full prompt without rendering it all."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="Original research query",
+            partial_results={"findings": [f"Finding {i}" for i in range(200)]},
+            sources_collected=[{"title": "Source 1", "url": "http://example.com"}],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        checkpoint = manager.load_research_checkpoint("test-task")
+        prompt = manager.build_resume_prompt("test-task", checkpoint)
+
+        for max_chars in (0, 100, 500, len(prompt) + 10):
+            preview = manager.build_resume_prompt_preview("test-task", checkpoint, max_chars=max_chars)
+            assert preview == prompt[:max_chars]
+
+        # Partial results sit past the first section, so a short preview skips serializing them
+        with patch("research_checkpoint_manager.json.dumps") as mock_dumps:
+            manager.build_resume_prompt_preview("test-task", checkpoint, max_chars=100)
+            mock_dumps.assert_not_called()
 
-            # Build resume prompt
-            prompt = manager.build_resume_prompt("test-task")
-            assert prompt is None
+    @pytest.mark.asyncio
+    async def test_verify_resume_continuation(self, tmp_path):
+        """Verify overlap detection with loaded, passed-in and pre-keyed sources."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        old_sources = [{"title": f"Old {i}", "url": f"http://old/{i}"} for i in range(4)]
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="query",
+            partial_results={},
+            sources_collected=old_sources,
+            progress_pct=30.0
+        )
+        checkpoint = manager.load_research_checkpoint("test-task")
+
+        continued = {"sources": [old_sources[0], {"title": "New", "url": "http://new/1"}]}
+        restarted = {"sources": old_sources[:3]}
+
+        report = manager.verify_resume_continuation("test-task", continued)
+        assert report["verified"] is True
+        assert report["overlap_pct"] == 25.0
+        assert report["unique_new_sources"] == 1
+
+        assert manager.verify_resume_continuation("test-task", restarted)["verified"] is False
+
+        # Works after the checkpoint is deleted when the caller kept it
+        manager.delete_checkpoint("test-task")
+        assert manager.verify_resume_continuation("test-task", continued)["verified"] is False
+        keyed = manager.verify_resume_continuation(
+            "test-task",
+            {},
+            checkpoint=checkpoint,
+            old_urls=manager.source_keys(old_sources),
+            new_urls=manager.source_keys(continued["sources"])
+        )
+        assert keyed == {**report, "elapsed_min": keyed["elapsed_min"]}
 
-    def test_should_create_checkpoint(self):
+    @pytest.mark.asyncio
+    async def test_build_resume_prompt_non_resumable(self, tmp_path):
+        """Verify resume prompt returns None for non-resumable checkpoint."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Save non-resumable checkpoint
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=80.0,
+            resumable=False
+        )
+
+        # Build resume prompt
+        prompt = manager.build_resume_prompt("test-task")
+        assert prompt is None
+
+    def test_should_create_checkpoint(self, tmp_path):
         """Verify checkpoint decision logic."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
-
-            # Test at 15 minutes (should checkpoint)
-            should_cp, pct, phase, resumable = manager.should_create_checkpoint(
-                elapsed_sec=900,
-                estimated_duration_sec=3600
-            )
-            assert should_cp is True
-            assert pct == 15
-            assert resumable is True
-
-            # Test at 50 minutes (should checkpoint)
-            should_cp, pct, phase, resumable = manager.should_create_checkpoint(
-                elapsed_sec=3000,
-                estimated_duration_sec=3600
-            )
-            assert should_cp is True
-            assert pct == 50
-            assert resumable is True
-
-            # Test at 60 minutes (should checkpoint but not resumable)
-            should_cp, pct, phase, resumable = manager.should_create_checkpoint(
-                elapsed_sec=3600,
-                estimated_duration_sec=3600
-            )
-            assert should_cp is True
-            assert pct == 75
-            assert resumable is False
-
-            # Test at random time (should not checkpoint)
-            should_cp, pct, phase, resumable = manager.should_create_checkpoint(
-                elapsed_sec=2000,
-                estimated_duration_sec=3600
-            )
-            assert should_cp is False
-
-    def test_get_resume_estimate(self):
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Test at 15 minutes (should checkpoint)
+        should_cp, pct, phase, resumable = manager.should_create_checkpoint(
+            elapsed_sec=900,
+            estimated_duration_sec=3600
+        )
+        assert should_cp is True
+        assert pct == 15
+        assert resumable is True
+
+        # Test at 50 minutes (should checkpoint)
+        should_cp, pct, phase, resumable = manager.should_create_checkpoint(
+            elapsed_sec=3000,
+            estimated_duration_sec=3600
+        )
+        assert should_cp is True
+        assert pct == 50
+        assert resumable is True
+
+        # Test at 60 minutes (should checkpoint but not resumable)
+        should_cp, pct, phase, resumable = manager.should_create_checkpoint(
+            elapsed_sec=3600,
+            estimated_duration_sec=3600
+        )
+        assert should_cp is True
+        assert pct == 75
+        assert resumable is False
+
+        # Test at random time (should not checkpoint)
+        should_cp, pct, phase, resumable = manager.should_create_checkpoint(
+            elapsed_sec=2000,
+            estimated_duration_sec=3600
+        )
+        assert should_cp is False
+
+    def test_should_create_checkpoint_matches_linear_scan(self, tmp_path):
+        """Verify the bisect lookup picks the same entry as scanning the schedule in order."""
+        config = ResearchConfig(checkpoint_schedule=[
+            CheckpointScheduleEntry(600, 20.0, "late", True),
+            CheckpointScheduleEntry(540, 10.0, "early", True),
+            CheckpointScheduleEntry(1800, 60.0, "final", False),
+        ])
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1, config=config)
+
+        def linear_scan(elapsed_sec):
+            for target_time, pct, phase, resumable in config.get_checkpoint_schedule_tuples():
+                if abs(elapsed_sec - target_time) < 60:
+                    return (True, pct, phase, resumable)
+            return (False, elapsed_sec / 3600 * 100, "in-progress", True)
+
+        for elapsed_sec in range(0, 2000, 5):
+            assert manager.should_create_checkpoint(elapsed_sec, 3600) == linear_scan(elapsed_sec)
+
+    def test_get_resume_estimate(self, tmp_path):
         """Verify time estimate calculation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+
+        # Test for 30% checkpoint
+        checkpoint = {
+            "progress_pct": 30,
+            "created_at": datetime.now().isoformat()
+        }
+
+        estimate = manager.get_resume_estimate(checkpoint)
+        assert estimate["time_invested_min"] == 30
+        assert estimate["time_remaining_min"] == 30
+        assert estimate["time_saved_min"] == 30
+
+    def test_get_resume_estimate_all_checkpoints(self, tmp_path):
+        """Verify estimates for every checkpoint stage and unknown progress."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
+        created_at = datetime.now().isoformat()
+
+        expected = {15: (15, 45), 30.0: (30, 30), 50: (50, 10), 42: (0, 60)}
+        for progress_pct, (invested, remaining) in expected.items():
+            checkpoint = {"progress_pct": progress_pct, "created_at": created_at}
+            estimate = manager.get_resume_estimate(checkpoint)
+            assert estimate["time_invested_min"] == invested
+            assert estimate["time_remaining_min"] == remaining
+            assert estimate["time_saved_min"] == invested
+            assert "_estimate_cache" not in checkpoint
 
-            # Test for 30% checkpoint
-            checkpoint = {
-                "progress_pct": 30,
-                "created_at": datetime.now().isoformat()
-            }
+    @pytest.mark.asyncio
+    async def test_save_and_estimate_share_one_timestamp(self, tmp_path):
+        """Verify created_at matches the backup name and estimates honor a given now."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
 
-            estimate = manager.get_resume_estimate(checkpoint)
-            assert estimate["time_invested_min"] == 30
-            assert estimate["time_remaining_min"] == 30
-            assert estimate["time_saved_min"] == 30
+        await manager.save_research_checkpoint(
+            task_name="test-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+
+        checkpoint = manager.load_research_checkpoint("test-task")
+        created_at = datetime.fromisoformat(checkpoint["created_at"])
+        [backup_file] = manager.backup_dir.glob("phase1_test-task_*.json")
+        assert backup_file.stem.endswith(f"_{int(created_at.timestamp())}")
+
+        estimate = manager.get_resume_estimate(checkpoint, now=created_at + timedelta(hours=3))
+        assert estimate["checkpoint_age_hours"] == 3
 
 
 class TestResearchResumeHelper:
     """Tests for ResearchResumeHelper class."""
 
     @pytest.mark.asyncio
-    async def test_find_resumable_tasks(self):
+    async def test_find_resumable_tasks(self, tmp_path):
         """Verify finding resumable tasks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
-            helper = ResearchResumeHelper(manager)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        # Create resumable checkpoint
+        await manager.save_research_checkpoint(
+            task_name="task1",
+            query="query 1",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Create non-resumable checkpoint
+        await manager.save_research_checkpoint(
+            task_name="task2",
+            query="query 2",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=80.0,
+            resumable=False
+        )
+
+        # Find resumable
+        resumable = helper.find_resumable_tasks()
+        assert len(resumable) == 1
+        assert resumable[0]["task_name"] == "task1"
 
-            # Create resumable checkpoint
-            await manager.save_research_checkpoint(
-                task_name="task1",
-                query="query 1",
+    @pytest.mark.asyncio
+    async def test_find_resumable_tasks_async_matches_sync(self, tmp_path):
+        """Verify concurrent discovery returns the same tasks as the sync path."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        await asyncio.gather(*(
+            manager.save_research_checkpoint(
+                task_name=f"task{i}",
+                query=f"query {i}",
                 partial_results={},
                 sources_collected=[],
-                progress_pct=30.0,
-                resumable=True
+                progress_pct=pct,
+                resumable=resumable
             )
+            for i, (pct, resumable) in enumerate([(15.0, True), (30.0, True), (80.0, False)])
+        ))
 
-            # Create non-resumable checkpoint
-            await manager.save_research_checkpoint(
-                task_name="task2",
-                query="query 2",
-                partial_results={},
-                sources_collected=[],
-                progress_pct=80.0,
-                resumable=False
-            )
+        # Corrupted checkpoint is skipped
+        (manager.checkpoint_dir / "phase1_broken.json").write_text("{not json")
 
-            # Find resumable
+        found = await helper.find_resumable_tasks_async()
+        assert {task["task_name"] for task in found} == {"task0", "task1"}
+        sync_found = helper.find_resumable_tasks()
+        assert [task["task_name"] for task in found] == [task["task_name"] for task in sync_found]
+        assert found[0]["time_saved_min"] == sync_found[0]["time_saved_min"]
+
+    @pytest.mark.asyncio
+    async def test_find_resumable_tasks_parses_each_checkpoint_once(self, tmp_path):
+        """Verify listing and estimating share one parse per unchanged checkpoint."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        await manager.save_research_checkpoint(
+            task_name="cached-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        with patch(
+            "research_checkpoint_manager.json_loads",
+            wraps=research_checkpoint_manager.json_loads
+        ) as mock_load:
             resumable = helper.find_resumable_tasks()
-            assert len(resumable) == 1
-            assert resumable[0]["task_name"] == "task1"
+
+        assert len(resumable) == 1
+        assert mock_load.call_count == 1
+
+        # Rewriting the checkpoint invalidates the cached parse
+        checkpoint = manager.load_research_checkpoint("cached-task")
+        checkpoint["progress_pct"] = 15
+        manager.get_checkpoint_file("cached-task").write_text(json.dumps(checkpoint, indent=4))
+
+        resumable = helper.find_resumable_tasks()
+        assert resumable[0]["progress_pct"] == 15
+
+        # Each checkpoint file is read (stat + cache lookup) once per discovery
+        with patch.object(
+            manager, "_read_checkpoint_file", wraps=manager._read_checkpoint_file
+        ) as mock_read:
+            helper.find_resumable_tasks()
+        assert mock_read.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_should_auto_resume_recent(self):
+    async def test_should_auto_resume_recent(self, tmp_path):
         """Verify auto-resume for recent checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
-            helper = ResearchResumeHelper(manager)
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        # Create recent checkpoint
+        await manager.save_research_checkpoint(
+            task_name="recent-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Should auto-resume
+        should_resume = helper.should_auto_resume("recent-task", max_age_hours=24)
+        assert should_resume is True
 
-            # Create recent checkpoint
-            await manager.save_research_checkpoint(
-                task_name="recent-task",
-                query="query",
-                partial_results={},
-                sources_collected=[],
-                progress_pct=30.0,
-                resumable=True
-            )
+    @pytest.mark.asyncio
+    async def test_should_auto_resume_old(self, tmp_path):
+        """Verify auto-resume rejects old checkpoint."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        # Create checkpoint
+        await manager.save_research_checkpoint(
+            task_name="old-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Manually edit timestamp to be old
+        checkpoint = manager.load_research_checkpoint("old-task")
+        old_time = (datetime.now() - timedelta(hours=48)).isoformat()
+        checkpoint["created_at"] = old_time
+
+        checkpoint_file = manager.get_checkpoint_file("old-task")
+        checkpoint_file.write_bytes(research_json.json_dumps_bytes(checkpoint))
+
+        # Should NOT auto-resume
+        should_resume = helper.should_auto_resume("old-task", max_age_hours=24)
+        assert should_resume is False
 
-            # Should auto-resume
-            should_resume = helper.should_auto_resume("recent-task", max_age_hours=24)
-            assert should_resume is True
+    @pytest.mark.asyncio
+    async def test_should_auto_resume_rejects_stale_file_without_loading(self, tmp_path):
+        """Verify a checkpoint file older than the cutoff is rejected from its mtime alone."""
+        manager = ResearchCheckpointManager(tmp_path, phase_num=1)
+        helper = ResearchResumeHelper(manager)
+
+        await manager.save_research_checkpoint(
+            task_name="stale-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0
+        )
+        old_ts = (datetime.now() - timedelta(hours=48)).timestamp()
+        os.utime(manager.get_checkpoint_file("stale-task"), (old_ts, old_ts))
+
+        with patch.object(manager, "load_research_checkpoint", side_effect=AssertionError("parsed")):
+            assert helper.should_auto_resume("stale-task", max_age_hours=24) is False
+            assert helper.should_auto_resume("missing-task") is False
 
     @pytest.mark.asyncio
-    async def test_should_auto_resume_old(self):
-        """Verify auto-resume rejects old checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
-            helper = ResearchResumeHelper(manager)
+    async def test_decide_uses_loaded_checkpoint(self, tmp_path):
+        """Verify decide returns the resume estimate without reloading."""
+        project_folder = tmp_path
+        manager = ResearchCheckpointManager(project_folder, phase_num=1)
+        helper = ResearchResumeHelper(manager)
 
-            # Create checkpoint
-            await manager.save_research_checkpoint(
-                task_name="old-task",
-                query="query",
-                partial_results={},
-                sources_collected=[],
-                progress_pct=30.0,
-                resumable=True
-            )
+        await manager.save_research_checkpoint(
+            task_name="loaded-task",
+            query="query",
+            partial_results={},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+        checkpoint = manager.load_research_checkpoint("loaded-task")
 
-            # Manually edit timestamp to be old
-            checkpoint = manager.load_research_checkpoint("old-task")
-            old_time = (datetime.now() - timedelta(hours=48)).isoformat()
-            checkpoint["created_at"] = old_time
+        with patch.object(manager, "load_research_checkpoint") as mock_load:
+            should_resume, estimate = helper.decide(checkpoint, max_age_hours=24)
 
-            checkpoint_file = manager.get_checkpoint_file("old-task")
-            checkpoint_file.write_text(json.dumps(checkpoint))
+        mock_load.assert_not_called()
+        assert should_resume is True
+        assert estimate["time_saved_min"] == 30
 
-            # Should NOT auto-resume
-            should_resume = helper.should_auto_resume("old-task", max_age_hours=24)
-            assert should_resume is False
+        # Missing checkpoint yields no estimate
+        assert helper.decide(None) == (False, None)
 
 
 # ============================================================================
 # Pattern 5: Resumable Research Executor Tests
 # ============================================================================
 
+@pytest.fixture
+def executor_factory(tmp_path):
+    """Build phase 1 executors for the test's tmp_path project folder."""
+    def make(**kwargs):
+        return ResumableResearchExecutor(tmp_path, phase_num=1, **kwargs)
+    return make
+
+
 class TestResumableResearchExecutor:
     """Tests for ResumableResearchExecutor class."""
 
     @pytest.mark.asyncio
-    async def test_executor_initialization(self):
+    async def test_executor_initialization(self, executor_factory, tmp_path):
         """Verify executor initializes correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            executor = ResumableResearchExecutor(project_folder, phase_num=1)
+        executor = executor_factory()
 
-            assert executor.project_folder == project_folder
-            assert executor.phase_num == 1
-            assert executor.auto_resume is True
-            assert executor.checkpoint_mgr is not None
-            assert executor.error_handler is not None
+        assert executor.project_folder == tmp_path
+        assert executor.phase_num == 1
+        assert executor.auto_resume is True
+        assert executor.checkpoint_mgr is not None
+        assert executor.error_handler is not None
 
     @pytest.mark.asyncio
-    async def test_execute_simple_research(self):
+    async def test_execute_simple_research(self, executor_factory):
         """Verify executing simple research."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            executor = ResumableResearchExecutor(project_folder, phase_num=1)
+        executor = executor_factory()
 
-            # Simple research function
-            async def simple_research():
-                return {"findings": ["test finding"]}
+        # Simple research function
+        async def simple_research():
+            return {"findings": ["test finding"]}
 
-            result = await executor.execute(
-                task_name="simple-test",
-                query="test query",
-                provider="test_provider",
-                estimated_duration_sec=10,
-                research_func=simple_research
-            )
+        result = await executor.execute(
+            task_name="simple-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=simple_research
+        )
 
-            assert "findings" in result
-            assert result["findings"] == ["test finding"]
+        assert "findings" in result
+        assert result["findings"] == ["test finding"]
 
-            # Verify stats
-            stats = executor.get_stats()
-            assert stats["tasks_executed"] == 1
-            assert stats["tasks_completed"] == 1
+        # Verify stats
+        stats = executor.get_stats()
+        assert stats["tasks_executed"] == 1
+        assert stats["tasks_completed"] == 1
 
     @pytest.mark.asyncio
-    async def test_execute_with_resume(self):
+    async def test_execute_with_resume(self, executor_factory):
         """Verify research resumes from checkpoint."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
+        # Create executor and pre-save a checkpoint
+        executor = executor_factory(auto_resume=True)
+        manager = ResearchCheckpointManager(executor.project_folder, phase_num=1)
+        await manager.save_research_checkpoint(
+            task_name="resumable-test",
+            query="original query",
+            partial_results={"findings": ["partial finding"]},
+            sources_collected=[],
+            progress_pct=30.0,
+            resumable=True
+        )
+
+        # Execute with auto-resume
+        async def research_func():
+            return {"findings": ["completed finding"]}
+
+        result = await executor.execute(
+            task_name="resumable-test",
+            query="new query",  # This will be replaced with resume prompt
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=research_func
+        )
+
+        # Verify result
+        assert "findings" in result
+
+        # Verify stats
+        stats = executor.get_stats()
+        assert stats["tasks_resumed"] == 1
+        assert stats["total_time_saved_min"] > 0
 
-            # Create executor and pre-save a checkpoint
-            manager = ResearchCheckpointManager(project_folder, phase_num=1)
-            await manager.save_research_checkpoint(
-                task_name="resumable-test",
-                query="original query",
-                partial_results={"findings": ["partial finding"]},
-                sources_collected=[],
-                progress_pct=30.0,
-                resumable=True
-            )
+    @pytest.mark.asyncio
+    async def test_execute_delivers_progress_events(self, executor_factory):
+        """Verify checkpoint events reach on_progress without blocking research."""
+        config = ResearchConfig(checkpoint_schedule=[
+            CheckpointScheduleEntry(0, 15, "Gathering sources", True),
+            CheckpointScheduleEntry(0, 30, "Analyzing literature", True),
+        ])
+        executor = executor_factory(config=config)
+        received = []
+
+        async def slow_progress(event_type, data):
+            await asyncio.sleep(0.05)
+            received.append((event_type, data["phase"]))
+
+        async def research_func():
+            await asyncio.sleep(0.1)
+            return {"findings": ["done"]}
+
+        result = await executor.execute(
+            task_name="progress-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=research_func,
+            on_progress=slow_progress
+        )
+
+        assert result["findings"] == ["done"]
+        # Queued events are drained before execute() returns
+        assert received == [
+            ("checkpoint", "Gathering sources"),
+            ("checkpoint", "Analyzing literature"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backlogged_progress_events_are_batched(self, executor_factory):
+        """Verify events queued behind a busy callback arrive as one batch."""
+        executor = executor_factory()
+        calls = []
+
+        async def on_progress(event_type, data):
+            calls.append((event_type, data))
+
+        events = asyncio.Queue()
+        for pct in (15, 30, 50):
+            events.put_nowait(("checkpoint", {"progress_pct": pct}))
+        events.put_nowait(None)
 
-            # Execute with auto-resume
-            executor = ResumableResearchExecutor(project_folder, phase_num=1, auto_resume=True)
+        await executor._drain_progress_events(events, on_progress)
 
-            async def research_func():
-                return {"findings": ["completed finding"]}
+        assert len(calls) == 1
+        event_type, data = calls[0]
+        assert event_type == "batch"
+        assert [d["progress_pct"] for _, d in data["events"]] == [15, 30, 50]
 
-            result = await executor.execute(
-                task_name="resumable-test",
-                query="new query",  # This will be replaced with resume prompt
+    @pytest.mark.asyncio
+    async def test_cancelled_execute_marks_progress_failed(self, executor_factory):
+        """Verify cancellation is recorded instead of leaving research 'running'."""
+        executor = executor_factory()
+        events = []
+
+        async def on_progress(event_type, data):
+            events.append((event_type, data))
+
+        async def endless_research():
+            await asyncio.sleep(3600)
+
+        task = asyncio.create_task(executor.execute(
+            task_name="cancelled-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=endless_research,
+            on_progress=on_progress
+        ))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        progress_files = list(executor.project_folder.glob(".research-progress-*.json"))
+        assert len(progress_files) == 1
+        progress = json.loads(progress_files[0].read_text())
+        assert progress["status"] == "failed"
+        assert progress["error_type"] == "cancelled"
+        assert events == [("error", {"task_name": "cancelled-test", "error": "cancelled"})]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cancel_again", [False, True])
+    async def test_cancel_with_stuck_callback_stops_consumer(self, executor_factory, cancel_again):
+        """Verify a hung progress callback neither blocks cancellation nor outlives it."""
+        executor = executor_factory()
+        callback_entered = asyncio.Event()
+
+        async def stuck_on_progress(event_type, data):
+            callback_entered.set()
+            await asyncio.Event().wait()
+
+        async def endless_research():
+            await asyncio.sleep(3600)
+
+        before = asyncio.all_tasks()
+        task = asyncio.create_task(executor.execute(
+            task_name="stuck-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=endless_research,
+            on_progress=stuck_on_progress
+        ))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        if cancel_again:
+            await callback_entered.wait()
+            task.cancel()
+
+        done, _ = await asyncio.wait([task], timeout=resumable_research.PROGRESS_DRAIN_TIMEOUT_SEC + 1)
+        assert task in done
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The progress consumer was cancelled and finished, not left behind
+        assert asyncio.all_tasks() <= before
+
+    @pytest.mark.asyncio
+    async def test_execute_with_failure(self, executor_factory):
+        """Verify research handles failure correctly."""
+        executor = executor_factory()
+
+        # Research function that fails
+        async def failing_research():
+            raise Exception("Research failed")
+
+        with pytest.raises(Exception, match="Research failed"):
+            await executor.execute(
+                task_name="failing-test",
+                query="test query",
                 provider="test_provider",
                 estimated_duration_sec=10,
-                research_func=research_func
+                research_func=failing_research
             )
 
-            # Verify result
-            assert "findings" in result
-
-            # Verify stats
-            stats = executor.get_stats()
-            assert stats["tasks_resumed"] == 1
-            assert stats["total_time_saved_min"] > 0
+        # Verify stats
+        stats = executor.get_stats()
+        assert stats["tasks_failed"] == 1
 
     @pytest.mark.asyncio
-    async def test_execute_with_failure(self):
-        """Verify research handles failure correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            executor = ResumableResearchExecutor(project_folder, phase_num=1)
-
-            # Research function that fails
-            async def failing_research():
-                raise Exception("Research failed")
-
-            with pytest.raises(Exception, match="Research failed"):
-                await executor.execute(
-                    task_name="failing-test",
-                    query="test query",
-                    provider="test_provider",
-                    estimated_duration_sec=10,
-                    research_func=failing_research
-                )
+    async def test_execute_with_failed_status_result(self, executor_factory):
+        """Verify a {"success": False} result is counted as failed without raising."""
+        executor = executor_factory()
+
+        async def rate_limited_research():
+            return {"success": False, "error": "429 rate limit exceeded"}
+
+        result = await executor.execute(
+            task_name="soft-failing-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=rate_limited_research
+        )
 
-            # Verify stats
-            stats = executor.get_stats()
-            assert stats["tasks_failed"] == 1
+        assert result == {"success": False, "error": "429 rate limit exceeded"}
+        stats = executor.get_stats()
+        assert stats["tasks_failed"] == 1
+        assert stats["tasks_completed"] == 0
+
+        [progress_file] = executor.project_folder.glob(".research-progress-*.json")
+        progress = json.loads(progress_file.read_text())
+        assert progress["status"] == "failed"
+        assert progress["error_type"] == "rate_limit"
 
 
 # ============================================================================
@@ -464,119 +1062,212 @@ class TestResumableResearchExecutor:
 class TestEnhancedCheckpointManager:
     """Tests for enhanced checkpoint manager with research task tracking."""
 
-    def test_save_checkpoint_with_research_tasks(self):
+    def test_save_checkpoint_with_research_tasks(self, tmp_path):
         """Verify checkpoint saves research task status."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-
-            research_tasks = {
-                "task1": "completed",
-                "task2": "failed",
-                "task3": "skipped"
-            }
-
+        project_folder = tmp_path
+
+        research_tasks = {
+            "task1": "completed",
+            "task2": "failed",
+            "task3": "skipped"
+        }
+
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=1,
+            research_tasks=research_tasks
+        )
+
+        # Load and verify
+        checkpoint = checkpoint_manager.load_checkpoint(project_folder)
+        assert "research_tasks" in checkpoint
+        assert "phase_1" in checkpoint["research_tasks"]
+        assert checkpoint["research_tasks"]["phase_1"]["tasks"] == research_tasks
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_checkpoint_file_is_readable_json(self, has_orjson, tmp_path):
+        """Verify checkpoints stay indented UTF-8 JSON with or without orjson."""
+        if has_orjson and not research_json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        project_folder = tmp_path
+
+        with patch.object(research_json, "HAS_ORJSON", has_orjson):
             checkpoint_manager.save_checkpoint(
                 project_folder=project_folder,
-                phase_num=1,
-                research_tasks=research_tasks
+                phase_num=2,
+                context_summary="Café pricing — résumé"
             )
-
-            # Load and verify
             checkpoint = checkpoint_manager.load_checkpoint(project_folder)
-            assert "research_tasks" in checkpoint
-            assert "phase_1" in checkpoint["research_tasks"]
-            assert checkpoint["research_tasks"]["phase_1"]["tasks"] == research_tasks
 
-    def test_get_research_task_status(self):
-        """Verify getting research task status."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
+        raw = checkpoint_manager.get_checkpoint_path(project_folder).read_text(encoding="utf-8")
+        assert raw.startswith("{\n  ")
+        assert json.loads(raw) == checkpoint
+        assert checkpoint["context_summary"] == "Café pricing — résumé"
 
-            research_tasks = {
-                "task1": "completed",
-                "task2": "failed"
-            }
-
-            checkpoint_manager.save_checkpoint(
-                project_folder=project_folder,
-                phase_num=1,
-                research_tasks=research_tasks
-            )
-
-            # Get status
-            status = checkpoint_manager.get_research_task_status(project_folder, phase_num=1)
-            assert "tasks" in status
-            assert status["tasks"]["task1"] == "completed"
-            assert status["tasks"]["task2"] == "failed"
-
-    def test_has_failed_research_tasks(self):
+    def test_get_research_task_status(self, tmp_path):
+        """Verify getting research task status."""
+        project_folder = tmp_path
+
+        research_tasks = {
+            "task1": "completed",
+            "task2": "failed"
+        }
+
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=1,
+            research_tasks=research_tasks
+        )
+
+        # Get status
+        status = checkpoint_manager.get_research_task_status(project_folder, phase_num=1)
+        assert "tasks" in status
+        assert status["tasks"]["task1"] == "completed"
+        assert status["tasks"]["task2"] == "failed"
+
+    def test_has_failed_research_tasks(self, tmp_path):
         """Verify checking for failed tasks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
+        project_folder = tmp_path
 
-            research_tasks = {
-                "task1": "completed",
-                "task2": "failed"
-            }
+        research_tasks = {
+            "task1": "completed",
+            "task2": "failed"
+        }
 
-            checkpoint_manager.save_checkpoint(
-                project_folder=project_folder,
-                phase_num=1,
-                research_tasks=research_tasks
-            )
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=1,
+            research_tasks=research_tasks
+        )
 
-            # Check for failures
-            has_failures = checkpoint_manager.has_failed_research_tasks(project_folder, 1)
-            assert has_failures is True
+        # Check for failures
+        has_failures = checkpoint_manager.has_failed_research_tasks(project_folder, 1)
+        assert has_failures is True
 
-    def test_get_failed_research_tasks(self):
+    def test_get_failed_research_tasks(self, tmp_path):
         """Verify getting list of failed tasks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-
-            research_tasks = {
-                "task1": "completed",
-                "task2": "failed",
-                "task3": "failed",
-                "task4": "skipped"
-            }
-
-            checkpoint_manager.save_checkpoint(
-                project_folder=project_folder,
-                phase_num=1,
-                research_tasks=research_tasks
-            )
-
-            # Get failed tasks
-            failed = checkpoint_manager.get_failed_research_tasks(project_folder, 1)
-            assert len(failed) == 2
-            assert "task2" in failed
-            assert "task3" in failed
-
-    def test_generate_resume_context_with_research_tasks(self):
+        project_folder = tmp_path
+
+        research_tasks = {
+            "task1": "completed",
+            "task2": "failed",
+            "task3": "failed",
+            "task4": "skipped"
+        }
+
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=1,
+            research_tasks=research_tasks
+        )
+
+        # Get failed tasks
+        failed = checkpoint_manager.get_failed_research_tasks(project_folder, 1)
+        assert len(failed) == 2
+        assert "task2" in failed
+        assert "task3" in failed
+
+    def test_failed_research_tasks_use_index(self, tmp_path):
+        """Verify failed-task queries read the index and fall back without it."""
+        checkpoint_manager.save_checkpoint(
+            project_folder=tmp_path,
+            phase_num=1,
+            research_tasks={"task1": "failed", "task2": "completed"}
+        )
+        checkpoint_manager.save_checkpoint(
+            project_folder=tmp_path,
+            phase_num=2,
+            research_tasks={"task3": "completed"}
+        )
+
+        with patch.object(checkpoint_manager, "load_checkpoint", side_effect=AssertionError("full load")):
+            assert checkpoint_manager.has_failed_research_tasks(tmp_path, 1) is True
+            assert checkpoint_manager.get_failed_research_tasks(tmp_path, 1) == ["task1"]
+            assert checkpoint_manager.has_failed_research_tasks(tmp_path, 2) is False
+            assert checkpoint_manager.get_failed_research_tasks(tmp_path, 2) == []
+
+        # Checkpoints written before the index existed still work
+        checkpoint_manager.get_failed_research_index_path(tmp_path, 1).unlink()
+        assert checkpoint_manager.has_failed_research_tasks(tmp_path, 1) is True
+        assert checkpoint_manager.get_failed_research_tasks(tmp_path, 1) == ["task1"]
+
+    def test_failed_research_index_ignored_without_checkpoint(self, tmp_path):
+        """Verify a leftover index does not outlive its checkpoint."""
+        checkpoint_manager.save_checkpoint(
+            project_folder=tmp_path,
+            phase_num=1,
+            research_tasks={"a": "failed"}
+        )
+        checkpoint_manager.get_checkpoint_path(tmp_path).unlink()
+
+        assert checkpoint_manager.has_failed_research_tasks(tmp_path, 1) is False
+        assert checkpoint_manager.get_failed_research_tasks(tmp_path, 1) == []
+
+    def test_stale_failed_research_index_ignored(self, tmp_path):
+        """Verify an index older than the checkpoint falls back to the checkpoint."""
+        checkpoint_manager.save_checkpoint(
+            project_folder=tmp_path,
+            phase_num=1,
+            research_tasks={"a": "failed"}
+        )
+        # Checkpoint rewritten after the index, e.g. a crash before the index write
+        checkpoint_path = checkpoint_manager.get_checkpoint_path(tmp_path)
+        checkpoint = json.loads(checkpoint_path.read_text())
+        checkpoint["research_tasks"]["phase_1"]["tasks"] = {"a": "completed"}
+        checkpoint_path.write_text(json.dumps(checkpoint))
+        index_path = checkpoint_manager.get_failed_research_index_path(tmp_path, 1)
+        stale_ns = checkpoint_path.stat().st_mtime_ns - 1_000_000_000
+        os.utime(index_path, ns=(stale_ns, stale_ns))
+
+        assert checkpoint_manager.has_failed_research_tasks(tmp_path, 1) is False
+        assert checkpoint_manager.get_failed_research_tasks(tmp_path, 1) == []
+
+    def test_generate_resume_context_with_research_tasks(self, tmp_path):
         """Verify resume context includes research tasks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-
-            research_tasks = {
-                "task1": "completed",
-                "task2": "failed"
-            }
-
-            checkpoint_manager.save_checkpoint(
-                project_folder=project_folder,
-                phase_num=1,
-                research_tasks=research_tasks
-            )
-
-            # Generate context
-            context = checkpoint_manager.generate_resume_context(project_folder)
-
-            assert "Research Task Status" in context
-            assert "task1" in context
-            assert "task2" in context
-            assert "completed" in context
-            assert "failed" in context
+        project_folder = tmp_path
+
+        research_tasks = {
+            "task1": "completed",
+            "task2": "failed"
+        }
+
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=1,
+            research_tasks=research_tasks
+        )
+
+        # Generate context
+        context = checkpoint_manager.generate_resume_context(project_folder)
+
+        assert "Research Task Status" in context
+        assert "task1" in context
+        assert "task2" in context
+        assert "completed" in context
+        assert "failed" in context
+
+    def test_generate_resume_context_lines(self, tmp_path):
+        """Verify decisions, task icons and the output list cap render as lines."""
+        for i in range(22):
+            (tmp_path / f"doc{i:02d}.md").write_text("content")
+
+        checkpoint_manager.save_checkpoint(
+            project_folder=tmp_path,
+            phase_num=1,
+            key_decisions=["Use Postgres"],
+            research_tasks={"task1": "completed", "task2": "failed", "task3": "skipped"}
+        )
+
+        lines = checkpoint_manager.generate_resume_context(tmp_path).split("\n")
+
+        assert "- Use Postgres" in lines
+        assert "- ✅ task1: completed" in lines
+        assert "- ❌ task2: failed" in lines
+        assert "- ⏭️ task3: skipped" in lines
+        assert "- doc19.md" in lines
+        assert "- doc20.md" not in lines
+        assert lines[-1] == "- ... and 2 more files"
 
 
 # ============================================================================
@@ -587,41 +1278,44 @@ class TestCheckpointSystemIntegration:
     """Integration tests for the complete checkpoint system."""
 
     @pytest.mark.asyncio
-    async def test_full_checkpoint_workflow(self):
+    async def test_full_checkpoint_workflow(self, tmp_path):
         """Test complete workflow: execute -> checkpoint -> resume."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-
-            # Phase 1: Execute research and create checkpoint
-            executor1 = ResumableResearchExecutor(project_folder, phase_num=1)
-
-            # Simulate failure after checkpoint
-            attempt_count = [0]
-
-            async def research_that_fails_first_time():
-                attempt_count[0] += 1
-                if attempt_count[0] == 1:
-                    # First attempt: fail (but checkpoint was saved)
-                    raise Exception("Simulated failure")
-                # Second attempt: succeed
-                return {"findings": ["success"]}
-
-            # First execution will fail
-            try:
-                await executor1.execute(
-                    task_name="workflow-test",
-                    query="test query",
-                    provider="test_provider",
-                    estimated_duration_sec=10,
-                    research_func=research_that_fails_first_time
-                )
-            except Exception:
-                pass  # Expected failure
-
-            # Phase 2: Resume from checkpoint
-            executor2 = ResumableResearchExecutor(project_folder, phase_num=1, auto_resume=True)
-
-            result = await executor2.execute(
+        project_folder = tmp_path
+        # Checkpoint immediately and fail without retry backoff
+        config = ResearchConfig(
+            max_retries=1,
+            checkpoint_schedule=[CheckpointScheduleEntry(0, 30, "Analyzing literature", True)]
+        )
+
+        # Phase 1: Execute research and create checkpoint
+        executor1 = ResumableResearchExecutor(project_folder, phase_num=1, config=config)
+
+        # Signalled once the checkpoint is on disk, so the failure is ordered
+        # after the save without sleeping
+        checkpoint_saved = asyncio.Event()
+        save_checkpoint = executor1.checkpoint_mgr.save_research_checkpoint
+
+        async def save_and_signal(**kwargs):
+            await save_checkpoint(**kwargs)
+            checkpoint_saved.set()
+
+        executor1.checkpoint_mgr.save_research_checkpoint = save_and_signal
+
+        # Simulate failure after checkpoint
+        attempt_count = [0]
+
+        async def research_that_fails_first_time():
+            attempt_count[0] += 1
+            if attempt_count[0] == 1:
+                # First attempt: fail (but checkpoint was saved)
+                await checkpoint_saved.wait()
+                raise Exception("Simulated failure")
+            # Second attempt: succeed
+            return {"findings": ["success"]}
+
+        # First execution fails after checkpointing
+        with pytest.raises(Exception, match="Simulated failure"):
+            await executor1.execute(
                 task_name="workflow-test",
                 query="test query",
                 provider="test_provider",
@@ -629,11 +1323,22 @@ class TestCheckpointSystemIntegration:
                 research_func=research_that_fails_first_time
             )
 
-            assert result["findings"] == ["success"]
-            # Verify resumed
-            stats = executor2.get_stats()
-            assert stats["tasks_resumed"] >= 0  # May or may not resume depending on checkpoint timing
-
+        # Phase 2: Resume from checkpoint
+        executor2 = ResumableResearchExecutor(project_folder, phase_num=1, auto_resume=True, config=config)
+
+        result = await executor2.execute(
+            task_name="workflow-test",
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=10,
+            research_func=research_that_fails_first_time
+        )
+
+        assert result["findings"] == ["success"]
+        # Verify resumed
+        stats = executor2.get_stats()
+        assert stats["tasks_resumed"] == 1
+        assert executor2.checkpoint_mgr.load_research_checkpoint("workflow-test") is None
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
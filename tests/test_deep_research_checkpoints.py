@@ -8,15 +8,10 @@ creation, progress tracking, error recovery, and resume capability.
 import asyncio
 import json
 import pytest
-import tempfile
-from pathlib import Path
 from unittest.mock import patch, AsyncMock
 from datetime import datetime
 
-# Import modules to test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
+# Import modules to test (conftest.py puts scripts/ on sys.path)
 from resumable_research import ResumableResearchExecutor, execute_resumable_research
 from research_checkpoint_manager import ResearchCheckpointManager
 from research_progress_tracker import ResearchProgressTracker
@@ -37,61 +32,60 @@ class TestDeepResearchCheckpointIntegration:
     """
 
     @pytest.mark.asyncio
-    async def test_deep_research_with_checkpoint_creation(self):
+    async def test_deep_research_with_checkpoint_creation(self, tmp_path):
         """
         Test Deep Research creates checkpoints at correct intervals.
 
         Simulates a 60-minute Deep Research operation and verifies
         checkpoints are created at 15%, 30%, and 50% completion.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            phase_num = 1
-
-            executor = ResumableResearchExecutor(project_folder, phase_num)
-
-            # Track checkpoint creation
-            checkpoints_created = []
-
-            # Simulate Deep Research that creates checkpoints
-            async def deep_research_with_checkpoints():
-                """Simulates long-running research with checkpoint opportunities."""
-                # This would normally be the actual Deep Research call
-                # For testing, we simulate the checkpointing behavior
-
-                # The ResumableResearchExecutor will automatically create checkpoints
-                # at the scheduled intervals during execution
-
-                await asyncio.sleep(1)  # Simulate some work
-
-                return {
-                    "findings": ["Comprehensive finding 1", "Comprehensive finding 2"],
-                    "sources": [{"title": "Source 1", "url": "http://example.com"}],
-                    "synthesis": "Deep analysis complete"
-                }
-
-            # Execute research
-            result = await executor.execute(
-                task_name="deep-research-test",
-                query="Comprehensive competitive analysis",
-                provider="gemini_deep_research",
-                estimated_duration_sec=60,  # Short duration for testing
-                research_func=deep_research_with_checkpoints
-            )
+        project_folder = tmp_path
+        phase_num = 1
+
+        executor = ResumableResearchExecutor(project_folder, phase_num)
+
+        # Track checkpoint creation
+        checkpoints_created = []
+
+        # Simulate Deep Research that creates checkpoints
+        async def deep_research_with_checkpoints():
+            """Simulates long-running research with checkpoint opportunities."""
+            # This would normally be the actual Deep Research call
+            # For testing, we simulate the checkpointing behavior
+
+            # The ResumableResearchExecutor will automatically create checkpoints
+            # at the scheduled intervals during execution
+
+            await asyncio.sleep(0)  # Yield to the event loop as real work would
 
-            # Verify result
-            assert "findings" in result
-            assert len(result["findings"]) > 0
+            return {
+                "findings": ["Comprehensive finding 1", "Comprehensive finding 2"],
+                "sources": [{"title": "Source 1", "url": "http://example.com"}],
+                "synthesis": "Deep analysis complete"
+            }
 
-            # Verify checkpoint manager has the task recorded
-            checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
-            checkpoints = checkpoint_mgr.list_checkpoints()
+        # Execute research
+        result = await executor.execute(
+            task_name="deep-research-test",
+            query="Comprehensive competitive analysis",
+            provider="gemini_deep_research",
+            estimated_duration_sec=60,  # Short duration for testing
+            research_func=deep_research_with_checkpoints
+        )
 
-            # Note: Checkpoints may or may not be created depending on timing
-            # The important thing is that the infrastructure is in place
+        # Verify result
+        assert "findings" in result
+        assert len(result["findings"]) > 0
+
+        # Verify checkpoint manager has the task recorded
+        checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
+        checkpoints = checkpoint_mgr.list_checkpoints()
+
+        # Note: Checkpoints may or may not be created depending on timing
+        # The important thing is that the infrastructure is in place
 
     @pytest.mark.asyncio
-    async def test_deep_research_interrupted_and_resumed(self):
+    async def test_deep_research_interrupted_and_resumed(self, tmp_path):
         """
         Test Deep Research can be interrupted and resumed from checkpoint.
 
@@ -101,86 +95,85 @@ class TestDeepResearchCheckpointIntegration:
         3. Research is resumed from 30% checkpoint
         4. Research completes successfully
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            phase_num = 1
-
-            # PHASE 1: Initial execution that gets interrupted
-
-            # Pre-create a checkpoint as if research had progressed to 30%
-            checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
-            await checkpoint_mgr.save_research_checkpoint(
-                task_name="interrupted-research",
-                query="Original competitive analysis query",
-                partial_results={
-                    "findings": ["Partial finding 1", "Partial finding 2"],
-                    "sources_reviewed": 15,
-                    "analysis_phase": "literature_review"
-                },
-                sources_collected=[
+        project_folder = tmp_path
+        phase_num = 1
+
+        # PHASE 1: Initial execution that gets interrupted
+
+        # Pre-create a checkpoint as if research had progressed to 30%
+        checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
+        await checkpoint_mgr.save_research_checkpoint(
+            task_name="interrupted-research",
+            query="Original competitive analysis query",
+            partial_results={
+                "findings": ["Partial finding 1", "Partial finding 2"],
+                "sources_reviewed": 15,
+                "analysis_phase": "literature_review"
+            },
+            sources_collected=[
+                {"title": "LangChain Docs", "url": "https://langchain.com"},
+                {"title": "AutoGPT GitHub", "url": "https://github.com/AutoGPT"}
+            ],
+            progress_pct=30.0,
+            resumable=True,
+            metadata={"interrupted_at": datetime.now().isoformat()}
+        )
+
+        # PHASE 2: Resume execution
+
+        executor = ResumableResearchExecutor(
+            project_folder,
+            phase_num,
+            auto_resume=True
+        )
+
+        # Research function that checks if it received resume context
+        received_resume_prompt = [False]
+
+        async def resumed_research_func():
+            """Research function that completes the work."""
+            received_resume_prompt[0] = True
+
+            return {
+                "findings": [
+                    "Partial finding 1",  # From checkpoint
+                    "Partial finding 2",  # From checkpoint
+                    "New finding 3",      # Continued research
+                    "Final synthesis"     # Completed
+                ],
+                "sources": [
                     {"title": "LangChain Docs", "url": "https://langchain.com"},
-                    {"title": "AutoGPT GitHub", "url": "https://github.com/AutoGPT"}
+                    {"title": "AutoGPT GitHub", "url": "https://github.com/AutoGPT"},
+                    {"title": "CrewAI", "url": "https://github.com/CrewAI"}  # New
                 ],
-                progress_pct=30.0,
-                resumable=True,
-                metadata={"interrupted_at": datetime.now().isoformat()}
-            )
-
-            # PHASE 2: Resume execution
-
-            executor = ResumableResearchExecutor(
-                project_folder,
-                phase_num,
-                auto_resume=True
-            )
-
-            # Research function that checks if it received resume context
-            received_resume_prompt = [False]
-
-            async def resumed_research_func():
-                """Research function that completes the work."""
-                received_resume_prompt[0] = True
-
-                return {
-                    "findings": [
-                        "Partial finding 1",  # From checkpoint
-                        "Partial finding 2",  # From checkpoint
-                        "New finding 3",      # Continued research
-                        "Final synthesis"     # Completed
-                    ],
-                    "sources": [
-                        {"title": "LangChain Docs", "url": "https://langchain.com"},
-                        {"title": "AutoGPT GitHub", "url": "https://github.com/AutoGPT"},
-                        {"title": "CrewAI", "url": "https://github.com/CrewAI"}  # New
-                    ],
-                    "resumed": True
-                }
-
-            # Execute with resume
-            result = await executor.execute(
-                task_name="interrupted-research",
-                query="Original competitive analysis query",
-                provider="gemini_deep_research",
-                estimated_duration_sec=60,
-                research_func=resumed_research_func
-            )
-
-            # Verify research completed
-            assert "findings" in result
-            assert len(result["findings"]) == 4  # Includes both old and new findings
-            assert result.get("resumed") is True
-
-            # Verify executor stats show resume
-            stats = executor.get_stats()
-            assert stats["tasks_resumed"] == 1
-            assert stats["total_time_saved_min"] > 0  # Should show time saved
-
-            # Verify checkpoint was cleaned up on success
-            checkpoint_after = checkpoint_mgr.load_research_checkpoint("interrupted-research")
-            assert checkpoint_after is None  # Checkpoint deleted after successful completion
+                "resumed": True
+            }
+
+        # Execute with resume
+        result = await executor.execute(
+            task_name="interrupted-research",
+            query="Original competitive analysis query",
+            provider="gemini_deep_research",
+            estimated_duration_sec=60,
+            research_func=resumed_research_func
+        )
+
+        # Verify research completed
+        assert "findings" in result
+        assert len(result["findings"]) == 4  # Includes both old and new findings
+        assert result.get("resumed") is True
+
+        # Verify executor stats show resume
+        stats = executor.get_stats()
+        assert stats["tasks_resumed"] == 1
+        assert stats["total_time_saved_min"] > 0  # Should show time saved
+
+        # Verify checkpoint was cleaned up on success
+        checkpoint_after = checkpoint_mgr.load_research_checkpoint("interrupted-research")
+        assert checkpoint_after is None  # Checkpoint deleted after successful completion
 
     @pytest.mark.asyncio
-    async def test_deep_research_with_error_recovery(self):
+    async def test_deep_research_with_error_recovery(self, tmp_path):
         """
         Test Deep Research with error recovery and checkpoint preservation.
 
@@ -191,188 +184,187 @@ class TestDeepResearchCheckpointIntegration:
         4. Research succeeds on retry
         5. Checkpoint preserved until completion
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            phase_num = 1
-
-            executor = ResumableResearchExecutor(project_folder, phase_num)
-
-            # Track attempts
-            attempt_count = [0]
-
-            async def research_with_transient_failure():
-                """Research that fails once then succeeds."""
-                attempt_count[0] += 1
-
-                if attempt_count[0] == 1:
-                    # First attempt fails
-                    raise asyncio.TimeoutError("Network timeout (transient)")
-
-                # Second attempt succeeds
-                return {
-                    "findings": ["Recovery successful"],
-                    "attempt_count": attempt_count[0]
-                }
-
-            # Execute with error recovery
-            result = await executor.execute(
-                task_name="error-recovery-test",
-                query="Test query",
-                provider="gemini_deep_research",
-                estimated_duration_sec=60,
-                research_func=research_with_transient_failure
-            )
+        project_folder = tmp_path
+        phase_num = 1
+
+        executor = ResumableResearchExecutor(project_folder, phase_num)
+
+        # Track attempts
+        attempt_count = [0]
+
+        async def research_with_transient_failure():
+            """Research that fails once then succeeds."""
+            attempt_count[0] += 1
+
+            if attempt_count[0] == 1:
+                # First attempt fails
+                raise asyncio.TimeoutError("Network timeout (transient)")
 
-            # Verify success after retry
-            assert result["findings"] == ["Recovery successful"]
-            assert result["attempt_count"] == 2  # Failed once, succeeded on retry
+            # Second attempt succeeds
+            return {
+                "findings": ["Recovery successful"],
+                "attempt_count": attempt_count[0]
+            }
 
-            # Verify stats
-            stats = executor.get_stats()
-            assert stats["tasks_completed"] == 1
+        # Execute with error recovery
+        result = await executor.execute(
+            task_name="error-recovery-test",
+            query="Test query",
+            provider="gemini_deep_research",
+            estimated_duration_sec=60,
+            research_func=research_with_transient_failure
+        )
+
+        # Verify success after retry
+        assert result["findings"] == ["Recovery successful"]
+        assert result["attempt_count"] == 2  # Failed once, succeeded on retry
+
+        # Verify stats
+        stats = executor.get_stats()
+        assert stats["tasks_completed"] == 1
 
     @pytest.mark.asyncio
-    async def test_phase_checkpoint_with_research_tasks(self):
+    async def test_phase_checkpoint_with_research_tasks(self, tmp_path):
         """
         Test phase-level checkpoint tracks research task statuses.
 
         Simulates a complete phase execution with multiple research tasks,
         then verifies the phase checkpoint includes research task statuses.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            phase_num = 1
-
-            executor = ResumableResearchExecutor(project_folder, phase_num)
-
-            # Define multiple research tasks
-            research_tasks = [
-                {
-                    "name": "market-overview",
-                    "query": "AI agent market overview",
-                    "should_succeed": True
-                },
-                {
-                    "name": "competitive-analysis",
-                    "query": "Competitive landscape",
-                    "should_succeed": True
-                },
-                {
-                    "name": "market-sizing",
-                    "query": "Market size estimation",
-                    "should_succeed": False  # This one will fail
-                }
-            ]
-
-            # Execute each task
-            task_statuses = {}
-
-            for task in research_tasks:
-                async def research_func():
-                    if not task["should_succeed"]:
-                        raise Exception("Research failed")
-                    return {"findings": [f"Results for {task['name']}"]}
-
-                try:
-                    await executor.execute(
-                        task_name=task["name"],
-                        query=task["query"],
-                        provider="test_provider",
-                        estimated_duration_sec=10,
-                        research_func=research_func
-                    )
-                    task_statuses[task["name"]] = "completed"
-
-                except Exception:
-                    task_statuses[task["name"]] = "failed"
-
-            # Save phase checkpoint with research task statuses
-            checkpoint_manager.save_checkpoint(
-                project_folder=project_folder,
-                phase_num=phase_num,
-                context_summary="Phase 1 research completed with some failures",
-                research_tasks=task_statuses
+        project_folder = tmp_path
+        phase_num = 1
+
+        executor = ResumableResearchExecutor(project_folder, phase_num)
+
+        # Define multiple research tasks
+        research_tasks = [
+            {
+                "name": "market-overview",
+                "query": "AI agent market overview",
+                "should_succeed": True
+            },
+            {
+                "name": "competitive-analysis",
+                "query": "Competitive landscape",
+                "should_succeed": True
+            },
+            {
+                "name": "market-sizing",
+                "query": "Market size estimation",
+                "should_succeed": False  # This one will fail
+            }
+        ]
+
+        # Execute the independent tasks concurrently
+        async def run_one(task):
+            async def research_func(task=task):
+                if not task["should_succeed"]:
+                    raise Exception("Research failed")
+                return {"findings": [f"Results for {task['name']}"]}
+
+            return await executor.execute(
+                task_name=task["name"],
+                query=task["query"],
+                provider="test_provider",
+                estimated_duration_sec=10,
+                research_func=research_func
             )
 
-            # Verify phase checkpoint includes research tasks
-            phase_checkpoint = checkpoint_manager.load_checkpoint(project_folder)
-            assert "research_tasks" in phase_checkpoint
-            assert f"phase_{phase_num}" in phase_checkpoint["research_tasks"]
-
-            # Verify task statuses
-            phase_tasks = phase_checkpoint["research_tasks"][f"phase_{phase_num}"]["tasks"]
-            assert phase_tasks["market-overview"] == "completed"
-            assert phase_tasks["competitive-analysis"] == "completed"
-            assert phase_tasks["market-sizing"] == "failed"
-
-            # Verify failed task detection
-            has_failures = checkpoint_manager.has_failed_research_tasks(project_folder, phase_num)
-            assert has_failures is True
-
-            failed_tasks = checkpoint_manager.get_failed_research_tasks(project_folder, phase_num)
-            assert "market-sizing" in failed_tasks
+        results = await asyncio.gather(
+            *(run_one(task) for task in research_tasks),
+            return_exceptions=True
+        )
+        task_statuses = {
+            task["name"]: "failed" if isinstance(result, BaseException) else "completed"
+            for task, result in zip(research_tasks, results)
+        }
+
+        # Save phase checkpoint with research task statuses
+        checkpoint_manager.save_checkpoint(
+            project_folder=project_folder,
+            phase_num=phase_num,
+            context_summary="Phase 1 research completed with some failures",
+            research_tasks=task_statuses
+        )
+
+        # Verify phase checkpoint includes research tasks
+        phase_checkpoint = checkpoint_manager.load_checkpoint(project_folder)
+        assert "research_tasks" in phase_checkpoint
+        assert f"phase_{phase_num}" in phase_checkpoint["research_tasks"]
+
+        # Verify task statuses
+        phase_tasks = phase_checkpoint["research_tasks"][f"phase_{phase_num}"]["tasks"]
+        assert phase_tasks["market-overview"] == "completed"
+        assert phase_tasks["competitive-analysis"] == "completed"
+        assert phase_tasks["market-sizing"] == "failed"
+
+        # Verify failed task detection
+        has_failures = checkpoint_manager.has_failed_research_tasks(project_folder, phase_num)
+        assert has_failures is True
+
+        failed_tasks = checkpoint_manager.get_failed_research_tasks(project_folder, phase_num)
+        assert "market-sizing" in failed_tasks
 
     @pytest.mark.asyncio
-    async def test_multiple_checkpoint_resume_workflow(self):
+    async def test_multiple_checkpoint_resume_workflow(self, tmp_path):
         """
         Test multiple checkpoints and selective resume.
 
         Simulates multiple research tasks with checkpoints, then
         demonstrates resuming specific tasks.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            phase_num = 1
-
-            checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
-
-            # Create multiple checkpoints at different progress levels
-            tasks = [
-                ("task1", 15, True),   # Early checkpoint, resumable
-                ("task2", 30, True),   # Mid checkpoint, resumable
-                ("task3", 50, True),   # Late checkpoint, resumable
-                ("task4", 75, False),  # Very late, not resumable
-            ]
-
-            for task_name, progress, resumable in tasks:
-                await checkpoint_mgr.save_research_checkpoint(
-                    task_name=task_name,
-                    query=f"Query for {task_name}",
-                    partial_results={"progress": progress},
-                    sources_collected=[],
-                    progress_pct=progress,
-                    resumable=resumable
-                )
-
-            # List resumable tasks
-            resumable_tasks = checkpoint_mgr.list_checkpoints(resumable_only=True)
-            assert len(resumable_tasks) == 3  # task1, task2, task3 are resumable
-
-            # Verify task4 is not in resumable list
-            resumable_names = [t["task_name"] for t in resumable_tasks]
-            assert "task1" in resumable_names
-            assert "task2" in resumable_names
-            assert "task3" in resumable_names
-            assert "task4" not in resumable_names
-
-            # Resume task2 (30% checkpoint)
-            executor = ResumableResearchExecutor(project_folder, phase_num, auto_resume=True)
-
-            async def resume_func():
-                return {"findings": ["Resumed from 30%"]}
-
-            result = await executor.execute(
-                task_name="task2",
-                query="Original query",
-                provider="test_provider",
-                estimated_duration_sec=60,
-                research_func=resume_func
+        project_folder = tmp_path
+        phase_num = 1
+
+        checkpoint_mgr = ResearchCheckpointManager(project_folder, phase_num)
+
+        # Create multiple checkpoints at different progress levels
+        tasks = [
+            ("task1", 15, True),   # Early checkpoint, resumable
+            ("task2", 30, True),   # Mid checkpoint, resumable
+            ("task3", 50, True),   # Late checkpoint, resumable
+            ("task4", 75, False),  # Very late, not resumable
+        ]
+
+        for task_name, progress, resumable in tasks:
+            await checkpoint_mgr.save_research_checkpoint(
+                task_name=task_name,
+                query=f"Query for {task_name}",
+                partial_results={"progress": progress},
+                sources_collected=[],
+                progress_pct=progress,
+                resumable=resumable
             )
 
-            # Verify resume stats
-            stats = executor.get_stats()
-            assert stats["tasks_resumed"] == 1
-            assert stats["total_time_saved_min"] == 30  # 30% of 60 minutes = 18 minutes saved
+        # List resumable tasks
+        resumable_tasks = checkpoint_mgr.list_checkpoints(resumable_only=True)
+        assert len(resumable_tasks) == 3  # task1, task2, task3 are resumable
+
+        # Verify task4 is not in resumable list
+        resumable_names = [t["task_name"] for t in resumable_tasks]
+        assert "task1" in resumable_names
+        assert "task2" in resumable_names
+        assert "task3" in resumable_names
+        assert "task4" not in resumable_names
+
+        # Resume task2 (30% checkpoint)
+        executor = ResumableResearchExecutor(project_folder, phase_num, auto_resume=True)
+
+        async def resume_func():
+            return {"findings": ["Resumed from 30%"]}
+
+        result = await executor.execute(
+            task_name="task2",
+            query="Original query",
+            provider="test_provider",
+            estimated_duration_sec=60,
+            research_func=resume_func
+        )
+
+        # Verify resume stats
+        stats = executor.get_stats()
+        assert stats["tasks_resumed"] == 1
+        assert stats["total_time_saved_min"] == 30  # 30% of 60 minutes = 18 minutes saved
 
 
 class TestProgressFileIntegration:
@@ -384,7 +376,7 @@ class TestProgressFileIntegration:
     """
 
     @pytest.mark.asyncio
-    async def test_progress_file_created_and_updated(self):
+    async def test_progress_file_created_and_updated(self, tmp_path):
         """
         Test progress file is created and updated during research.
 
@@ -393,97 +385,97 @@ class TestProgressFileIntegration:
         - Progress file updated during execution
         - Progress file marked completed on success
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
+        project_folder = tmp_path
 
-            task_id = "test-progress-123"
-            tracker = ResearchProgressTracker(project_folder, task_id)
+        task_id = "test-progress-123"
+        tracker = ResearchProgressTracker(project_folder, task_id)
 
-            # Start tracking
-            await tracker.start(
-                query="Test deep research query",
-                provider="gemini_deep_research",
-                estimated_duration_sec=60
-            )
+        # Start tracking
+        await tracker.start(
+            query="Test deep research query",
+            provider="gemini_deep_research",
+            estimated_duration_sec=60
+        )
 
-            # Verify progress file exists
-            assert tracker.progress_file.exists()
+        # Verify progress file exists
+        assert tracker.progress_file.exists()
 
-            # Read initial state
-            progress = tracker.read_progress()
-            assert progress["status"] == "running"
-            assert progress["progress_pct"] == 0
+        # Read initial state
+        progress = tracker.read_progress()
+        assert progress["status"] == "running"
+        assert progress["progress_pct"] == 0
 
-            # Simulate progress updates
-            await tracker.update("phase1", "Gathering sources", 15.0, save_checkpoint=True)
-            await tracker.update("phase2", "Analyzing", 30.0, save_checkpoint=True)
-            await tracker.update("phase3", "Synthesizing", 50.0, save_checkpoint=True)
+        # Simulate progress updates
+        await tracker.update("phase1", "Gathering sources", 15.0, save_checkpoint=True)
+        await tracker.update("phase2", "Analyzing", 30.0, save_checkpoint=True)
+        await tracker.update("phase3", "Synthesizing", 50.0, save_checkpoint=True)
 
-            # Verify checkpoints accumulated
-            progress = tracker.read_progress()
-            assert len(progress["checkpoints"]) == 3
-            assert progress["checkpoints"][2]["progress_pct"] == 50.0
+        # Verify checkpoints accumulated
+        progress = tracker.read_progress()
+        assert len(progress["checkpoints"]) == 3
+        assert progress["checkpoints"][2]["progress_pct"] == 50.0
 
-            # Complete
-            await tracker.complete(results={"findings": "Complete"})
+        # Complete
+        await tracker.complete(results={"findings": "Complete"})
 
-            # Verify final state
-            final = tracker.read_progress()
-            assert final["status"] == "completed"
-            assert final["progress_pct"] == 100
-            assert "results" in final
+        # Verify final state
+        final = tracker.read_progress()
+        assert final["status"] == "completed"
+        assert final["progress_pct"] == 100
+        assert "results" in final
 
     @pytest.mark.asyncio
-    async def test_progress_file_monitoring(self):
+    async def test_progress_file_monitoring(self, tmp_path):
         """
         Test external monitoring of progress file.
 
         Simulates monitoring a progress file from a separate process
         while research is running.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "monitored-task-456"
-
-            tracker = ResearchProgressTracker(project_folder, task_id)
+        project_folder = tmp_path
+        task_id = "monitored-task-456"
+
+        tracker = ResearchProgressTracker(project_folder, task_id)
+
+        # Start research
+        await tracker.start(
+            query="Monitored research",
+            provider="gemini_deep_research",
+            estimated_duration_sec=30
+        )
+
+        # Simulate research in background
+        async def simulate_research():
+            for pct in [20, 40, 60, 80, 100]:
+                await asyncio.sleep(0)
+                if pct < 100:
+                    await tracker.update(
+                        f"phase_{pct}",
+                        f"Working on {pct}%",
+                        pct
+                    )
+                else:
+                    await tracker.complete(results={"done": True})
 
-            # Start research
-            await tracker.start(
-                query="Monitored research",
-                provider="gemini_deep_research",
-                estimated_duration_sec=30
-            )
+        research_task = asyncio.create_task(simulate_research())
 
-            # Simulate research in background
-            async def simulate_research():
-                for pct in [20, 40, 60, 80, 100]:
-                    await asyncio.sleep(0.1)
-                    if pct < 100:
-                        await tracker.update(
-                            f"phase_{pct}",
-                            f"Working on {pct}%",
-                            pct
-                        )
-                    else:
-                        await tracker.complete(results={"done": True})
-
-            research_task = asyncio.create_task(simulate_research())
-
-            # Monitor progress
-            monitor_readings = []
-            for _ in range(6):
-                await asyncio.sleep(0.12)
-                progress = tracker.read_progress()
-                if progress:
-                    monitor_readings.append(progress["progress_pct"])
-
-            # Wait for research to complete
-            await research_task
-
-            # Verify monitoring captured progression
-            assert len(monitor_readings) > 0
-            # Progress should generally increase (allowing for timing variations)
-            assert monitor_readings[-1] >= monitor_readings[0]
+        # Monitor progress
+        monitor_readings = []
+        for _ in range(6):
+            await asyncio.sleep(0)
+            progress = tracker.read_progress()
+            if progress:
+                monitor_readings.append(progress["progress_pct"])
+
+        # Wait for research to complete
+        await research_task
+
+        # Verify monitoring captured progression
+        assert len(monitor_readings) > 0
+        # Each sleep(0) hands control to the research task, so the monitor
+        # sees every step in order
+        assert monitor_readings == sorted(monitor_readings)
+        assert monitor_readings[-1] > monitor_readings[0]
 
 
 if __name__ == "__main__":
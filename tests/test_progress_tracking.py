@@ -7,15 +7,12 @@ Tests Pattern 1 (streaming), Pattern 2 (progress files), and Pattern 3 (error ha
 import asyncio
 import json
 import pytest
-import tempfile
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 
-# Import modules to test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
+# Import modules to test (conftest.py puts scripts/ on sys.path)
+import research_json
+import research_progress_tracker
 from research_progress_tracker import ResearchProgressTracker, ProgressMonitor
 from research_error_handling import (
     ResearchErrorHandler,
@@ -25,6 +22,11 @@ from research_error_handling import (
     ErrorRecoveryStrategy
 )
 from research_errors import ResearchError
+from research_state_machine import (
+    ResearchTaskStateMachine,
+    ResearchTaskState,
+    InvalidTransitionError
+)
 
 
 # ============================================================================
@@ -35,170 +37,355 @@ class TestResearchProgressTracker:
     """Tests for ResearchProgressTracker class."""
 
     @pytest.mark.asyncio
-    async def test_progress_file_created(self):
+    async def test_progress_file_created(self, tmp_path):
         """Verify progress file is created with correct structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
+        tracker = ResearchProgressTracker(project_folder, task_id)
 
-            await tracker.start(
-                query="test query",
-                provider="test_provider",
-                estimated_duration_sec=3600
-            )
+        await tracker.start(
+            query="test query",
+            provider="test_provider",
+            estimated_duration_sec=3600
+        )
 
-            # Verify file exists
-            assert tracker.progress_file.exists()
+        # Verify file exists
+        assert tracker.progress_file.exists()
 
-            # Read and verify content
-            progress = json.loads(tracker.progress_file.read_text())
-            assert progress["task_id"] == task_id
-            assert progress["query"] == "test query"
-            assert progress["provider"] == "test_provider"
-            assert progress["status"] == "running"
-            assert progress["progress_pct"] == 0
-            assert "checkpoints" in progress
+        # Read and verify content
+        progress = json.loads(tracker.progress_file.read_text())
+        assert progress["task_id"] == task_id
+        assert progress["query"] == "test query"
+        assert progress["provider"] == "test_provider"
+        assert progress["status"] == "running"
+        assert progress["progress_pct"] == 0
+        assert "checkpoints" in progress
 
     @pytest.mark.asyncio
-    async def test_progress_update(self):
+    async def test_progress_update(self, tmp_path):
         """Verify progress updates work correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            await tracker.start("test query", "test_provider")
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
 
-            # Update progress
-            await tracker.update(
-                phase="test_phase",
-                action="test action",
-                progress_pct=50.0
-            )
+        # Update progress
+        await tracker.update(
+            phase="test_phase",
+            action="test action",
+            progress_pct=50.0
+        )
 
-            # Read and verify
-            progress = tracker.read_progress()
-            assert progress["phase"] == "test_phase"
-            assert progress["current_action"] == "test action"
-            assert progress["progress_pct"] == 50.0
-            assert progress["status"] == "running"
+        # Read and verify
+        progress = tracker.read_progress()
+        assert progress["phase"] == "test_phase"
+        assert progress["current_action"] == "test action"
+        assert progress["progress_pct"] == 50.0
+        assert progress["status"] == "running"
 
     @pytest.mark.asyncio
-    async def test_checkpoint_history_preserved(self):
+    async def test_checkpoint_history_preserved(self, tmp_path):
         """Verify checkpoints accumulate in history."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
+
+        # Create multiple checkpoints
+        await tracker.update("phase1", "action1", 15.0, save_checkpoint=True)
+        await tracker.update("phase2", "action2", 30.0, save_checkpoint=True)
+        await tracker.update("phase3", "action3", 50.0, save_checkpoint=True)
+
+        # Verify checkpoints
+        progress = tracker.read_progress()
+        assert len(progress["checkpoints"]) == 3
+        assert progress["checkpoints"][0]["progress_pct"] == 15.0
+        assert progress["checkpoints"][1]["progress_pct"] == 30.0
+        assert progress["checkpoints"][2]["progress_pct"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced(self, tmp_path):
+        """Verify a burst of updates costs one immediate and one trailing write."""
+        tracker = ResearchProgressTracker(tmp_path, "test-task-123")
+        await tracker.start("test query", "test_provider")
+
+        with patch.object(tracker, "_write_progress", wraps=tracker._write_progress) as write:
+            for pct in (10.0, 20.0, 30.0, 40.0, 50.0):
+                await tracker.update("phase", f"at {pct}", pct, save_checkpoint=True)
+            assert write.call_count == 1
+            assert json.loads(tracker.progress_file.read_text())["progress_pct"] == 10.0
+
+            await asyncio.sleep(0.1)
+            assert write.call_count == 2
+
+        progress = json.loads(tracker.progress_file.read_text())
+        assert progress["progress_pct"] == 50.0
+        assert len(progress["checkpoints"]) == 5
+
+    def test_update_just_before_loop_exit_is_written(self, tmp_path):
+        """Verify a coalesced update survives the event loop ending inside the window."""
+        tracker = ResearchProgressTracker(tmp_path, "test-task-123")
+
+        async def run():
             await tracker.start("test query", "test_provider")
+            await tracker.update("phase", "action", 10.0)
+            await tracker.update("phase", "action", 20.0)
 
-            # Create multiple checkpoints
-            await tracker.update("phase1", "action1", 15.0, save_checkpoint=True)
-            await tracker.update("phase2", "action2", 30.0, save_checkpoint=True)
-            await tracker.update("phase3", "action3", 50.0, save_checkpoint=True)
+        asyncio.run(run())
+        assert json.loads(tracker.progress_file.read_text())["progress_pct"] == 20.0
 
-            # Verify checkpoints
-            progress = tracker.read_progress()
-            assert len(progress["checkpoints"]) == 3
-            assert progress["checkpoints"][0]["progress_pct"] == 15.0
-            assert progress["checkpoints"][1]["progress_pct"] == 30.0
-            assert progress["checkpoints"][2]["progress_pct"] == 50.0
+        # The window task died with its loop; later updates must still write
+        asyncio.run(tracker.update("phase", "action", 30.0))
+        assert json.loads(tracker.progress_file.read_text())["progress_pct"] == 30.0
 
     @pytest.mark.asyncio
-    async def test_complete_marks_completed(self):
+    async def test_read_progress_flushes_pending_update(self, tmp_path):
+        """Verify read_progress() sees an update before the scheduled flush runs."""
+        tracker = ResearchProgressTracker(tmp_path, "test-task-123")
+        await tracker.start("test query", "test_provider")
+        await tracker.update("phase", "action", 30.0)
+        await tracker.update("phase", "action", 60.0)
+
+        assert tracker.read_progress()["progress_pct"] == 60.0
+        assert json.loads(tracker.progress_file.read_text())["progress_pct"] == 60.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    async def test_progress_file_is_readable_json(self, has_orjson, tmp_path):
+        """Verify progress files stay indented UTF-8 JSON with or without orjson."""
+        if has_orjson and not research_json.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        tracker = ResearchProgressTracker(tmp_path, "test-task-123")
+        with patch.object(research_json, "HAS_ORJSON", has_orjson):
+            await tracker.start("Café pricing — résumé", "test_provider")
+            await tracker.complete(results={"findings": "naïve"})
+
+        raw = tracker.progress_file.read_text(encoding="utf-8")
+        assert raw.startswith("{\n  ")
+        assert json.loads(raw)["query"] == "Café pricing — résumé"
+        assert tracker.read_progress()["results"] == {"findings": "naïve"}
+        assert not tracker.progress_file.with_suffix(".tmp").exists()
+
+    @pytest.mark.asyncio
+    async def test_complete_marks_completed(self, tmp_path):
         """Verify complete() marks research as completed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            await tracker.start("test query", "test_provider")
-            await tracker.complete(results={"findings": "test findings"})
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
+        await tracker.complete(results={"findings": "test findings"})
+
+        # Verify completion
+        progress = tracker.read_progress()
+        assert progress["status"] == "completed"
+        assert progress["progress_pct"] == 100
+        assert "results" in progress
+        assert progress["results"]["findings"] == "test findings"
 
-            # Verify completion
-            progress = tracker.read_progress()
-            assert progress["status"] == "completed"
-            assert progress["progress_pct"] == 100
-            assert "results" in progress
-            assert progress["results"]["findings"] == "test findings"
+    @pytest.mark.asyncio
+    async def test_duration_ignores_wall_clock_jumps(self, tmp_path):
+        """Verify durations come from the monotonic clock, not datetime.now()."""
+        tracker = ResearchProgressTracker(tmp_path, "test-task-123")
+        await tracker.start("test query", "test_provider")
+
+        # A wall-clock jump (e.g. NTP correction) must not skew the duration
+        tracker.start_time -= timedelta(hours=5)
+        await tracker.complete()
+
+        progress = tracker.read_progress()
+        assert 0 <= progress["actual_duration_sec"] < 60
 
     @pytest.mark.asyncio
-    async def test_fail_marks_failed(self):
+    async def test_fail_marks_failed(self, tmp_path):
         """Verify fail() marks research as failed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            await tracker.start("test query", "test_provider")
-            await tracker.fail("Test error", error_type="timeout")
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
+        await tracker.fail("Test error", error_type="timeout")
 
-            # Verify failure
-            progress = tracker.read_progress()
-            assert progress["status"] == "failed"
-            assert progress["error"] == "Test error"
-            assert progress["error_type"] == "timeout"
+        # Verify failure
+        progress = tracker.read_progress()
+        assert progress["status"] == "failed"
+        assert progress["error"] == "Test error"
+        assert progress["error_type"] == "timeout"
 
     @pytest.mark.asyncio
-    async def test_list_active_research(self):
+    async def test_list_active_research(self, tmp_path):
         """Verify list_active_research finds running tasks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-
-            # Create multiple progress files
-            trackers = []
-            for i in range(3):
-                task_id = f"task-{i}"
-                tracker = ResearchProgressTracker(project_folder, task_id)
-                await tracker.start(f"query {i}", "test_provider")
-                trackers.append(tracker)
-
-            # List active
-            active = ResearchProgressTracker.list_active_research(project_folder)
-            assert len(active) == 3
+        project_folder = tmp_path
+
+        # Create multiple progress files
+        trackers = []
+        for i in range(3):
+            task_id = f"task-{i}"
+            tracker = ResearchProgressTracker(project_folder, task_id)
+            await tracker.start(f"query {i}", "test_provider")
+            trackers.append(tracker)
 
-            # Complete one task using the original tracker instance
-            await trackers[0].complete()
+        # List active
+        active = ResearchProgressTracker.list_active_research(project_folder)
+        assert len(active) == 3
 
-            # List active again
+        # Complete one task using the original tracker instance
+        await trackers[0].complete()
+
+        # List active again
+        active = ResearchProgressTracker.list_active_research(project_folder)
+        assert len(active) == 2  # One completed, two still running
+
+    @pytest.mark.asyncio
+    async def test_list_active_research_parses_only_running_files(self, tmp_path):
+        """Verify finished progress files are skipped without a full JSON parse."""
+        project_folder = tmp_path
+
+        running = ResearchProgressTracker(project_folder, "running-task")
+        await running.start('query mentioning "status": "completed"', "test_provider")
+        for i in range(3):
+            finished = ResearchProgressTracker(project_folder, f"done-{i}")
+            await finished.start(f"query {i}", "test_provider")
+            await finished.complete()
+
+        # Files without the indented layout still go through a full parse
+        compact = project_folder / ".research-progress-compact.json"
+        compact.write_text(json.dumps({"task_id": "compact", "status": "running"}))
+
+        with patch.object(
+            research_progress_tracker, "json_loads", wraps=research_json.json_loads
+        ) as parse:
             active = ResearchProgressTracker.list_active_research(project_folder)
-            assert len(active) == 2  # One completed, two still running
+
+        assert sorted(p["task_id"] for p in active) == ["compact", "running-task"]
+        assert parse.call_count == 2
 
 
 class TestProgressMonitor:
     """Tests for ProgressMonitor class."""
 
     @pytest.mark.asyncio
-    async def test_get_status(self):
+    async def test_get_status(self, tmp_path):
         """Verify get_status returns correct status."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            await tracker.start("test query", "test_provider")
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
 
-            monitor = ProgressMonitor(tracker)
-            status = monitor.get_status()
-            assert status == "running"
+        monitor = ProgressMonitor(tracker)
+        status = monitor.get_status()
+        assert status == "running"
 
     @pytest.mark.asyncio
-    async def test_get_progress_pct(self):
+    async def test_get_progress_pct(self, tmp_path):
         """Verify get_progress_pct returns correct percentage."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "test-task-123"
+        project_folder = tmp_path
+        task_id = "test-task-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            await tracker.start("test query", "test_provider")
-            await tracker.update("phase", "action", 75.0)
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        await tracker.start("test query", "test_provider")
+        await tracker.update("phase", "action", 75.0)
+
+        monitor = ProgressMonitor(tracker)
+        progress = monitor.get_progress_pct()
+        assert progress == 75.0
+
+
+# ============================================================================
+# Research Task State Machine Tests
+# ============================================================================
+
+class TestResearchTaskStateMachine:
+    """Tests for ResearchTaskStateMachine class."""
+
+    def test_transition_table_matches_allowed_transitions(self):
+        """Verify precomputed table covers exactly ALLOWED_TRANSITIONS."""
+        table = ResearchTaskStateMachine._TRANSITION_TABLE
+        flattened = {
+            (from_state, to_state, event)
+            for from_state, events in table.items()
+            for event, to_state in events.items()
+        }
+        assert flattened == set(ResearchTaskStateMachine.ALLOWED_TRANSITIONS)
+
+    def test_valid_events_from_running(self):
+        """Verify valid events reflect the current state."""
+        state_machine = ResearchTaskStateMachine()
+        assert state_machine.get_valid_events() == ["start"]
+
+        state_machine.transition(ResearchTaskState.RUNNING, "start")
+        assert set(state_machine.get_valid_events()) == {"checkpoint", "complete", "fail"}
+
+    def test_can_transition_requires_matching_target(self):
+        """Verify a known event with the wrong target state is rejected."""
+        state_machine = ResearchTaskStateMachine(ResearchTaskState.RUNNING)
+        assert state_machine.can_transition(ResearchTaskState.COMPLETED, "complete")
+        assert not state_machine.can_transition(ResearchTaskState.FAILED, "complete")
+
+    def test_invalid_transition_raises(self):
+        """Verify terminal states reject further transitions."""
+        state_machine = ResearchTaskStateMachine(ResearchTaskState.COMPLETED)
+        assert state_machine.get_valid_events() == []
+
+        with pytest.raises(ResearchError):
+            state_machine.transition(ResearchTaskState.RUNNING, "start")
 
-            monitor = ProgressMonitor(tracker)
-            progress = monitor.get_progress_pct()
-            assert progress == 75.0
+    def test_get_history_is_read_only_live_view(self):
+        """Verify get_history exposes records without copying or allowing mutation."""
+        state_machine = ResearchTaskStateMachine()
+        history = state_machine.get_history()
+        assert len(history) == 1
+
+        state_machine.transition(ResearchTaskState.RUNNING, "start")
+        assert len(history) == 2
+        assert history[-1].event == "start"
+        assert not hasattr(history, "append")
+
+    def test_history_is_bounded(self):
+        """Verify history keeps only the most recent max_history records."""
+        state_machine = ResearchTaskStateMachine(max_history=3)
+        state_machine.transition(ResearchTaskState.RUNNING, "start")
+        state_machine.transition(ResearchTaskState.CHECKPOINTED, "checkpoint")
+        state_machine.transition(ResearchTaskState.RUNNING, "resume")
+
+        history = state_machine.get_history()
+        assert [record.event for record in history] == ["start", "checkpoint", "resume"]
+        assert state_machine.transition_count == 4
+
+    def test_invalid_transition_error_carries_context(self):
+        """Verify invalid transition error exposes raw context and formats on demand."""
+        state_machine = ResearchTaskStateMachine()
+        state_machine.transition(ResearchTaskState.RUNNING, "start")
+
+        with pytest.raises(InvalidTransitionError) as exc_info:
+            state_machine.transition(ResearchTaskState.PENDING, "start")
+
+        error = exc_info.value
+        assert isinstance(error, ValueError)
+        assert error.from_state == ResearchTaskState.RUNNING
+        assert error.to_state == ResearchTaskState.PENDING
+        assert len(error.history_tail) == 2
+        assert error.to_dict()["context"]["valid_events"] == ["checkpoint", "complete", "fail"]
+        assert "Allowed transitions:" in str(error)
+
+    def test_invalid_transition_error_renders_once(self):
+        """Verify the error text is only built on first str() and then reused."""
+        state_machine = ResearchTaskStateMachine(ResearchTaskState.FAILED)
+
+        with pytest.raises(InvalidTransitionError) as exc_info:
+            state_machine.transition(ResearchTaskState.RUNNING, "resume")
+
+        error = exc_info.value
+        assert error._rendered is None
+
+        rendered = str(error)
+        assert "is terminal" in rendered
+        assert str(error) is rendered
 
 
 # ============================================================================
@@ -432,41 +619,40 @@ class TestIntegration:
     """Integration tests combining multiple patterns."""
 
     @pytest.mark.asyncio
-    async def test_progress_tracker_with_error_handling(self):
+    async def test_progress_tracker_with_error_handling(self, tmp_path):
         """Test progress tracker combined with error handling."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_folder = Path(tmpdir)
-            task_id = "integration-test-123"
+        project_folder = tmp_path
+        task_id = "integration-test-123"
 
-            tracker = ResearchProgressTracker(project_folder, task_id)
-            handler = ResearchErrorHandler(max_retries=2, base_delay=0.1)
+        tracker = ResearchProgressTracker(project_folder, task_id)
+        handler = ResearchErrorHandler(max_retries=2, base_delay=0.1)
 
-            # Start tracking
-            await tracker.start("test query", "test_provider", estimated_duration_sec=60)
+        # Start tracking
+        await tracker.start("test query", "test_provider", estimated_duration_sec=60)
 
-            # Simulate research with retries
-            attempt_count = [0]
+        # Simulate research with retries
+        attempt_count = [0]
 
-            async def research_with_failure():
-                attempt_count[0] += 1
-                await tracker.update(f"attempt_{attempt_count[0]}", "researching", 25.0)
+        async def research_with_failure():
+            attempt_count[0] += 1
+            await tracker.update(f"attempt_{attempt_count[0]}", "researching", 25.0)
 
-                if attempt_count[0] < 2:
-                    raise asyncio.TimeoutError("Transient failure")
+            if attempt_count[0] < 2:
+                raise asyncio.TimeoutError("Transient failure")
 
-                return "success"
+            return "success"
 
-            result = await handler.retry_with_backoff(research_with_failure)
+        result = await handler.retry_with_backoff(research_with_failure)
 
-            assert result == "success"
-            assert attempt_count[0] == 2
+        assert result == "success"
+        assert attempt_count[0] == 2
 
-            # Mark complete
-            await tracker.complete()
+        # Mark complete
+        await tracker.complete()
 
-            # Verify final state
-            progress = tracker.read_progress()
-            assert progress["status"] == "completed"
+        # Verify final state
+        progress = tracker.read_progress()
+        assert progress["status"] == "completed"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,276 @@
+"""
+Tests for test-providers.py API key validation.
+
+Network probes run against a fake HTTP client, so no real API calls are made.
+"""
+
+import asyncio
+import json
+import os
+import pytest
+import sys
+import time
+from unittest.mock import patch
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+# Import with the correct module name (dash in filename)
+import importlib.util
+spec = importlib.util.spec_from_file_location(
+    "test_providers_script",
+    os.path.join(os.path.dirname(__file__), "..", "scripts", "test-providers.py")
+)
+providers = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(providers)
+
+PROVIDER_ENV_VARS = (
+    "CLAUDE_CODE_OAUTH_TOKEN",
+    "ANTHROPIC_API_KEY",
+    "OPENROUTER_API_KEY",
+    "GEMINI_API_KEY",
+    "PERPLEXITY_API_KEY",
+)
+
+
+class FakeResponse:
+    """Response with the subset of the httpx/requests API the probes use."""
+
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.text = str(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeClient:
+    """Async HTTP client that answers every request after a fixed delay."""
+
+    def __init__(self, delay=0.1, payloads=None):
+        self.delay = delay
+        self.payloads = payloads or {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def _respond(self, url):
+        self.requests.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        for fragment, payload in self.payloads.items():
+            if fragment in url:
+                return FakeResponse(200, payload)
+        return FakeResponse(200)
+
+    async def get(self, url, **kwargs):
+        return await self._respond(url)
+
+    async def post(self, url, **kwargs):
+        return await self._respond(url)
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the validation cache out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def provider_env(**keys):
+    """Environment with only the given provider keys set."""
+    env = {name: value for name, value in os.environ.items() if name not in PROVIDER_ENV_VARS}
+    env.update(keys)
+    return env
+
+
+class TestNetworkProbes:
+    """Test the async provider probes."""
+
+    @pytest.mark.asyncio
+    async def test_openrouter_requests_run_concurrently(self):
+        """Models and credits requests overlap on the shared client."""
+        client = FakeClient(payloads={"auth/key": {"data": {"limit": 12.5}}})
+        with patch.dict(os.environ, provider_env(OPENROUTER_API_KEY="or-key"), clear=True):
+            result = await providers.test_openrouter_key(client)
+
+        assert result == (True, "Valid ($12.50 credits)", None)
+        assert len(client.requests) == 2
+        assert client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_run_provider_tests_overlaps_probes(self):
+        """All network probes share one client and run at the same time."""
+        client = FakeClient(delay=0.2)
+        env = provider_env(
+            OPENROUTER_API_KEY="or-key",
+            GEMINI_API_KEY="gemini-key",
+            PERPLEXITY_API_KEY="pplx-key",
+        )
+        with patch.dict(os.environ, env, clear=True), \
+             patch.object(providers, "create_http_client", return_value=client):
+            start = time.perf_counter()
+            results = await providers.run_provider_tests()
+            elapsed = time.perf_counter() - start
+
+        assert list(results) == list(PROVIDER_ENV_VARS)
+        assert results["GEMINI_API_KEY"][0] is True
+        assert results["PERPLEXITY_API_KEY"][0] is True
+        assert results["ANTHROPIC_API_KEY"] == (False, "Not set", None)
+        assert client.max_in_flight == 4
+        assert client.closed is True
+        # Sequential probing would take at least 4 x 0.2s
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_no_keys_makes_no_requests(self):
+        """Unset keys are reported without touching the network."""
+        client = FakeClient()
+        with patch.dict(os.environ, provider_env(), clear=True), \
+             patch.object(providers, "create_http_client", return_value=client):
+            results = await providers.run_provider_tests()
+
+        assert all(result == (False, "Not set", None) for result in results.values())
+        assert client.requests == []
+
+
+    @pytest.mark.asyncio
+    async def test_anthropic_probe_skipped_with_claude_max(self):
+        """A valid Claude Max token already covers planning, so no live Anthropic call."""
+        env = provider_env(
+            CLAUDE_CODE_OAUTH_TOKEN="oauth-token-abcdefghijklmnop",
+            ANTHROPIC_API_KEY="sk-ant-key",
+        )
+
+        async def fail_if_called(client=None):
+            raise AssertionError("Anthropic probe should be skipped")
+
+        with patch.dict(os.environ, env, clear=True), \
+             patch.dict(providers.NETWORK_PROBES, {"ANTHROPIC_API_KEY": fail_if_called}), \
+             patch.object(providers, "create_http_client", return_value=FakeClient()):
+            results = await providers.run_provider_tests()
+
+        assert results["CLAUDE_CODE_OAUTH_TOKEN"][0] is True
+        assert results["ANTHROPIC_API_KEY"] == (False, providers.SKIPPED_STATUS, None)
+        assert providers.get_available_capabilities(results)["planning"] is True
+
+
+class TestProbeCache:
+    """Test the on-disk cache of successful validations."""
+
+    @pytest.mark.asyncio
+    async def test_valid_key_is_served_from_cache(self):
+        """A second run within the TTL makes no network requests."""
+        env = provider_env(GEMINI_API_KEY="gemini-key")
+        with patch.dict(os.environ, env, clear=True):
+            first_client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=first_client):
+                first = await providers.run_provider_tests()
+
+            second_client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=second_client):
+                second = await providers.run_provider_tests()
+
+        assert len(first_client.requests) == 1
+        assert second_client.requests == []
+        assert second == first
+        assert "gemini-key" not in providers.probe_cache_file().read_text()
+
+    @pytest.mark.asyncio
+    async def test_no_cache_and_changed_key_probe_again(self):
+        """Bypassing the cache or rotating the key forces a live probe."""
+        with patch.dict(os.environ, provider_env(GEMINI_API_KEY="gemini-key"), clear=True):
+            with patch.object(providers, "create_http_client", return_value=FakeClient(delay=0)):
+                await providers.run_provider_tests()
+
+            bypass_client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=bypass_client):
+                await providers.run_provider_tests(use_cache=False)
+
+        with patch.dict(os.environ, provider_env(GEMINI_API_KEY="rotated-key"), clear=True):
+            rotated_client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=rotated_client):
+                await providers.run_provider_tests()
+
+        assert len(bypass_client.requests) == 1
+        assert len(rotated_client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_probed_again(self):
+        """Entries older than the TTL are ignored."""
+        with patch.dict(os.environ, provider_env(GEMINI_API_KEY="gemini-key"), clear=True):
+            with patch.object(providers, "create_http_client", return_value=FakeClient(delay=0)):
+                await providers.run_provider_tests()
+
+            later = time.time() + providers.PROBE_CACHE_TTL_SEC + 1
+            client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=client), \
+                 patch.object(providers.time, "time", return_value=later):
+                await providers.run_provider_tests()
+
+        assert len(client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_entry_is_probed_again(self):
+        """Entries missing a status or timestamp are ignored instead of crashing."""
+        cache_file = providers.probe_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({
+            providers._probe_cache_key("GEMINI_API_KEY", "gemini-key"): {"ts": time.time()},
+            providers._probe_cache_key("PERPLEXITY_API_KEY", "perplexity-key"): {"status": "Valid", "ts": "now"},
+        }))
+
+        env = provider_env(GEMINI_API_KEY="gemini-key", PERPLEXITY_API_KEY="perplexity-key")
+        with patch.dict(os.environ, env, clear=True):
+            client = FakeClient(delay=0)
+            with patch.object(providers, "create_http_client", return_value=client):
+                results = await providers.run_provider_tests()
+
+        assert len(client.requests) == 2
+        assert results["GEMINI_API_KEY"][0] is True
+        assert results["PERPLEXITY_API_KEY"][0] is True
+
+
+class TestCapabilities:
+    """Test capability derivation from key results."""
+
+    @pytest.mark.parametrize("valid_keys, expected", [
+        ((), set()),
+        (("CLAUDE_CODE_OAUTH_TOKEN",), {"planning"}),
+        (("ANTHROPIC_API_KEY", "PERPLEXITY_API_KEY"), {"planning", "fast_research"}),
+        (("GEMINI_API_KEY",), {"deep_research", "nanobanana_images"}),
+        (("OPENROUTER_API_KEY",), {"fast_research", "nanobanana_images", "flux_images"}),
+    ])
+    def test_capabilities_follow_valid_keys(self, valid_keys, expected):
+        """Each capability is available when any of its keys is valid."""
+        results = {
+            key_name: (key_name in valid_keys, "", None)
+            for key_name in PROVIDER_ENV_VARS
+        }
+        capabilities = providers.get_available_capabilities(results)
+
+        assert set(capabilities) == {
+            "planning", "fast_research", "deep_research", "nanobanana_images", "flux_images"
+        }
+        assert {name for name, available in capabilities.items() if available} == expected
+
+
+class TestMain:
+    """Test the command-line entry point."""
+
+    def test_help_exits_without_probing(self, capsys):
+        """--help prints usage and never creates an HTTP client."""
+        with patch.object(sys, "argv", ["test-providers.py", "--help"]), \
+             patch.object(providers, "create_http_client", side_effect=AssertionError("probed")):
+            assert providers.main() == 0
+
+        assert capsys.readouterr().out.startswith("usage: test-providers.py")
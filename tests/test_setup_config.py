@@ -23,9 +23,21 @@ setup_config = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(setup_config)
 
 check_api_keys = setup_config.check_api_keys
+invalidate_api_key_cache = setup_config.invalidate_api_key_cache
 generate_setup_questions = setup_config.generate_setup_questions
 _filter_ai_provider_options = setup_config._filter_ai_provider_options
 _filter_research_depth_options = setup_config._filter_research_depth_options
+parse_user_selections = setup_config.parse_user_selections
+display_config_summary = setup_config.display_config_summary
+save_config = setup_config.save_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_key_cache():
+    """Each test patches the environment, so start from an empty key cache."""
+    invalidate_api_key_cache()
+    yield
+    invalidate_api_key_cache()
 
 
 class TestAPIKeyChecking:
@@ -70,6 +82,21 @@ class TestAPIKeyChecking:
             assert result["anthropic"] is True
             assert result["claude_max"] is False
 
+    def test_check_api_keys_cached_until_invalidated(self):
+        """Environment is read once; invalidation picks up changes."""
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}, clear=True):
+            first = check_api_keys()
+            assert first["gemini"] is True
+
+            # Mutating the returned dict must not affect the cache
+            first["gemini"] = False
+
+            os.environ.pop("GEMINI_API_KEY")
+            assert check_api_keys()["gemini"] is True
+
+            invalidate_api_key_cache()
+            assert check_api_keys()["gemini"] is False
+
 
 class TestAIProviderOptionsFiltering:
     """Test AI provider options filtering logic."""
@@ -305,6 +332,16 @@ class TestGenerateSetupQuestions:
                     assert "label" in option
                     assert "description" in option
 
+    def test_static_questions_built_once(self):
+        """Key-independent questions are shared across calls, dynamic ones are not."""
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}, clear=True):
+            first = generate_setup_questions()
+            second = generate_setup_questions()
+
+        assert first is not second
+        assert first[0] is not second[0]
+        assert all(a is b for a, b in zip(first[2:], second[2:]))
+
     def test_dynamic_filtering_with_all_keys(self):
         """With all keys, should show all options as available."""
         with patch.dict(os.environ, {
@@ -381,5 +418,201 @@ class TestEdgeCases:
             assert not any("Unavailable" in label for label in labels)
 
 
+
+class TestParseUserSelections:
+    """Test mapping AskUserQuestion answers to a planning config."""
+
+    def test_full_selection(self):
+        """Selected labels enable the matching config flags."""
+        config = parse_user_selections({
+            "question_0": "Google Gemini Deep Research",
+            "question_1": "Quick - Perplexity only",
+            "question_2": "Yes - Full parallelization (Recommended)",
+            "question_3": "No - Fully autonomous",
+            "question_4": "Phase 1: Market Research (Recommended), Phase 2: Architecture (Required), Phase 4: Implementation (Required)",
+            "question_5": "Phase 5: Go-to-Market Strategy",
+            "question_6": "Multi-model architecture validation, Real-time research verification",
+            "question_7": "Generate final PDF report",
+        })
+
+        assert config["ai_provider"] == "gemini"
+        assert config["research_mode"] == "perplexity"
+        assert config["enable_parallelization"] is True
+        assert config["interactive_mode"] is False
+        assert config["phases"] == {
+            "market_research": True,
+            "architecture": True,
+            "feasibility": False,
+            "implementation": True,
+            "marketing": True,
+            "review": False,
+        }
+        assert config["quality_checks"] == {
+            "multi_model_validation": True,
+            "comprehensive_diagrams": False,
+            "research_verification": True,
+        }
+        assert config["output_formats"] == {"markdown": True, "pdf": True, "pptx": False, "yaml": True}
+
+    def test_single_select_labels(self):
+        """Single-select answers map by label prefix."""
+        cases = [
+            ("question_0", "Perplexity Direct", "ai_provider", "openrouter"),
+            ("question_0", "Perplexity via OpenRouter (Recommended)", "ai_provider", "openrouter"),
+            ("question_0", "Auto-detect from available keys", "ai_provider", "auto"),
+            ("question_1", "Comprehensive - Deep Research for all", "research_mode", "deep_research"),
+            ("question_1", "Auto - Context-aware (Perplexity only)", "research_mode", "auto"),
+            ("question_2", "No - Sequential execution", "enable_parallelization", False),
+            ("question_3", "Yes - Interactive approval mode (Recommended)", "interactive_mode", True),
+        ]
+        for question_key, answer, config_key, expected in cases:
+            assert parse_user_selections({question_key: answer})[config_key] == expected, answer
+
+    def test_no_answers(self):
+        """Missing answers fall back to auto modes and leave selections off."""
+        config = parse_user_selections({})
+
+        assert config["ai_provider"] == "auto"
+        assert config["research_mode"] == "auto"
+        assert config["enable_parallelization"] is False
+        assert not any(config["phases"].values())
+        assert not any(config["quality_checks"].values())
+        assert config["output_formats"]["markdown"] is True
+        assert config["output_formats"]["pdf"] is False
+
+
+class TestSaveConfig:
+    """Test writing the planning config file."""
+
+    def test_save_config_round_trip(self, tmp_path, monkeypatch):
+        """Config is written atomically as indented JSON in the working directory."""
+        import json
+
+        monkeypatch.chdir(tmp_path)
+        config = parse_user_selections({"question_2": "Yes - Full parallelization (Recommended)"})
+
+        config_file = save_config(config, "my-project")
+
+        assert config_file.name == ".my-project-config.json"
+        assert json.loads((tmp_path / config_file).read_text()) == config
+        assert (tmp_path / config_file).read_text().startswith('{\n  "ai_provider"')
+        assert [p.name for p in tmp_path.iterdir()] == [".my-project-config.json"]
+
+    def test_save_config_without_orjson(self, tmp_path, monkeypatch):
+        """The stdlib json fallback writes the same config."""
+        import json
+
+        monkeypatch.chdir(tmp_path)
+        config = parse_user_selections({})
+        with patch.dict(sys.modules, {"orjson": None}):
+            config_file = save_config(config, "plain")
+        assert json.loads((tmp_path / config_file).read_text()) == config
+
+
+class TestDisplayConfigSummary:
+    """Test the human-readable configuration summary."""
+
+    def test_summary_lines(self):
+        """Summary reflects modes, phase marks, checks and outputs."""
+        config = parse_user_selections({
+            "question_1": "Balanced - Smart selection (Recommended)",
+            "question_2": "Yes - Full parallelization (Recommended)",
+            "question_4": "Phase 1, Phase 2, Phase 4",
+            "question_7": "Generate PowerPoint presentation",
+        })
+
+        lines = display_config_summary(config).split("\n")
+
+        assert lines[0] == "=" * 70
+        assert lines[1] == "Planning Configuration Summary"
+        assert lines[-1] == "=" * 70
+        assert "AI Provider: AUTO" in lines
+        assert "Research Mode: BALANCED (Deep Research for Phase 1, Perplexity for others)" in lines
+        assert "Parallelization: ENABLED" in lines
+        assert "Interactive Mode: DISABLED" in lines
+        assert "  ✓ Phase 1: Market Research" in lines
+        assert "  ✗ Phase 3: Feasibility & Costs" in lines
+        assert "  ✗ None (standard quality only)" in lines
+        assert "  ✓ PowerPoint presentation" in lines
+        assert "  ✓ PDF report" not in lines
+
+    def test_unknown_research_mode_uppercased(self):
+        """Modes without a display label fall back to the upper-cased key."""
+        config = parse_user_selections({})
+        config["research_mode"] = "custom"
+        config["quality_checks"]["comprehensive_diagrams"] = True
+
+        summary = display_config_summary(config)
+        assert "Research Mode: CUSTOM" in summary
+        assert "  ✓ Comprehensive diagrams" in summary
+        assert "None (standard quality only)" not in summary
+
+
+class TestMain:
+    """Test the command-line entry point."""
+
+    def test_help_skips_question_generation(self, capsys):
+        """--help prints usage without checking keys or building questions."""
+        with patch.object(setup_config, "generate_setup_questions") as mock_generate:
+            assert setup_config.main(["--help"]) == 0
+            mock_generate.assert_not_called()
+        assert "usage: setup-planning-config.py" in capsys.readouterr().out
+
+    def test_version(self, capsys):
+        """--version prints the pyproject version."""
+        with patch.object(setup_config, "generate_setup_questions") as mock_generate:
+            assert setup_config.main(["-v"]) == 0
+            mock_generate.assert_not_called()
+        output = capsys.readouterr().out
+        assert output.strip() == f"setup-planning-config.py {setup_config.get_version()}"
+        assert setup_config.get_version() != "unknown"
+
+    def test_outputs_questions_json(self, capsys, tmp_path):
+        """Without flags, prints the question tree as JSON."""
+        import json
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test", "XDG_CACHE_HOME": str(tmp_path)}, clear=True):
+            assert setup_config.main([]) == 0
+        payload = json.loads(capsys.readouterr().out)
+        assert len(payload["questions"]) == 8
+
+    def test_outputs_questions_json_without_orjson(self, capsys, tmp_path):
+        """The stdlib json fallback produces the same document."""
+        import json
+
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test", "XDG_CACHE_HOME": str(tmp_path)}, clear=True):
+            expected = {"questions": generate_setup_questions()}
+            with patch.dict(sys.modules, {"orjson": None}):
+                assert setup_config.main(["--no-cache"]) == 0
+        assert json.loads(capsys.readouterr().out) == expected
+        assert not (tmp_path / "claude-project-planner").exists()
+
+    def test_questions_json_cached_per_key_set(self, capsys, tmp_path):
+        """Second run reuses the cached JSON; a different key set gets its own entry."""
+        import json
+
+        env = {"OPENROUTER_API_KEY": "test", "XDG_CACHE_HOME": str(tmp_path)}
+        with patch.dict(os.environ, env, clear=True):
+            assert setup_config.main([]) == 0
+            first = capsys.readouterr().out
+
+            with patch.object(setup_config, "generate_setup_questions") as mock_generate:
+                assert setup_config.main([]) == 0
+                mock_generate.assert_not_called()
+            assert capsys.readouterr().out == first
+
+        cache_dir = tmp_path / "claude-project-planner"
+        assert len(list(cache_dir.glob("questions-*.json"))) == 1
+
+        with patch.dict(os.environ, {**env, "GEMINI_API_KEY": "test"}, clear=True):
+            invalidate_api_key_cache()
+            assert setup_config.main([]) == 0
+            with_gemini = json.loads(capsys.readouterr().out)
+
+        gemini_option = with_gemini["questions"][0]["options"][0]
+        assert gemini_option["label"] == "Google Gemini Deep Research"
+        # Entries for the previous key set are replaced
+        assert len(list(cache_dir.glob("questions-*.json"))) == 1
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,123 @@
+"""
+Tests for the prefetch() stream helper in project_planner/utils.py.
+
+utils.py is loaded directly so these tests don't need the Claude Agent SDK
+that the project_planner package imports on startup.
+"""
+
+import asyncio
+import importlib.util
+import os
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "project_planner_utils",
+    os.path.join(os.path.dirname(__file__), "..", "project_planner", "utils.py")
+)
+utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(utils)
+
+prefetch = utils.prefetch
+
+
+async def numbers(count, delay=0.0, fail_at=None, log=None):
+    """Async source yielding 0..count-1, optionally failing part-way."""
+    for i in range(count):
+        if fail_at == i:
+            raise ValueError(f"failed at {i}")
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(i)
+        yield i
+
+
+class TestPrefetch:
+    """Test background read-ahead of async streams."""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_items_in_order(self):
+        """Every item comes through, in source order."""
+        items = [item async for item in prefetch(numbers(50), maxsize=4)]
+        assert items == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_overlaps_receive_with_consumer_work(self):
+        """Receiving and consuming run concurrently instead of back to back."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async for _ in prefetch(numbers(5, delay=0.05)):
+            await asyncio.sleep(0.05)
+        elapsed = loop.time() - start
+
+        # Serial would be 5 x (0.05 + 0.05) = 0.5s
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_source_error_is_reraised_after_earlier_items(self):
+        """A failing source raises at the point it failed."""
+        received = []
+        with pytest.raises(ValueError, match="failed at 3"):
+            async for item in prefetch(numbers(10, fail_at=3)):
+                received.append(item)
+        assert received == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_bounded_and_stops_on_early_exit(self):
+        """The producer never runs more than maxsize ahead and stops when the caller does."""
+        produced = []
+        stream = prefetch(numbers(100, log=produced), maxsize=3)
+        async for item in stream:
+            if item == 1:
+                break
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+
+        # Items 0-1 consumed, at most 3 buffered, plus one waiting on put()
+        assert len(produced) <= 6
+
+    @pytest.mark.asyncio
+    async def test_source_is_closed_after_early_exit(self):
+        """Breaking out early closes the source, even with the producer blocked on a full buffer."""
+        closed = []
+
+        async def source():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.append(asyncio.current_task())
+
+        stream = prefetch(source(), maxsize=1)
+        async for item in stream:
+            if item == 0:
+                await asyncio.sleep(0.01)  # let the producer fill the buffer and block
+                break
+        await stream.aclose()
+
+        assert len(closed) == 1
+        # Closed by the producer task that iterated it, not by the consumer or the GC
+        assert closed[0] is not asyncio.current_task()
+
+    @pytest.mark.asyncio
+    async def test_base_exception_from_source_reaches_caller(self):
+        """A BaseException in the source is re-raised instead of leaving the caller waiting."""
+        class Abort(BaseException):
+            pass
+
+        async def source():
+            yield 0
+            raise Abort()
+
+        received = []
+
+        async def consume():
+            async for item in prefetch(source()):
+                received.append(item)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(Abort):
+            await asyncio.wait_for(consume(), timeout=1)
+        assert received == [0]
+        # Raised straight away, not only once the timeout tore the stream down
+        assert loop.time() - start < 0.5
@@ -5,12 +5,16 @@ Tests the resume command, monitoring script, and enhanced research integration.
 """
 
 import asyncio
+import importlib.util
 import json
+import os
 import pytest
 import tempfile
 import subprocess
+import threading
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 # Import modules to test
 import sys
@@ -20,6 +24,17 @@ from research_checkpoint_manager import ResearchCheckpointManager
 from research_progress_tracker import ResearchProgressTracker
 from enhanced_research_integration import EnhancedResearchLookup, HAS_RESEARCH_LOOKUP
 
+# Skip the simulated-research delay in resume command subprocesses
+RESUME_ENV = {**os.environ, "RESUME_SIMULATE_SLEEP": "0"}
+
+# resume-research.py has a hyphen, so load it via importlib
+spec = importlib.util.spec_from_file_location(
+    "resume_research",
+    Path(__file__).parent.parent / "scripts" / "resume-research.py"
+)
+resume_research = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(resume_research)
+
 
 # ============================================================================
 # Pattern 7: Resume Command Tests
@@ -65,6 +80,41 @@ class TestResumeCommand:
             assert "RESUMABLE RESEARCH TASKS" in result.stdout
             assert "task-0" in result.stdout or "task-1" in result.stdout or "task-2" in result.stdout
 
+    @pytest.mark.asyncio
+    async def test_resume_command_list_json(self):
+        """Test --list --json prints the resumable tasks as a JSON array."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_folder = Path(tmpdir)
+            phase_num = 1
+            command = [
+                "python",
+                str(Path(__file__).parent.parent / "scripts" / "resume-research.py"),
+                str(project_folder),
+                str(phase_num),
+                "--list", "--json"
+            ]
+
+            result = subprocess.run(command, capture_output=True, text=True)
+            assert result.returncode == 0
+            assert json.loads(result.stdout) == []
+
+            manager = ResearchCheckpointManager(project_folder, phase_num)
+            for i in range(2):
+                await manager.save_research_checkpoint(
+                    task_name=f"task-{i}",
+                    query=f"Query {i}",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=30.0,
+                    resumable=True
+                )
+
+            result = subprocess.run(command, capture_output=True, text=True)
+            assert result.returncode == 0
+            tasks = json.loads(result.stdout)
+            assert sorted(task["task_name"] for task in tasks) == ["task-0", "task-1"]
+            assert all("time_saved_min" in task for task in tasks)
+
     def test_resume_command_no_checkpoints(self):
         """Test resume command with no checkpoints."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -88,6 +138,9 @@ class TestResumeCommand:
             assert result.returncode == 0
             assert "NO RESUMABLE RESEARCH TASKS FOUND" in result.stdout
 
+            # Answered from a directory check, without creating checkpoint state
+            assert not (project_folder / ".state").exists()
+
     @pytest.mark.asyncio
     async def test_resume_command_specific_task(self):
         """Test resuming a specific task."""
@@ -116,6 +169,7 @@ class TestResumeCommand:
                     "--task", "test-task"
                 ],
                 capture_output=True,
+                env=RESUME_ENV,
                 text=True
             )
 
@@ -124,6 +178,43 @@ class TestResumeCommand:
             assert "RESUMING RESEARCH TASK" in result.stdout
             assert "test-task" in result.stdout
             assert "30" in result.stdout  # Progress percentage
+            assert "Confirmed continuation" in result.stdout
+
+    @pytest.mark.asyncio
+    async def test_resume_command_multiple_tasks(self):
+        """Test resuming several tasks in one invocation reports the worst exit code."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_folder = Path(tmpdir)
+            phase_num = 1
+
+            manager = ResearchCheckpointManager(project_folder, phase_num)
+            for task_name in ("task-a", "task-b"):
+                await manager.save_research_checkpoint(
+                    task_name=task_name,
+                    query=f"Query for {task_name}",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=30.0,
+                    resumable=True
+                )
+
+            command = [
+                "python",
+                str(Path(__file__).parent.parent / "scripts" / "resume-research.py"),
+                str(project_folder),
+                str(phase_num),
+                "--task", "task-a", "task-b"
+            ]
+            result = subprocess.run(command, capture_output=True, env=RESUME_ENV, text=True)
+
+            assert result.returncode == 0
+            assert "RESUMING RESEARCH TASK: task-a" in result.stdout
+            assert "RESUMING RESEARCH TASK: task-b" in result.stdout
+
+            # One missing task fails the whole invocation
+            result = subprocess.run(command + ["missing"], capture_output=True, env=RESUME_ENV, text=True)
+            assert result.returncode == 1
+            assert "No checkpoint found for task 'missing'" in result.stdout
 
     def test_resume_command_nonexistent_task(self):
         """Test resuming a nonexistent task."""
@@ -147,6 +238,289 @@ class TestResumeCommand:
             # Verify error
             assert result.returncode == 1
             assert "No checkpoint found" in result.stdout
+            assert not (project_folder / ".state").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_command_stale_checkpoint_non_interactive(self):
+        """Test a stale checkpoint fails fast without a TTY unless --force is given."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_folder = Path(tmpdir)
+            phase_num = 1
+
+            manager = ResearchCheckpointManager(project_folder, phase_num)
+            await manager.save_research_checkpoint(
+                task_name="old-task",
+                query="Test query",
+                partial_results={},
+                sources_collected=[],
+                progress_pct=30.0,
+                resumable=True
+            )
+
+            # Age the checkpoint past the 7-day warning threshold
+            checkpoint_file = manager.get_checkpoint_file("old-task")
+            data = json.loads(checkpoint_file.read_text())
+            data["created_at"] = (datetime.now() - timedelta(days=10)).isoformat()
+            checkpoint_file.write_text(json.dumps(data))
+
+            result = subprocess.run(
+                [
+                    "python",
+                    str(Path(__file__).parent.parent / "scripts" / "resume-research.py"),
+                    str(project_folder),
+                    str(phase_num),
+                    "--task", "old-task"
+                ],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True
+            )
+
+            assert result.returncode == 1
+            assert "--force" in result.stdout
+            assert "RESUMING RESEARCH TASK" not in result.stdout
+
+    @pytest.mark.asyncio
+    async def test_resume_command_force_skips_stale_prompt(self):
+        """Test --force resumes a stale checkpoint without asking for confirmation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_folder = Path(tmpdir)
+            phase_num = 1
+
+            manager = ResearchCheckpointManager(project_folder, phase_num)
+            await manager.save_research_checkpoint(
+                task_name="old-task",
+                query="Test query",
+                partial_results={},
+                sources_collected=[],
+                progress_pct=30.0,
+                resumable=True
+            )
+
+            checkpoint_file = manager.get_checkpoint_file("old-task")
+            data = json.loads(checkpoint_file.read_text())
+            data["created_at"] = (datetime.now() - timedelta(days=10)).isoformat()
+            checkpoint_file.write_text(json.dumps(data))
+
+            result = subprocess.run(
+                [
+                    "python",
+                    str(Path(__file__).parent.parent / "scripts" / "resume-research.py"),
+                    str(project_folder),
+                    str(phase_num),
+                    "--task", "old-task",
+                    "--force"
+                ],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                env=RESUME_ENV,
+                text=True
+            )
+
+            assert result.returncode == 0
+            assert "Continue resuming" not in result.stdout
+            assert "RESUMING RESEARCH TASK" in result.stdout
+
+    @pytest.mark.asyncio
+    async def test_resume_prompt_cached_until_checkpoint_changes(self):
+        """Test resume prompt is reused from disk until the checkpoint is rewritten."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ResearchCheckpointManager(Path(tmpdir), 1)
+
+            async def save(progress_pct):
+                await manager.save_research_checkpoint(
+                    task_name="cached-task",
+                    query="Test query",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=progress_pct
+                )
+                return manager.load_research_checkpoint("cached-task")
+
+            checkpoint = await save(30.0)
+            first = resume_research.load_or_build_resume_prompt(manager, "cached-task", checkpoint)
+
+            cache_dir = manager.state_dir / "resume_prompt_cache"
+            cached_files = list(cache_dir.iterdir())
+            assert len(cached_files) == 1
+            assert cached_files[0].read_text(encoding="utf-8") == first
+
+            # Unchanged checkpoint: served from cache
+            cached_files[0].write_text("from cache", encoding="utf-8")
+            assert resume_research.load_or_build_resume_prompt(manager, "cached-task", checkpoint) == "from cache"
+            assert resume_research.load_or_build_resume_prompt(
+                manager, "cached-task", checkpoint, use_cache=False
+            ) == first
+
+            # Rewritten checkpoint: rebuilt and stale entry replaced
+            await asyncio.sleep(0.01)
+            checkpoint = await save(50.0)
+            rebuilt = resume_research.load_or_build_resume_prompt(manager, "cached-task", checkpoint)
+            assert rebuilt != "from cache"
+            assert len(list(cache_dir.iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_prompt_cache_refresh_keeps_other_tasks(self, tmp_path):
+        """Test rebuilding one task's prompt never deletes a task whose name extends it."""
+        manager = ResearchCheckpointManager(tmp_path, 1)
+
+        async def save(task_name, progress_pct):
+            await manager.save_research_checkpoint(
+                task_name=task_name,
+                query="Test query",
+                partial_results={},
+                sources_collected=[],
+                progress_pct=progress_pct
+            )
+            return manager.load_research_checkpoint(task_name)
+
+        resume_research.load_or_build_resume_prompt(manager, "foo.bar", await save("foo.bar", 30.0))
+        resume_research.load_or_build_resume_prompt(manager, "foo", await save("foo", 30.0))
+        await asyncio.sleep(0.01)
+        resume_research.load_or_build_resume_prompt(manager, "foo", await save("foo", 50.0))
+
+        cache_dir = manager.state_dir / "resume_prompt_cache"
+        names = sorted(path.name for path in cache_dir.iterdir())
+        assert len(names) == 2
+        assert sum(name.startswith("phase1_foo.bar.") for name in names) == 1
+
+    def test_abandoned_prompt_does_not_block_exit(self):
+        """Test the interpreter exits while a timed-out confirmation read is still blocked."""
+        script = "\n".join([
+            "import asyncio, importlib.util, sys, threading",
+            f"spec = importlib.util.spec_from_file_location('resume_research', {str(spec.origin)!r})",
+            "module = importlib.util.module_from_spec(spec)",
+            "spec.loader.exec_module(module)",
+            "sys.stdin.isatty = lambda: True",
+            "module._read_confirmation_key = lambda message, timeout: threading.Event().wait()",
+            "print(asyncio.run(module.prompt_with_timeout('Continue? ', timeout_sec=0.1)))",
+        ])
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip().endswith("False")
+
+    def test_resume_renders_prompt_once_and_removes_its_cache(self, tmp_path):
+        """Test a successful resume builds the prompt once and leaves no cached render behind."""
+        manager = ResearchCheckpointManager(tmp_path, 1)
+        asyncio.run(manager.save_research_checkpoint(
+            task_name="cached-task",
+            query="Test query",
+            partial_results={"findings": ["partial"]},
+            sources_collected=[],
+            progress_pct=30.0
+        ))
+
+        class Lookup:
+            def __init__(self, research_mode):
+                pass
+
+            def lookup(self, query):
+                return {"success": True, "content": "done", "sources": []}
+
+        build = ResearchCheckpointManager.build_resume_prompt
+        with patch.object(resume_research, "_load_research_lookup", return_value=Lookup), \
+             patch.object(
+                 ResearchCheckpointManager, "build_resume_prompt", autospec=True, side_effect=build
+             ) as mock_build:
+            exit_codes = resume_research.run_resume_tasks(tmp_path, 1, ["cached-task"])
+
+        assert exit_codes == (0,)
+        assert mock_build.call_count == 1
+        assert manager.load_research_checkpoint("cached-task") is None
+        assert list(manager.resume_prompt_cache_dir.iterdir()) == []
+
+    def test_stale_tasks_are_confirmed_one_at_a_time(self, tmp_path):
+        """Test each stale task gets its own labeled prompt, in order, before any task resumes."""
+        manager = ResearchCheckpointManager(tmp_path, 1)
+        task_names = ["task-a", "task-b", "task-c"]
+
+        async def save_all():
+            for task_name in task_names:
+                await manager.save_research_checkpoint(
+                    task_name=task_name,
+                    query=f"Query for {task_name}",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=30.0
+                )
+
+        asyncio.run(save_all())
+        for task_name in ["task-a", "task-b"]:
+            checkpoint_file = manager.get_checkpoint_file(task_name)
+            data = json.loads(checkpoint_file.read_text())
+            data["created_at"] = (datetime.now() - timedelta(days=10)).isoformat()
+            checkpoint_file.write_text(json.dumps(data))
+
+        prompts = []
+        in_flight = [0]
+
+        async def answer(message, timeout_sec=30):
+            in_flight[0] += 1
+            assert in_flight[0] == 1, "prompts overlapped"
+            prompts.append(message)
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return "task-a" in message  # Confirm a, decline b
+
+        resumed = []
+
+        async def record_resume(project_folder, phase_num, task_name, **kwargs):
+            assert len(prompts) == 2, "a task resumed before every prompt was answered"
+            resumed.append((task_name, kwargs["confirmed"]))
+            return 0
+
+        with patch.object(resume_research.sys.stdin, "isatty", return_value=True), \
+             patch.object(resume_research, "prompt_with_timeout", side_effect=answer), \
+             patch.object(resume_research, "resume_research_task", side_effect=record_resume):
+            exit_codes = resume_research.run_resume_tasks(tmp_path, 1, task_names)
+
+        assert ["task-a" in p for p in prompts] == [True, False]
+        assert "task-b" in prompts[1]
+        assert exit_codes == (0, 1, 0)
+        assert resumed == [("task-a", True), ("task-c", False)]
+
+    def test_blocking_lookups_run_concurrently(self, tmp_path):
+        """Test resuming several tasks overlaps their blocking research lookups."""
+        manager = ResearchCheckpointManager(tmp_path, 1)
+        task_names = ["task-a", "task-b", "task-c"]
+
+        async def save_all():
+            await asyncio.gather(*(
+                manager.save_research_checkpoint(
+                    task_name=task_name,
+                    query=f"Query for {task_name}",
+                    partial_results={},
+                    sources_collected=[],
+                    progress_pct=30.0
+                )
+                for task_name in task_names
+            ))
+
+        asyncio.run(save_all())
+
+        # Only passes once all three lookups are in flight together; run one
+        # after another, the first one blocks until the barrier times out
+        barrier = threading.Barrier(len(task_names), timeout=5)
+
+        class BlockingLookup:
+            def __init__(self, research_mode):
+                pass
+
+            def lookup(self, query):
+                barrier.wait()
+                return {"success": True, "content": "done", "sources": []}
+
+        with patch.object(resume_research, "_load_research_lookup", return_value=BlockingLookup):
+            exit_codes = resume_research.run_resume_tasks(tmp_path, 1, task_names)
+
+        assert not barrier.broken
+        assert exit_codes == (0, 0, 0)
 
 
 # ============================================================================
@@ -322,6 +696,49 @@ class TestEnhancedResearchIntegration:
             assert "tasks_completed" in stats
             assert "tasks_failed" in stats
 
+    @pytest.mark.asyncio
+    async def test_enhanced_research_reuses_cached_result(self):
+        """Test that a repeated query is served from the result cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            research = EnhancedResearchLookup(
+                project_folder=Path(tmpdir),
+                phase_num=1,
+                research_mode="perplexity"
+            )
+            lookup = AsyncMock(return_value={"success": True, "response": "findings"})
+
+            with patch.object(research.research_lookup, "lookup_async", lookup), \
+                 patch.object(research.research_lookup, "_should_use_deep_research", return_value=False):
+                first = await research.research_with_progress("market", "Market size?")
+                second = await research.research_with_progress("market", "Market size?")
+                await research.research_with_progress("other", "Competitors?")
+
+            assert lookup.await_count == 2
+            assert first["response"] == second["response"] == "findings"
+            assert "cache_hit" not in first
+            assert second["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_is_keyed_by_routing_context(self, tmp_path):
+        """Test that a shared cache doesn't answer one phase/task type with another's result."""
+        shared_cache = {}
+
+        def make_research(context):
+            return EnhancedResearchLookup(
+                project_folder=tmp_path,
+                phase_num=1,
+                research_mode="balanced",
+                context=context,
+                cache=shared_cache
+            )
+
+        phase2 = make_research({"phase": 2, "task_type": "architecture-research"})
+        phase1 = make_research({"phase": 1, "task_type": "competitive-analysis"})
+        phase1_again = make_research({"phase": 1, "task_type": "competitive-analysis"})
+
+        assert phase1._cache_key("Competitors?") != phase2._cache_key("Competitors?")
+        assert phase1._cache_key("Competitors?") == phase1_again._cache_key("Competitors?")
+
 
 # ============================================================================
 # End-to-End Workflow Tests